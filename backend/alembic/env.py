@@ -6,8 +6,10 @@ from sqlalchemy import pool
 from alembic import context
 from stocker.core.config import settings
 from stocker.core.database import Base
+from stocker.models import load_all
+
 # Import all models to ensure they are registered with Base metadata
-from stocker.models import *  # noqa
+load_all()
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,32 @@
+"""add_universe_member_listing_index
+
+Revision ID: l2b3c4d5e6f7
+Revises: k1a2b3c4d5e6
+Create Date: 2026-10-16 00:00:00.000000
+
+Add covering index for paginated universe member listings.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "l2b3c4d5e6f7"
+down_revision = "k1a2b3c4d5e6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_universe_member_universe_deleted_symbol",
+        "instrument_universe_member",
+        ["universe_id", "is_deleted", "symbol"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_universe_member_universe_deleted_symbol",
+        table_name="instrument_universe_member",
+    )
@@ -0,0 +1,63 @@
+"""add_covering_price_metric_indexes
+
+Revision ID: m3c4d5e6f7g8
+Revises: l2b3c4d5e6f7
+Create Date: 2026-10-16 00:00:00.000000
+
+Add covering (INCLUDE) indexes for price history, derived metric values and
+daily performance reads, replacing the plain indexes they supersede.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "m3c4d5e6f7g8"
+down_revision = "l2b3c4d5e6f7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_prices_daily_symbol_date_inc",
+        "prices_daily",
+        ["symbol", "date"],
+        postgresql_include=["close", "adj_close", "volume"],
+    )
+    op.drop_index("ix_prices_daily_symbol", table_name="prices_daily")
+
+    op.create_index(
+        "ix_derived_metric_values_symbol_date_inc",
+        "derived_metric_values",
+        ["symbol", "as_of_date"],
+        postgresql_include=["value", "zscore", "percentile"],
+    )
+    op.drop_index("ix_derived_metric_values_symbol_date", table_name="derived_metric_values")
+
+    op.create_index(
+        "ix_perf_metrics_daily_portfolio_date_inc",
+        "performance_metrics_daily",
+        ["portfolio_id", "date"],
+        postgresql_include=["daily_return", "daily_pnl"],
+    )
+    op.drop_index("ix_perf_metrics_daily_portfolio_date", table_name="performance_metrics_daily")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_perf_metrics_daily_portfolio_date",
+        "performance_metrics_daily",
+        ["portfolio_id", "date"],
+    )
+    op.drop_index("ix_perf_metrics_daily_portfolio_date_inc", table_name="performance_metrics_daily")
+
+    op.create_index(
+        "ix_derived_metric_values_symbol_date",
+        "derived_metric_values",
+        ["symbol", "as_of_date"],
+    )
+    op.drop_index("ix_derived_metric_values_symbol_date_inc", table_name="derived_metric_values")
+
+    op.create_index("ix_prices_daily_symbol", "prices_daily", ["symbol"])
+    op.drop_index("ix_prices_daily_symbol_date_inc", table_name="prices_daily")
@@ -0,0 +1,136 @@
+"""partition_price_tables
+
+Revision ID: n4d5e6f7g8h9
+Revises: m3c4d5e6f7g8
+Create Date: 2026-10-16 00:00:00.000000
+
+Rebuild prices_daily (yearly) and prices_intraday (monthly) as RANGE
+partitioned tables. The partition key joins id in the primary key, rows
+and the id sequence are carried over, and anything outside the created
+ranges lands in a DEFAULT partition. Upcoming partitions are created by
+stocker.tasks.partitions.ensure_price_partitions.
+
+Partitions start at the oldest existing row (or DAILY_FIRST_YEAR / this
+January when a table is empty), so historical data never lands in
+DEFAULT, where it would block later CREATE ... PARTITION OF for its
+range.
+
+The row copy is one INSERT ... SELECT per table inside the migration
+transaction, holding ACCESS EXCLUSIVE on both price tables until commit;
+run it in a maintenance window, sized for a full rewrite of the price
+history.
+"""
+
+from datetime import date
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "n4d5e6f7g8h9"
+down_revision = "m3c4d5e6f7g8"
+branch_labels = None
+depends_on = None
+
+DAILY_FIRST_YEAR = 2020
+
+
+def _next_month(day: date) -> date:
+    if day.month == 12:
+        return date(day.year + 1, 1, 1)
+    return date(day.year, day.month + 1, 1)
+
+
+def _rebuild_start(table: str, partition_by: str | None) -> str:
+    """Rename table aside and create its replacement (no keys yet). Returns the old name."""
+    old = f"{table}_old"
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+    ddl = f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS)"
+    if partition_by:
+        ddl += f" PARTITION BY RANGE ({partition_by})"
+    op.execute(ddl)
+    return old
+
+
+def _scalar(sql: str):
+    return op.get_bind().execute(sa.text(sql)).scalar()
+
+
+def _rebuild_finish(table: str, old: str) -> None:
+    """Move rows over, drop the old table and hand the id sequence to the new one."""
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    op.execute(f"DROP TABLE {old}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+
+
+def _daily_keys(pk: list[str]) -> None:
+    op.create_primary_key("prices_daily_pkey", "prices_daily", pk)
+    op.create_unique_constraint("uq_prices_daily_symbol_date", "prices_daily", ["symbol", "date"])
+    op.create_index("ix_prices_daily_date", "prices_daily", ["date"])
+    op.create_index(
+        "ix_prices_daily_symbol_date_inc",
+        "prices_daily",
+        ["symbol", "date"],
+        postgresql_include=["close", "adj_close", "volume"],
+    )
+
+
+def _intraday_keys(pk: list[str]) -> None:
+    op.create_primary_key("prices_intraday_pkey", "prices_intraday", pk)
+    op.create_unique_constraint(
+        "uq_prices_intraday_symbol_ts_interval",
+        "prices_intraday",
+        ["symbol", "timestamp", "interval"],
+    )
+    op.create_index("ix_prices_intraday_symbol", "prices_intraday", ["symbol"])
+    op.create_index("ix_prices_intraday_timestamp", "prices_intraday", ["timestamp"])
+
+
+def upgrade() -> None:
+    today = date.today()
+
+    # prices_daily: one partition per year, oldest row's year through next year
+    old = _rebuild_start("prices_daily", "date")
+    oldest = _scalar(f"SELECT MIN(date) FROM {old}")
+    first_year = min(DAILY_FIRST_YEAR, oldest.year) if oldest else DAILY_FIRST_YEAR
+    for year in range(first_year, today.year + 2):
+        op.execute(
+            f"CREATE TABLE prices_daily_{year} PARTITION OF prices_daily "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+    op.execute("CREATE TABLE prices_daily_default PARTITION OF prices_daily DEFAULT")
+    _rebuild_finish("prices_daily", old)
+    _daily_keys(["id", "date"])
+
+    # prices_intraday: one partition per month, from the oldest row's month (UTC)
+    # or January this year through next month. Bounds are pinned to UTC so they
+    # do not depend on the session TimeZone.
+    old = _rebuild_start("prices_intraday", "timestamp")
+    lower = date(today.year, 1, 1)
+    oldest = _scalar(f"SELECT MIN(timestamp AT TIME ZONE 'UTC') FROM {old}")
+    if oldest is not None:
+        lower = min(lower, date(oldest.year, oldest.month, 1))
+    last = _next_month(today)
+    while lower <= last:
+        upper = _next_month(lower)
+        op.execute(
+            f"CREATE TABLE prices_intraday_{lower:%Y_%m} PARTITION OF prices_intraday "
+            f"FOR VALUES FROM ('{lower} 00:00:00+00') TO ('{upper} 00:00:00+00')"
+        )
+        lower = upper
+    op.execute("CREATE TABLE prices_intraday_default PARTITION OF prices_intraday DEFAULT")
+    _rebuild_finish("prices_intraday", old)
+    _intraday_keys(["id", "timestamp"])
+
+
+def downgrade() -> None:
+    # Dropping a partitioned parent drops its partitions with it
+    old = _rebuild_start("prices_intraday", None)
+    _rebuild_finish("prices_intraday", old)
+    _intraday_keys(["id"])
+
+    old = _rebuild_start("prices_daily", None)
+    _rebuild_finish("prices_daily", old)
+    _daily_keys(["id"])
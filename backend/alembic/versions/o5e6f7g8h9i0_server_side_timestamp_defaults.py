@@ -0,0 +1,59 @@
+"""server_side_timestamp_defaults
+
+Revision ID: o5e6f7g8h9i0
+Revises: n4d5e6f7g8h9
+Create Date: 2026-10-16 00:00:00.000000
+
+Give created_at/updated_at on every TimestampMixin table a server default
+of naive UTC now(), replacing the per-row client-side datetime.utcnow().
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "o5e6f7g8h9i0"
+down_revision = "n4d5e6f7g8h9"
+branch_labels = None
+depends_on = None
+
+TIMESTAMPED_TABLES = (
+    "corporate_actions",
+    "derived_metric_definitions",
+    "derived_metric_rule_sets",
+    "derived_metric_rules",
+    "derived_metric_scores",
+    "derived_metric_values",
+    "execution_metrics_daily",
+    "instrument_info",
+    "instrument_metrics",
+    "instrument_universe",
+    "instrument_universe_member",
+    "market_sentiment",
+    "orders",
+    "performance_metrics_daily",
+    "position_snapshots",
+    "position_states",
+    "prices_daily",
+    "prices_intraday",
+    "signal_performance",
+    "signals",
+    "strategy_config",
+    "strategy_universe",
+    "target_exposures",
+    "trading_universe",
+)
+
+
+def upgrade() -> None:
+    utc_now = sa.text("timezone('utc', now())")
+    for table in TIMESTAMPED_TABLES:
+        op.alter_column(table, "created_at", server_default=utc_now)
+        op.alter_column(table, "updated_at", server_default=utc_now)
+
+
+def downgrade() -> None:
+    for table in TIMESTAMPED_TABLES:
+        op.alter_column(table, "created_at", server_default=None)
+        op.alter_column(table, "updated_at", server_default=None)
@@ -0,0 +1,49 @@
+"""float_sentiment_and_rolling_stats
+
+Revision ID: p6f7g8h9i0j1
+Revises: o5e6f7g8h9i0
+Create Date: 2026-10-16 00:00:00.000000
+
+Store sentiment scores/magnitudes and rolling performance statistics as
+DOUBLE PRECISION instead of NUMERIC; they are estimates, not money.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "p6f7g8h9i0j1"
+down_revision = "o5e6f7g8h9i0"
+branch_labels = None
+depends_on = None
+
+FLOAT_COLUMNS = (
+    ("market_sentiment", "sentiment_score", sa.Numeric(5, 4)),
+    ("market_sentiment", "sentiment_magnitude", sa.Numeric(10, 4)),
+    ("performance_metrics_daily", "rolling_sharpe_30d", sa.Numeric(10, 6)),
+    ("performance_metrics_daily", "rolling_vol_30d", sa.Numeric(10, 6)),
+    ("performance_metrics_daily", "rolling_max_dd_30d", sa.Numeric(10, 6)),
+)
+
+
+def upgrade() -> None:
+    for table, column, numeric_type in FLOAT_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Float(),
+            existing_type=numeric_type,
+            postgresql_using=f"{column}::double precision",
+        )
+
+
+def downgrade() -> None:
+    for table, column, numeric_type in FLOAT_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=numeric_type,
+            existing_type=sa.Float(),
+            postgresql_using=f"{column}::numeric({numeric_type.precision},{numeric_type.scale})",
+        )
@@ -0,0 +1,52 @@
+"""signal_performance_partial_indexes
+
+Revision ID: q7g8h9i0j1k2
+Revises: p6f7g8h9i0j1
+Create Date: 2026-10-16 00:00:00.000000
+
+Replace the four single-column signal_performance indexes with a partial
+composite index for the closed-record analytics query; open-record lookups
+are served by ix_signal_perf_open. Built and dropped CONCURRENTLY so
+writers are not blocked.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "q7g8h9i0j1k2"
+down_revision = "p6f7g8h9i0j1"
+branch_labels = None
+depends_on = None
+
+SINGLE_COLUMN_INDEXES = (
+    ("ix_signal_perf_portfolio", "portfolio_id"),
+    ("ix_signal_perf_symbol", "symbol"),
+    ("ix_signal_perf_signal_date", "signal_date"),
+    ("ix_signal_perf_exit_date", "exit_date"),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_signal_perf_closed_port_sigdate",
+            "signal_performance",
+            ["portfolio_id", "signal_date"],
+            postgresql_where=sa.text("exit_date IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        for name, _column in SINGLE_COLUMN_INDEXES:
+            op.drop_index(name, table_name="signal_performance", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in SINGLE_COLUMN_INDEXES:
+            op.create_index(name, "signal_performance", [column], postgresql_concurrently=True)
+        op.drop_index(
+            "ix_signal_perf_closed_port_sigdate",
+            table_name="signal_performance",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,37 @@
+"""position_states_active_index
+
+Revision ID: r8h9i0j1k2l3
+Revises: q7g8h9i0j1k2
+Create Date: 2026-10-16 00:00:00.000000
+
+Drop the single-column position_states indexes (portfolio_id is the
+leading column of uq_position_states_port_sym; symbol is never queried
+alone) and add a partial index for the open-position sweep.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "r8h9i0j1k2l3"
+down_revision = "q7g8h9i0j1k2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_position_states_port_active",
+        "position_states",
+        ["portfolio_id"],
+        postgresql_where=sa.text("direction != 0"),
+    )
+    op.drop_index("ix_position_states_symbol", table_name="position_states")
+    op.drop_index("ix_position_states_portfolio_id", table_name="position_states")
+
+
+def downgrade() -> None:
+    op.create_index("ix_position_states_portfolio_id", "position_states", ["portfolio_id"])
+    op.create_index("ix_position_states_symbol", "position_states", ["symbol"])
+    op.drop_index("ix_position_states_port_active", table_name="position_states")
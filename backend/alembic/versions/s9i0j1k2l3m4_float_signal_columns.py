@@ -0,0 +1,51 @@
+"""float_signal_columns
+
+Revision ID: s9i0j1k2l3m4
+Revises: r8h9i0j1k2l3
+Create Date: 2026-10-16 00:00:00.000000
+
+Store the statistical signal/exposure/position columns as double precision.
+They are computed and consumed as floats; NUMERIC only added conversion cost.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "s9i0j1k2l3m4"
+down_revision = "r8h9i0j1k2l3"
+branch_labels = None
+depends_on = None
+
+# (table, column, previous NUMERIC precision/scale)
+FLOAT_COLUMNS = [
+    ("signals", "lookback_return", (10, 6)),
+    ("signals", "ewma_vol", (10, 6)),
+    ("signals", "target_weight", (10, 6)),
+    ("target_exposures", "scaling_factor", (5, 4)),
+    ("position_states", "entry_atr", (10, 4)),
+    ("signal_performance", "realized_return", (12, 8)),
+]
+
+
+def upgrade() -> None:
+    for table, column, (precision, scale) in FLOAT_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Float(),
+            existing_type=sa.Numeric(precision, scale),
+            postgresql_using=f"{column}::double precision",
+        )
+
+
+def downgrade() -> None:
+    for table, column, (precision, scale) in FLOAT_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Numeric(precision, scale),
+            existing_type=sa.Float(),
+            postgresql_using=f"{column}::numeric({precision}, {scale})",
+        )
@@ -0,0 +1,28 @@
+"""drop_trading_universe_date_index
+
+Revision ID: t0j1k2l3m4n5
+Revises: s9i0j1k2l3m4
+Create Date: 2026-10-16 00:00:00.000000
+
+as_of_date is the leading column of uq_trading_universe_date_symbol_source,
+which already serves the per-date universe lookup.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "t0j1k2l3m4n5"
+down_revision = "s9i0j1k2l3m4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_trading_universe_as_of_date", table_name="trading_universe")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_trading_universe_as_of_date", "trading_universe", ["as_of_date"]
+    )
@@ -0,0 +1,41 @@
+"""server_column_defaults
+
+Revision ID: u1k2l3m4n5o6
+Revises: t0j1k2l3m4n5
+Create Date: 2026-10-16 00:00:00.000000
+
+Move the remaining constant column defaults on bulk-written tables into
+the database, so inserts (and COPY) can omit those columns.
+derived_metric_values.calc_version and derived_metric_scores.passes_required
+already have server defaults.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "u1k2l3m4n5o6"
+down_revision = "t0j1k2l3m4n5"
+branch_labels = None
+depends_on = None
+
+SERVER_DEFAULTS = [
+    ("position_states", "direction", "0"),
+    ("position_states", "consecutive_flip_days", "0"),
+    ("target_exposures", "scaling_factor", "1.0"),
+    ("target_exposures", "is_capped", "false"),
+    ("market_sentiment", "period", "'WEEKLY'"),
+    ("market_sentiment", "window_days", "7"),
+    ("prices_daily", "source", "'yfinance'"),
+]
+
+
+def upgrade() -> None:
+    for table, column, default in SERVER_DEFAULTS:
+        op.alter_column(table, column, server_default=sa.text(default))
+
+
+def downgrade() -> None:
+    for table, column, _ in SERVER_DEFAULTS:
+        op.alter_column(table, column, server_default=None)
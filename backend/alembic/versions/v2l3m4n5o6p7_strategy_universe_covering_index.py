@@ -0,0 +1,33 @@
+"""strategy_universe_covering_index
+
+Revision ID: v2l3m4n5o6p7
+Revises: u1k2l3m4n5o6
+Create Date: 2026-10-16 00:00:00.000000
+
+Replace the plain strategy_id index with one that INCLUDEs universe_id,
+so strategy -> universe lookups are index-only scans.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "v2l3m4n5o6p7"
+down_revision = "u1k2l3m4n5o6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_strategy_universe_strategy_cov",
+        "strategy_universe",
+        ["strategy_id"],
+        postgresql_include=["universe_id"],
+    )
+    op.drop_index("ix_strategy_universe_strategy_id", table_name="strategy_universe")
+
+
+def downgrade() -> None:
+    op.create_index("ix_strategy_universe_strategy_id", "strategy_universe", ["strategy_id"])
+    op.drop_index("ix_strategy_universe_strategy_cov", table_name="strategy_universe")
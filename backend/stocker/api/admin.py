@@ -9,15 +9,16 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Literal
 
+import orjson
 from fastapi import APIRouter, HTTPException
 from sqlalchemy import text, select
 from redis.exceptions import ResponseError
 from pydantic import BaseModel
 
-from stocker.services.config_service import config_service, TRADING_PARAMS
+from stocker.services.config_service import config_service, TRADING_PARAMS_BY_KEY
 from stocker.services.portfolio_sync_service import PortfolioSyncService
-from stocker.core.database import AsyncSessionLocal
-from stocker.core.redis import get_async_redis, StreamNames
+from stocker.core.database import AsyncSessionLocal, engine
+from stocker.core.redis import get_async_redis, StreamNames, UI_UPDATES_CHANNEL
 from stocker.core.config import settings
 from stocker.models.order import Order
 
@@ -124,16 +125,16 @@ async def get_config_metadata():
     """Get metadata for all configuration parameters (for UI rendering)."""
     return [
         ConfigMetadata(
-            key=key,
-            value_type=meta["value_type"],
-            category=meta["category"],
-            description=meta["description"],
-            tooltip=meta.get("tooltip"),
-            min=meta.get("min"),
-            max=meta.get("max"),
-            options=meta.get("options"),
+            key=param.key,
+            value_type=param.value_type,
+            category=param.category,
+            description=param.description,
+            tooltip=param.tooltip,
+            min=param.min,
+            max=param.max,
+            options=param.options,
         )
-        for key, meta in TRADING_PARAMS.items()
+        for param in TRADING_PARAMS_BY_KEY.values()
     ]
 
 
@@ -198,7 +199,15 @@ async def get_system_health() -> List[ServiceHealth]:
     try:
         async with AsyncSessionLocal() as session:
             await session.execute(text("SELECT 1"))
-        services.append(ServiceHealth(name="PostgreSQL", status="healthy", last_heartbeat="Just now"))
+        services.append(
+            ServiceHealth(
+                name="PostgreSQL",
+                status="healthy",
+                last_heartbeat="Just now",
+                # Pool size / idle / overflow / checked-out counts
+                message=engine.pool.status(),
+            )
+        )
     except Exception as exc:
         services.append(
             ServiceHealth(
@@ -513,13 +522,13 @@ async def _publish_kill_switch_update(
     if cancelled_orders is not None:
         payload["cancelled_orders"] = cancelled_orders
     await redis.publish(
-        "ui-updates",
-        json.dumps(
+        UI_UPDATES_CHANNEL,
+        orjson.dumps(
             {
                 "type": "kill_switch_update",
                 "payload": payload,
             }
-        ),
+        ).decode(),
     )
 
 
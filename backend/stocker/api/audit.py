@@ -11,7 +11,7 @@ from decimal import Decimal
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, and_, func
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 from pydantic import BaseModel
 
 from stocker.core.database import get_db
@@ -452,7 +452,7 @@ async def get_audit_orders(
     Get paginated list of order audit records with filters.
     """
     # Build base query
-    query = select(Order).options(joinedload(Order.fills)).where(
+    query = select(Order).options(selectinload(Order.fills)).where(
         Order.portfolio_id == portfolio_id
     )
 
@@ -482,7 +482,7 @@ async def get_audit_orders(
     query = query.offset(offset).limit(limit)
 
     result = await db.execute(query)
-    orders = result.unique().scalars().all()
+    orders = result.scalars().all()
 
     # Build audit records
     items = []
@@ -511,11 +511,11 @@ async def get_audit_order(
     db: AsyncSession = Depends(get_db)
 ):
     """Get full audit record for a specific order."""
-    query = select(Order).options(joinedload(Order.fills)).where(
+    query = select(Order).options(selectinload(Order.fills)).where(
         Order.order_id == order_id
     )
     result = await db.execute(query)
-    order = result.unique().scalar_one_or_none()
+    order = result.scalar_one_or_none()
 
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
@@ -531,7 +531,7 @@ async def get_audit_summary(
     db: AsyncSession = Depends(get_db)
 ):
     """Get summary statistics for order audit."""
-    query = select(Order).options(joinedload(Order.fills)).where(
+    query = select(Order).options(selectinload(Order.fills)).where(
         Order.portfolio_id == portfolio_id
     )
 
@@ -541,7 +541,7 @@ async def get_audit_summary(
         query = query.where(Order.date <= date_to)
 
     result = await db.execute(query)
-    orders = result.unique().scalars().all()
+    orders = result.scalars().all()
 
     total_orders = len(orders)
     filled_count = sum(1 for o in orders if o.status == "FILLED")
@@ -586,7 +586,7 @@ async def get_discrepancies(
     db: AsyncSession = Depends(get_db)
 ):
     """Get orders with detected discrepancies."""
-    query = select(Order).options(joinedload(Order.fills)).where(
+    query = select(Order).options(selectinload(Order.fills)).where(
         Order.portfolio_id == portfolio_id
     )
 
@@ -598,7 +598,7 @@ async def get_discrepancies(
     query = query.order_by(desc(Order.date), desc(Order.created_at))
 
     result = await db.execute(query)
-    orders = result.unique().scalars().all()
+    orders = result.scalars().all()
 
     # Build audit records and filter to those with discrepancies
     records_with_discrepancies = []
@@ -316,5 +316,5 @@ async def metrics_health() -> dict:
         "status": "healthy",
         "buffer_size": buffer_size,
         "redis_connected": redis_connected,
-        "enabled": metrics._enabled
+        "enabled": metrics.enabled
     }
@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
 from stocker.core.database import get_db
 from stocker.models.order import Order
@@ -56,7 +56,7 @@ async def get_orders(
     db: AsyncSession = Depends(get_db)
 ):
     """Get orders, optionally filtered by date and status."""
-    query = select(Order).options(joinedload(Order.fills)).where(
+    query = select(Order).options(selectinload(Order.fills)).where(
         Order.portfolio_id == portfolio_id
     )
 
@@ -68,7 +68,7 @@ async def get_orders(
     query = query.order_by(desc(Order.date)).limit(limit)
 
     result = await db.execute(query)
-    orders = result.unique().scalars().all()
+    orders = result.scalars().all()
     return orders
 
 
@@ -78,9 +78,9 @@ async def get_order(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific order by its ID."""
-    query = select(Order).options(joinedload(Order.fills)).where(
+    query = select(Order).options(selectinload(Order.fills)).where(
         Order.order_id == order_id
     )
     result = await db.execute(query)
-    order = result.unique().scalar_one_or_none()
+    order = result.scalar_one_or_none()
     return order
@@ -1,75 +1,89 @@
 import asyncio
-import json
 import logging
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
-from fastapi import APIRouter, Request
+import orjson
+from fastapi import APIRouter, Body, Request
 from sse_starlette.sse import EventSourceResponse
-from stocker.core.redis import get_async_redis
+from stocker.core.redis import UI_UPDATES_CHANNEL, get_async_redis
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Max pub/sub messages forwarded per wake-up before blocking again
+SSE_DRAIN_BATCH_SIZE = 32
+
+# Per-connection queues for /stream-test, fed by /stream-test/publish
+_test_stream_queues: set[asyncio.Queue[str]] = set()
+
 
 @router.get("/stream-test")
 async def stream_test(request: Request) -> EventSourceResponse:
-    """Simple SSE test endpoint without Redis."""
+    """
+    Simple SSE test endpoint without Redis.
+
+    Emits whatever is posted to /stream-test/publish; idle connections only
+    receive the built-in ping comments.
+    """
     async def simple_generator() -> AsyncGenerator[dict, None]:
-        yield {"event": "connected", "data": json.dumps({"message": "Test stream connected"})}
-        count = 0
-        while count < 100:
-            await asyncio.sleep(2)
-            count += 1
-            yield {"event": "ping", "data": json.dumps({"count": count})}
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        _test_stream_queues.add(queue)
+        try:
+            yield {"event": "connected", "data": orjson.dumps({"message": "Test stream connected"}).decode()}
+            while True:
+                yield {"event": "message", "data": await queue.get()}
+        finally:
+            _test_stream_queues.discard(queue)
 
     return EventSourceResponse(simple_generator(), ping=15)
 
 
+@router.post("/stream-test/publish")
+async def stream_test_publish(payload: dict[str, Any] = Body(...)) -> dict[str, int]:
+    """Push a message to every open /stream-test connection."""
+    data = orjson.dumps(payload).decode()
+    for queue in _test_stream_queues:
+        queue.put_nowait(data)
+    return {"delivered": len(_test_stream_queues)}
+
+
 @router.get("/stream")
 async def message_stream(request: Request) -> EventSourceResponse:
     """
     Server-Sent Events endpoint.
     Streams updates from Redis to connected clients.
+
+    Idle connections are kept alive by sse-starlette's ping, and client
+    disconnects cancel the generator, so it only wakes on published messages.
     """
     async def event_generator() -> AsyncGenerator[dict, None]:
         pubsub = None
         try:
             redis = await get_async_redis()
             pubsub = redis.pubsub()
-            await pubsub.subscribe("ui-updates")
+            await pubsub.subscribe(UI_UPDATES_CHANNEL)
 
             # Yield initial connection message
             yield {
                 "event": "connected",
-                "data": json.dumps({"message": "Connected to Stocker Stream"})
+                "data": orjson.dumps({"message": "Connected to Stocker Stream"}).decode()
             }
 
             while True:
-                # Check for client disconnect using try/except pattern
-                try:
-                    disconnected = await request.is_disconnected()
-                    if disconnected:
-                        break
-                except Exception:
-                    # If we can't check disconnect status, continue anyway
-                    pass
-
-                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
 
-                if message and message.get("data"):
-                    try:
-                        # With decode_responses=True, data is already a string
-                        data_str = message["data"]
-                        if isinstance(data_str, bytes):
-                            data_str = data_str.decode("utf-8")
-                        yield {
-                            "event": "update",
-                            "data": data_str
-                        }
-                    except Exception as e:
-                        logger.error(f"Error parsing message: {e}")
-
-                await asyncio.sleep(0.1)
+                # Drain whatever else is already buffered, capped so one burst
+                # is handed to the response in bounded slices
+                drained = 0
+                while message is not None:
+                    if message.get("data"):
+                        # Publishers send finished JSON strings and the pooled client
+                        # decodes responses, so the payload is forwarded untouched
+                        yield {"event": "update", "data": message["data"]}
+                    drained += 1
+                    if drained >= SSE_DRAIN_BATCH_SIZE:
+                        break
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0)
 
         except asyncio.CancelledError:
             logger.info("Stream connection cancelled")
@@ -78,12 +92,12 @@ async def message_stream(request: Request) -> EventSourceResponse:
             # Yield error event before exiting
             yield {
                 "event": "error",
-                "data": json.dumps({"error": str(e)})
+                "data": orjson.dumps({"error": str(e)}).decode()
             }
         finally:
             if pubsub:
                 try:
-                    await pubsub.unsubscribe("ui-updates")
+                    await pubsub.unsubscribe(UI_UPDATES_CHANNEL)
                 except Exception:
                     pass
 
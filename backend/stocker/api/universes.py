@@ -1,21 +1,39 @@
-from typing import Optional
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Callable, Optional, Sequence
 
+import orjson
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from stocker.core.config import settings
-from stocker.core.database import get_db
+from stocker.core.database import get_db, get_session_factory
+from stocker.core.redis import get_async_redis
 from stocker.models.instrument_universe import InstrumentUniverse
 from stocker.models.strategy_universe import StrategyUniverse
 from stocker.models.instrument_universe_member import InstrumentUniverseMember
 from stocker.models.instrument_metrics import InstrumentMetrics
 from stocker.models.daily_bar import DailyBar
+from stocker.services.instrument_metrics_service import (
+    METRICS_STATUS_CACHE_TTL_SEC,
+    metrics_status_cache_key,
+)
 from stocker.services.universe_service import UniverseService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Max symbols per IN (...) list when aggregating per-symbol status
+SYMBOL_QUERY_CHUNK_SIZE = 1000
+
+# Chunk queries one request may run at once, kept well below the pool size
+# (the request's own session holds a connection too)
+SYMBOL_QUERY_CONCURRENCY = max(1, settings.DB_POOL_SIZE // 4)
+
 
 # Schemas
 
@@ -52,6 +70,7 @@ class UniverseResponse(BaseModel):
 
 class UniverseDetail(UniverseResponse):
     members: list[str] = []
+    member_total: int = 0
 
 
 class StrategyUniverseResponse(BaseModel):
@@ -75,11 +94,18 @@ class MetricStatus(BaseModel):
 # Endpoints
 
 
-@router.get("/metrics", response_model=list[MetricStatus])
+# Streamed endpoints return the body themselves, so the item model is only
+# declared for the OpenAPI schema
+@router.get(
+    "/metrics",
+    response_model=None,
+    responses={200: {"model": list[MetricStatus]}},
+)
 async def get_metrics_status(
     universe_id: Optional[int] = Query(default=None),
     symbols: Optional[list[str]] = Query(default=None),
     db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
 ):
     service = UniverseService(session=db)
     target_symbols: list[str]
@@ -93,39 +119,123 @@ async def get_metrics_status(
     if not target_symbols:
         return []
 
-    # Get metrics as-of dates
-    metrics_stmt = (
-        select(InstrumentMetrics.symbol, func.max(InstrumentMetrics.as_of_date))
-        .where(InstrumentMetrics.symbol.in_(target_symbols))
-        .group_by(InstrumentMetrics.symbol)
+    # Metrics as-of dates and price coverage (first date, last date, count);
+    # both aggregates share one cap on concurrently checked-out connections
+    limit = asyncio.Semaphore(SYMBOL_QUERY_CONCURRENCY)
+    metrics_rows, price_rows = await asyncio.gather(
+        _get_latest_metrics_dates(session_factory, limit, target_symbols),
+        _get_price_coverage(session_factory, limit, target_symbols),
     )
-    metrics_result = await db.execute(metrics_stmt)
-    metrics_rows = {row[0]: row[1] for row in metrics_result.all()}
-
-    # Get price coverage (first date, last date, count)
-    price_stmt = (
-        select(
-            DailyBar.symbol,
-            func.min(DailyBar.date),
-            func.max(DailyBar.date),
-            func.count(DailyBar.id),
-        )
-        .where(DailyBar.symbol.in_(target_symbols))
-        .group_by(DailyBar.symbol)
+
+    async def status_items() -> AsyncIterator[dict[str, Any]]:
+        for symbol in target_symbols:
+            first_date, last_date, bar_count = price_rows.get(symbol, (None, None, 0))
+            yield {
+                "symbol": symbol,
+                "as_of_date": metrics_rows.get(symbol),
+                "price_first_date": str(first_date) if first_date else None,
+                "price_last_date": str(last_date) if last_date else None,
+                "bar_count": bar_count or 0,
+            }
+
+    return StreamingResponse(_json_array(status_items()), media_type="application/json")
+
+
+async def _get_latest_metrics_dates(
+    session_factory: async_sessionmaker[AsyncSession],
+    limit: asyncio.Semaphore,
+    target_symbols: list[str],
+) -> dict[str, str]:
+    """Latest metrics as-of date per symbol, served from Redis when fresh."""
+    cache_key = metrics_status_cache_key(target_symbols)
+    redis = None
+    try:
+        redis = await get_async_redis()
+        cached = await redis.get(cache_key)
+        if cached is not None:
+            return orjson.loads(cached)
+    except Exception as exc:
+        logger.warning("Metrics status cache unavailable: %s", exc)
+        redis = None
+
+    rows = await _execute_chunked(
+        session_factory,
+        limit,
+        target_symbols,
+        lambda chunk: (
+            select(InstrumentMetrics.symbol, func.max(InstrumentMetrics.as_of_date))
+            .where(InstrumentMetrics.symbol.in_(chunk))
+            .group_by(InstrumentMetrics.symbol)
+        ),
     )
-    price_result = await db.execute(price_stmt)
-    price_rows = {row[0]: (row[1], row[2], row[3]) for row in price_result.all()}
-
-    return [
-        MetricStatus(
-            symbol=symbol,
-            as_of_date=str(metrics_rows.get(symbol)) if metrics_rows.get(symbol) else None,
-            price_first_date=str(price_rows.get(symbol, (None,))[0]) if price_rows.get(symbol, (None,))[0] else None,
-            price_last_date=str(price_rows.get(symbol, (None, None))[1]) if price_rows.get(symbol, (None, None))[1] else None,
-            bar_count=price_rows.get(symbol, (None, None, 0))[2] or 0,
-        )
-        for symbol in target_symbols
+    metrics_rows = {row[0]: str(row[1]) for row in rows if row[1]}
+
+    if redis is not None:
+        try:
+            await redis.set(cache_key, orjson.dumps(metrics_rows), ex=METRICS_STATUS_CACHE_TTL_SEC)
+        except Exception as exc:
+            logger.warning("Failed to cache metrics status: %s", exc)
+
+    return metrics_rows
+
+
+async def _get_price_coverage(
+    session_factory: async_sessionmaker[AsyncSession],
+    limit: asyncio.Semaphore,
+    target_symbols: list[str],
+) -> dict[str, tuple]:
+    """First date, last date and bar count per symbol."""
+    rows = await _execute_chunked(
+        session_factory,
+        limit,
+        target_symbols,
+        lambda chunk: (
+            select(
+                DailyBar.symbol,
+                func.min(DailyBar.date),
+                func.max(DailyBar.date),
+                func.count(DailyBar.id),
+            )
+            .where(DailyBar.symbol.in_(chunk))
+            .group_by(DailyBar.symbol)
+        ),
+    )
+    return {row[0]: (row[1], row[2], row[3]) for row in rows}
+
+
+async def _json_array(items: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode items one at a time as a JSON array body."""
+    yield b"["
+    first = True
+    async for item in items:
+        yield orjson.dumps(item) if first else b"," + orjson.dumps(item)
+        first = False
+    yield b"]"
+
+
+async def _execute_chunked(
+    session_factory: async_sessionmaker[AsyncSession],
+    limit: asyncio.Semaphore,
+    symbols: list[str],
+    build_stmt: Callable[[list[str]], Select],
+) -> list[Sequence[Any]]:
+    """
+    Run a per-symbol aggregate over bounded IN (...) lists.
+
+    Each chunk gets its own session so the queries run concurrently, at most
+    as many at a time as limit allows.
+    """
+    async def run(chunk: list[str]) -> Sequence[Any]:
+        async with limit, session_factory() as session:
+            result = await session.execute(build_stmt(chunk))
+            return result.all()
+
+    chunks = [
+        symbols[i:i + SYMBOL_QUERY_CHUNK_SIZE]
+        for i in range(0, len(symbols), SYMBOL_QUERY_CHUNK_SIZE)
     ]
+    results = await asyncio.gather(*(run(chunk) for chunk in chunks))
+    return [row for rows in results for row in rows]
 
 
 @router.post("", response_model=UniverseResponse, status_code=status.HTTP_201_CREATED)
@@ -142,19 +252,42 @@ async def create_universe(
     return universe
 
 
-@router.get("", response_model=list[UniverseResponse])
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": list[UniverseResponse]}},
+)
 async def list_universes(
     include_deleted: bool = Query(default=False),
-    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
 ):
-    service = UniverseService(session=db)
-    universes = await service.list_universes(include_deleted=include_deleted)
-    return universes
+    stmt = select(
+        InstrumentUniverse.id,
+        InstrumentUniverse.name,
+        InstrumentUniverse.description,
+        InstrumentUniverse.is_global,
+        InstrumentUniverse.is_deleted,
+    )
+    if not include_deleted:
+        stmt = stmt.where(InstrumentUniverse.is_deleted.is_(False))
+    stmt = stmt.order_by(InstrumentUniverse.id.asc())
+
+    async def universe_items() -> AsyncIterator[dict[str, Any]]:
+        # Request-scoped sessions close before a streamed body is sent,
+        # so the cursor gets its own session
+        async with session_factory() as session:
+            result = await session.stream(stmt)
+            async for row in result.mappings():
+                yield dict(row)
+
+    return StreamingResponse(_json_array(universe_items()), media_type="application/json")
 
 
 @router.get("/{universe_id}", response_model=UniverseDetail)
 async def get_universe(
     universe_id: int,
+    limit: int = Query(default=500, ge=1, le=5000),
+    offset: int = Query(default=0, ge=0),
     db: AsyncSession = Depends(get_db),
 ):
     service = UniverseService(session=db)
@@ -162,16 +295,23 @@ async def get_universe(
     if not universe:
         raise HTTPException(status_code=404, detail="Universe not found")
 
+    active_members = (
+        InstrumentUniverseMember.universe_id == universe_id,
+        InstrumentUniverseMember.is_deleted.is_(False),
+    )
     members_stmt = (
         select(InstrumentUniverseMember.symbol)
-        .where(
-            InstrumentUniverseMember.universe_id == universe_id,
-            InstrumentUniverseMember.is_deleted.is_(False),
-        )
+        .where(*active_members)
         .order_by(InstrumentUniverseMember.symbol.asc())
+        .limit(limit)
+        .offset(offset)
     )
     result = await db.execute(members_stmt)
     members = [row[0] for row in result.all()]
+
+    total_stmt = select(func.count()).select_from(InstrumentUniverseMember).where(*active_members)
+    member_total = (await db.execute(total_stmt)).scalar_one()
+
     return UniverseDetail(
         id=universe.id,
         name=universe.name,
@@ -179,6 +319,7 @@ async def get_universe(
         is_global=universe.is_global,
         is_deleted=universe.is_deleted,
         members=members,
+        member_total=member_total,
     )
 
 
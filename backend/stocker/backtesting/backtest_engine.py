@@ -15,6 +15,14 @@ from dataclasses import dataclass, field
 from stocker.strategy.signal_strategy import SignalStrategy, SignalConfig
 from stocker.strategy.portfolio_optimizer import PortfolioOptimizer, RiskConfig, TargetExposure
 
+# Per-day equity record produced by BacktestEngine.run_panel
+_HISTORY_DTYPE = np.dtype([
+    ("equity", "f8"),
+    ("drawdown", "f8"),
+    ("daily_pnl", "f8"),
+    ("daily_return", "f8"),
+])
+
 
 @dataclass
 class BacktestMetrics:
@@ -106,103 +114,150 @@ class BacktestEngine:
         Run backtest on provided market data.
         market_data: Dict mapping symbol -> DataFrame(index=Date, columns=[adj_close])
         """
-        # Align all dates
-        all_dates = sorted(list(set().union(*[df.index for df in market_data.values()])))
-        portfolio_value = [self.initial_capital]
-        positions = {sym: 0.0 for sym in market_data.keys()}
+        symbols = list(market_data.keys())
+        if not symbols:
+            return self.run_panel(pd.DatetimeIndex([]), np.empty((0, 0)), symbols)
+
+        # Sorted union of all trading dates; DatetimeIndex.union keeps any timezone
+        frames = list(market_data.values())
+        all_dates = pd.DatetimeIndex(frames[0].index)
+        for df in frames[1:]:
+            all_dates = all_dates.union(df.index)
+        all_dates = all_dates.unique().sort_values()
+
+        # Scatter each symbol into a single (dates x symbols) panel; days
+        # without a bar stay NaN (no forward-fill)
+        prices = np.full((len(all_dates), len(symbols)), np.nan)
+        for j, (symbol, df) in enumerate(market_data.items()):
+            rows = all_dates.get_indexer(df.index)
+            if (rows < 0).any():
+                raise ValueError(f"Dates for {symbol} do not align with the backtest calendar")
+            prices[rows, j] = df['adj_close'].to_numpy(dtype=np.float64)
+
+        return self.run_panel(all_dates, prices, symbols)
+
+    def run_panel(
+        self,
+        dates: pd.DatetimeIndex,
+        prices: np.ndarray,
+        symbols: List[str],
+    ) -> BacktestResult:
+        """
+        Run backtest on an aligned price panel.
+
+        Args:
+            dates: Sorted trading dates (rows of ``prices``)
+            prices: Adjusted closes shaped (len(dates), len(symbols)); NaN on
+                days a symbol has no bar. Not forward-filled: signals only use
+                a symbol's own bars, and a gap contributes no return.
+            symbols: Column labels for ``prices``
+        """
+        n_dates = len(dates)
+        lookback_days = self.signal_strategy.config.lookback_days
+
+        # Each symbol's own bars: compressed closes and their daily returns,
+        # plus how many it has up to each panel row (the lookback gate)
+        observed = ~np.isnan(prices)
+        bar_count = np.cumsum(observed, axis=0)
+        own_closes = [prices[observed[:, j], j] for j in range(len(symbols))]
+        own_rets = [closes[1:] / closes[:-1] - 1 for closes in own_closes]
+
+        # Daily returns computed once: row i is the return from dates[i] to dates[i+1].
+        # A symbol missing either day contributes a zero return.
+        with np.errstate(invalid="ignore", divide="ignore"):
+            log_rets = np.diff(np.log(prices), axis=0)
+        simple_rets = np.nan_to_num(np.expm1(log_rets), nan=0.0)
+
+        symbol_to_col = {sym: j for j, sym in enumerate(symbols)}
+        positions = np.zeros(len(symbols))
         prev_positions = positions.copy()
+        current_equity = self.initial_capital
+        peak_equity = self.initial_capital
 
-        # Track history
-        history = []
-        exposure_history = []
-        turnover_history = []
+        # Preallocated history: one exposure/turnover row per simulated day,
+        # one equity row per day that has a next-day return
+        n_steps = max(n_dates - lookback_days, 0)
+        history = np.empty(max(n_steps - 1, 0), dtype=_HISTORY_DTYPE)
+        exposure_history = np.empty((n_steps, 2), dtype=np.float64)
+        turnover_history = np.empty(n_steps, dtype=np.float64)
 
         # Simple daily loop
-        for i, current_date in enumerate(all_dates):
-            if i < self.signal_strategy.config.lookback_days:
-                continue
+        for step, i in enumerate(range(lookback_days, n_dates)):
+            current_date = dates[i]
 
             # 1. Generate Signals
             signals = []
-            for symbol, df in market_data.items():
-                if current_date in df.index:
-                    hist_slice = df.loc[:current_date]
-                    if len(hist_slice) > self.signal_strategy.config.lookback_days:
-                        try:
-                            sig = self.signal_strategy.compute_signal(symbol, hist_slice)
-                            signals.append(sig)
-                        except ValueError:
-                            pass
+            for j, symbol in enumerate(symbols):
+                n_bars = bar_count[i, j]
+                if observed[i, j] and n_bars > lookback_days:
+                    try:
+                        sig = self.signal_strategy.compute_signal_from_closes(
+                            symbol,
+                            own_closes[j][:n_bars],
+                            current_date.date(),
+                            returns=own_rets[j][:n_bars - 1],
+                        )
+                        signals.append(sig)
+                    except ValueError:
+                        pass
 
             # 2. Optimize Portfolio
-            current_equity = portfolio_value[-1]
-            peak_equity = max(portfolio_value)
             drawdown = (peak_equity - current_equity) / peak_equity if peak_equity > 0 else 0
 
-            targets = self.portfolio_optimizer.compute_targets(signals, drawdown)
+            new_positions = self.portfolio_optimizer.compute_target_vector(
+                signals, symbol_to_col, drawdown
+            )
 
             # 3. Calculate exposure metrics
-            new_positions = {t.symbol: t.target_exposure for t in targets}
-            gross_exposure = sum(abs(v) for v in new_positions.values())
-            net_exposure = sum(new_positions.values())
+            gross_exposure = float(np.abs(new_positions).sum())
+            net_exposure = float(new_positions.sum())
 
             # Calculate turnover
-            turnover = sum(abs(new_positions.get(s, 0) - prev_positions.get(s, 0))
-                          for s in set(new_positions.keys()) | set(prev_positions.keys()))
+            turnover = float(np.abs(new_positions - prev_positions).sum())
 
-            exposure_history.append({
-                "date": current_date,
-                "gross_exposure": gross_exposure,
-                "net_exposure": net_exposure
-            })
-            turnover_history.append(turnover)
+            exposure_history[step] = (gross_exposure, net_exposure)
+            turnover_history[step] = turnover
 
             # 4. Simulate Next Day Return
-            daily_pnl = 0.0
-            if i < len(all_dates) - 1:
-                next_date = all_dates[i + 1]
-
-                for symbol, exposure in positions.items():
-                    df = market_data[symbol]
-                    if current_date in df.index and next_date in df.index:
-                        ret = (df.loc[next_date, 'adj_close'] / df.loc[current_date, 'adj_close']) - 1
-                        position_value = exposure * current_equity
-                        daily_pnl += position_value * ret
+            if i < n_dates - 1:
+                daily_pnl = current_equity * float(positions @ simple_rets[i])
 
                 # Apply transaction costs
                 trade_cost = self._calculate_trade_cost(turnover, current_equity)
                 daily_pnl -= trade_cost
 
                 new_equity = current_equity + daily_pnl
-                portfolio_value.append(new_equity)
 
                 # Update positions
-                prev_positions = positions.copy()
+                prev_positions = positions
                 positions = new_positions
 
-                history.append({
-                    "date": next_date,
-                    "equity": new_equity,
-                    "drawdown": drawdown,
-                    "daily_pnl": daily_pnl,
-                    "daily_return": daily_pnl / current_equity if current_equity > 0 else 0
-                })
+                history[step] = (
+                    new_equity,
+                    drawdown,
+                    daily_pnl,
+                    daily_pnl / current_equity if current_equity > 0 else 0,
+                )
 
-        # Build result DataFrames
-        results_df = pd.DataFrame(history)
-        if not results_df.empty:
-            results_df = results_df.set_index("date")
+                current_equity = new_equity
+                peak_equity = max(peak_equity, new_equity)
 
-        exposure_df = pd.DataFrame(exposure_history)
-        if not exposure_df.empty:
-            exposure_df = exposure_df.set_index("date")
+        # Build result DataFrames
+        results_df = pd.DataFrame(
+            history,
+            index=pd.DatetimeIndex(dates[lookback_days + 1:], name="date"),
+        )
+        exposure_df = pd.DataFrame(
+            exposure_history,
+            columns=["gross_exposure", "net_exposure"],
+            index=pd.DatetimeIndex(dates[lookback_days:], name="date"),
+        )
 
         # Calculate all TDD metrics
         metrics = self._calculate_metrics(
             results_df,
             exposure_df,
             turnover_history,
-            portfolio_value
         )
 
         # Build return series
@@ -231,18 +286,17 @@ class BacktestEngine:
         self,
         results_df: pd.DataFrame,
         exposure_df: pd.DataFrame,
-        turnover_history: List[float],
-        portfolio_value: List[float]
+        turnover_history: np.ndarray,
     ) -> BacktestMetrics:
         """Calculate TDD-compliant metrics."""
         metrics = BacktestMetrics()
 
-        if results_df.empty or len(portfolio_value) < 2:
+        if results_df.empty:
             return metrics
 
         # Basic stats
-        metrics.final_equity = portfolio_value[-1]
-        metrics.total_return = (portfolio_value[-1] / self.initial_capital) - 1
+        metrics.final_equity = results_df['equity'].iloc[-1]
+        metrics.total_return = (metrics.final_equity / self.initial_capital) - 1
 
         # Daily returns
         daily_returns = results_df['daily_return'].dropna()
@@ -286,11 +340,16 @@ class BacktestEngine:
             metrics.worst_12m = rolling_12m.min()
 
         # Turnover metrics
-        if turnover_history:
-            # Group by month for monthly turnover
-            results_df_copy = results_df.copy()
-            results_df_copy['turnover'] = turnover_history[:len(results_df)]
-            monthly_turnover = results_df_copy.resample('M')['turnover'].sum()
+        if len(turnover_history):
+            # Group by month for monthly turnover (calendar months with no
+            # rows count as zero, as with a monthly resample)
+            dates = results_df.index
+            month_codes = dates.year.to_numpy() * 12 + dates.month.to_numpy() - 1
+            month_codes -= month_codes.min()
+            monthly_turnover = np.bincount(
+                month_codes,
+                weights=np.asarray(turnover_history[:len(results_df)], dtype=np.float64),
+            )
             metrics.avg_monthly_turnover = monthly_turnover.mean()
             metrics.annual_turnover = metrics.avg_monthly_turnover * 12
 
@@ -12,16 +12,28 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 from stocker.core.config import settings
 
+if settings.DB_NULL_POOL:
+    _pool_options = {"poolclass": NullPool}
+else:
+    # Persistent pool for long-running processes (API, stream consumers)
+    _pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,  # Verify connections before using
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        # Reuse the most recently returned connection so traffic stays on a
+        # few warm backends and the rest can idle out
+        "pool_use_lifo": True,
+    }
+
 # Create async engine
 engine: AsyncEngine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DB_ECHO,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    **_pool_options,
 )
 
 # Create async session factory
@@ -37,6 +49,35 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
+def use_null_pool() -> None:
+    """
+    Rebind AsyncSessionLocal to an unpooled engine.
+
+    For processes that run every job under its own asyncio.run() loop
+    (Celery workers, scripts calling tasks directly): pooled asyncpg
+    connections are tied to the loop that opened them and cannot be reused
+    by the next one. Same effect as DB_NULL_POOL=true, without relying on
+    the environment being set.
+    """
+    global engine
+    if isinstance(engine.pool, NullPool):
+        return
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DB_ECHO,
+        poolclass=NullPool,
+    )
+    AsyncSessionLocal.configure(bind=engine)
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Dependency for routes that open several sessions of their own (e.g. to
+    run queries concurrently); overridable like get_db.
+    """
+    return AsyncSessionLocal
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for FastAPI routes to get database session.
@@ -63,6 +104,9 @@ async def init_db() -> None:
 
     WARNING: This creates all tables. Use Alembic migrations in production.
     """
+    from stocker.models import load_all
+
+    load_all()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
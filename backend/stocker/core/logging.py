@@ -1,26 +1,117 @@
 """
 Logging configuration for the application.
 
-Sets up structured logging with appropriate formatters.
+Sets up structured logging with appropriate formatters: one JSON object
+per line by default (LOG_FORMAT=json), or the classic text layout.
+
+Records are handed to a QueueHandler on the root logger and written to
+stdout by a QueueListener thread, so logging from the event loop never
+blocks on stream I/O.
 """
 
+import atexit
+import copy
 import logging
+import queue
 import sys
-from stocker.core.config import settings
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+import orjson
+
+from stocker.core.config import get_settings
+
+# Background writer started by setup_logging(); stopped at interpreter exit
+_listener: Optional[QueueListener] = None
+_atexit_registered = False
+
+
+class OrjsonFormatter(logging.Formatter):
+    """Format each record as a single JSON line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage(),
+        }
+        # Structured payload passed via extra={"metric": ...}
+        metric = getattr(record, "metric", None)
+        if metric is not None:
+            payload["metric"] = metric
+        # Tracebacks arrive pre-rendered in exc_text from _StructuredQueueHandler
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = record.stack_info
+        return orjson.dumps(payload, default=str).decode()
+
+
+class _StructuredQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps tracebacks out of the message.
+
+    The stock prepare() formats the record, folding the traceback into msg,
+    and drops exc_info before enqueueing. Here the traceback is rendered to
+    exc_text instead, so the listener's formatter still sees it as a field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            # Tracebacks hold frames that may not pickle or outlive the thread
+            record.exc_info = None
+        return record
 
 
 def setup_logging() -> None:
     """Configure application logging."""
+    global _listener, _atexit_registered
+    # Idempotent: one listener thread per process
+    if _listener is not None:
+        return
+
+    settings = get_settings()
+
+    # Record attributes the formatter never uses
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
-    # Configure root logger
-    logging.basicConfig(
-        level=getattr(logging, settings.LOG_LEVEL.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-        ],
-    )
+    handler = logging.StreamHandler(sys.stdout)
+    if settings.LOG_FORMAT == "json":
+        handler.setFormatter(OrjsonFormatter())
+    else:
+        handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
+        )
+
+    # Configure root logger; handlers installed earlier (uvicorn, celery, a
+    # previous setup) are replaced so every record is written exactly once
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, settings.LOG_LEVEL.upper()))
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+        existing.close()
+    root.addHandler(_StructuredQueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    if not _atexit_registered:
+        atexit.register(stop_logging)
+        _atexit_registered = True
 
     # Set third-party library log levels
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -29,6 +120,14 @@ def setup_logging() -> None:
     logging.getLogger("redis").setLevel(logging.WARNING)
 
 
+def stop_logging() -> None:
+    """Flush queued records and stop the background log writer."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name."""
     return logging.getLogger(name)
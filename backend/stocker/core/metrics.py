@@ -13,21 +13,39 @@ Metrics are emitted to:
 2. Redis stream (real-time consumers, dashboard)
 3. In-memory buffer (API aggregation)
 """
-import json
+import asyncio
 import logging
+import time
+from bisect import bisect_left
+from collections import Counter, deque
+from itertools import islice
+from operator import attrgetter
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+from typing import Final, Optional, Dict, Any, List
 
-from stocker.core.redis import StreamNames
+import orjson
+
+from stocker.core.redis import STREAM_METRICS
 
 logger = logging.getLogger(__name__)
 
+# Max events sent to Redis in one pipelined round-trip
+METRICS_FLUSH_BATCH_SIZE = 256
+
+# Approximate cap on the metrics stream length (XADD MAXLEN ~)
+METRICS_STREAM_MAXLEN = 100_000
+
+# Stream key pre-encoded for the bytes-mode producer client
+_STREAM_METRICS: Final[bytes] = STREAM_METRICS.encode()
 
-@dataclass
+_timestamp_ns = attrgetter("timestamp_ns")
+
+
+@dataclass(slots=True, frozen=True)
 class MetricEvent:
     """Structured metric event."""
-    timestamp: datetime
+    timestamp_ns: int      # time.time_ns() at emit; see `timestamp` for a datetime
     category: str          # "signal", "exit", "diversification", "order", "risk"
     event_type: str        # "confirmation_passed", "trailing_stop_triggered", etc.
     symbol: Optional[str]
@@ -35,6 +53,11 @@ class MetricEvent:
     value: float
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def timestamp(self) -> datetime:
+        """Emit time as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -47,6 +70,19 @@ class MetricEvent:
             "metadata": self.metadata
         }
 
+    def to_json(self) -> bytes:
+        """Serialize for the Redis stream (same keys as to_dict)."""
+        # orjson writes the aware datetime in the same ISO-8601 form as isoformat()
+        return orjson.dumps({
+            "timestamp": self.timestamp,
+            "category": self.category,
+            "event_type": self.event_type,
+            "symbol": self.symbol,
+            "portfolio_id": self.portfolio_id,
+            "value": self.value,
+            "metadata": self.metadata
+        })
+
 
 class MetricsEmitter:
     """
@@ -55,6 +91,20 @@ class MetricsEmitter:
     Thread-safe for use across async consumers.
     """
 
+    __slots__ = (
+        "redis",
+        "buffer_size",
+        "_buffer",
+        "_enabled",
+        "_count_cat",
+        "_count_event",
+        "_conf_passed",
+        "_conf_total",
+        "_pending",
+        "_flush_event",
+        "_flusher_task",
+    )
+
     # Category constants
     CATEGORY_SIGNAL = "signal"
     CATEGORY_EXIT = "exit"
@@ -69,16 +119,49 @@ class MetricsEmitter:
 
         Args:
             redis_client: Optional async Redis client for stream publishing
+                (ideally the bytes-mode producer client, see get_async_redis_bytes)
             buffer_size: Max events to keep in memory buffer
         """
         self.redis = redis_client
         self.buffer_size = buffer_size
-        self._buffer: List[MetricEvent] = []
+        self._buffer: deque[MetricEvent] = deque(maxlen=buffer_size)
         self._enabled = True
 
+        # Running totals over everything in _buffer, kept in step by _append
+        self._count_cat: Counter[str] = Counter()
+        self._count_event: Counter[tuple[str, str]] = Counter()
+        self._conf_passed = 0
+        self._conf_total = 0
+
+        # Events waiting for the background flusher to XADD them in batches
+        self._pending: deque[MetricEvent] = deque(maxlen=buffer_size * 4)
+        self._flush_event: Optional[asyncio.Event] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+
     def set_redis(self, redis_client) -> None:
-        """Set Redis client (for lazy initialization)."""
+        """Set Redis client (for lazy initialization) and start the flusher."""
         self.redis = redis_client
+        self._start_flusher()
+
+    def _start_flusher(self) -> None:
+        """Start the background flusher on the running loop, if any."""
+        if self._flusher_task is not None and not self._flusher_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop yet - the first emit from async code starts it
+            return
+
+        self._flush_event = asyncio.Event()
+        if self._pending:
+            self._flush_event.set()
+        self._flusher_task = loop.create_task(self._flusher())
+
+    @property
+    def enabled(self) -> bool:
+        """Whether metrics are currently being recorded."""
+        return self._enabled
 
     def enable(self) -> None:
         """Enable metrics emission."""
@@ -113,56 +196,108 @@ class MetricsEmitter:
         """
         if not self._enabled:
             return None
+        return self._record(category, event_type, value, symbol, metadata, portfolio_id)
 
+    def _record(
+        self,
+        category: str,
+        event_type: str,
+        value: float,
+        symbol: Optional[str],
+        metadata: Optional[dict],
+        portfolio_id: str = "main",
+    ) -> MetricEvent:
+        """
+        Build, log, buffer and queue one event.
+
+        Shared by emit/emit_async and the convenience helpers, which call it
+        positionally once they have checked _enabled themselves.
+        """
         event = MetricEvent(
-            timestamp=datetime.now(timezone.utc),
-            category=category,
-            event_type=event_type,
-            symbol=symbol,
-            portfolio_id=portfolio_id,
-            value=value,
-            metadata=metadata or {}
+            time.time_ns(), category, event_type, symbol, portfolio_id, value,
+            metadata or {}
         )
 
-        # Log for immediate visibility
-        meta_str = f" {metadata}" if metadata else ""
-        logger.info(
-            f"METRIC [{category}/{event_type}] "
-            f"symbol={symbol} value={value}{meta_str}"
-        )
+        # Log for immediate visibility; nothing is formatted when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "METRIC [%s/%s] symbol=%s value=%s%s",
+                category, event_type, symbol, value,
+                (" " + repr(metadata)) if metadata else "",
+                extra={"metric": event},
+            )
 
-        # Add to buffer (with size limit)
-        self._buffer.append(event)
-        if len(self._buffer) > self.buffer_size:
-            self._buffer = self._buffer[-self.buffer_size:]
+        # Add to buffer (deque evicts the oldest past buffer_size)
+        self._append(event)
 
-        # Publish to Redis stream if available
-        if self.redis:
-            try:
-                import asyncio
-                # Check if we're in an async context and handle appropriately
-                try:
-                    loop = asyncio.get_running_loop()
-                    # We're in async context - schedule the async xadd
-                    asyncio.create_task(self._async_publish(event))
-                except RuntimeError:
-                    # No running loop - use sync (won't work with async Redis)
-                    # This path is for non-async code (rare)
-                    pass
-            except Exception as e:
-                logger.warning(f"Failed to publish metric to Redis: {e}")
+        # Queue for the Redis stream; the flusher batches the XADDs
+        self._enqueue(event)
 
         return event
 
-    async def _async_publish(self, event: MetricEvent) -> None:
-        """Async helper to publish metric to Redis."""
-        if self.redis:
+    def _append(self, event: MetricEvent) -> None:
+        """Buffer an event, moving the running counters in and out with it."""
+        if len(self._buffer) == self._buffer.maxlen:
+            self._count(self._buffer[0], -1)
+        self._buffer.append(event)
+        self._count(event, 1)
+
+    def _count(self, event: MetricEvent, delta: int) -> None:
+        self._count_cat[event.category] += delta
+        self._count_event[(event.category, event.event_type)] += delta
+        if event.event_type == "confirmation_check":
+            self._conf_total += delta
+            if event.value == 1.0:
+                self._conf_passed += delta
+
+    def _enqueue(self, event: MetricEvent) -> None:
+        """Hand an event to the background flusher."""
+        if not self.redis:
+            return
+
+        self._pending.append(event)
+        if self._flusher_task is None or self._flusher_task.done():
+            self._start_flusher()
+        if self._flush_event is not None:
+            self._flush_event.set()
+
+    async def _flusher(self) -> None:
+        """
+        Drain pending events to the Redis stream.
+
+        Everything queued since the last wake-up goes out in pipelined
+        batches, so a burst of emits costs one round-trip per batch.
+        """
+        while True:
+            await self._flush_event.wait()
+            self._flush_event.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Send every pending event to the Redis stream on the caller's loop.
+
+        The background flusher dies with the loop it was started on, so
+        callers that are about to tear their loop down await this to deliver
+        what is still queued.
+        """
+        while self._pending and self.redis:
+            batch = [
+                self._pending.popleft()
+                for _ in range(min(len(self._pending), METRICS_FLUSH_BATCH_SIZE))
+            ]
             try:
-                await self.redis.xadd(StreamNames.METRICS, {
-                    "data": json.dumps(event.to_dict())
-                })
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for event in batch:
+                        pipe.xadd(
+                            _STREAM_METRICS,
+                            {b"data": event.to_json()},
+                            maxlen=METRICS_STREAM_MAXLEN,
+                            approximate=True,
+                        )
+                    await pipe.execute()
             except Exception as e:
-                logger.warning(f"Failed to publish metric to Redis: {e}")
+                logger.warning(f"Failed to publish {len(batch)} metrics to Redis: {e}")
 
     async def emit_async(
         self,
@@ -173,41 +308,11 @@ class MetricsEmitter:
         portfolio_id: str = "main",
         metadata: dict = None
     ) -> MetricEvent:
-        """Async version of emit for use in async consumers."""
+        """Async version of emit; returns once the event is written to Redis."""
         if not self._enabled:
             return None
-
-        event = MetricEvent(
-            timestamp=datetime.now(timezone.utc),
-            category=category,
-            event_type=event_type,
-            symbol=symbol,
-            portfolio_id=portfolio_id,
-            value=value,
-            metadata=metadata or {}
-        )
-
-        # Log
-        meta_str = f" {metadata}" if metadata else ""
-        logger.info(
-            f"METRIC [{category}/{event_type}] "
-            f"symbol={symbol} value={value}{meta_str}"
-        )
-
-        # Buffer
-        self._buffer.append(event)
-        if len(self._buffer) > self.buffer_size:
-            self._buffer = self._buffer[-self.buffer_size:]
-
-        # Async Redis publish
-        if self.redis:
-            try:
-                await self.redis.xadd(StreamNames.METRICS, {
-                    "data": json.dumps(event.to_dict())
-                })
-            except Exception as e:
-                logger.warning(f"Failed to publish metric to Redis: {e}")
-
+        event = self._record(category, event_type, value, symbol, metadata, portfolio_id)
+        await self.flush()
         return event
 
     # =========================================================================
@@ -218,10 +323,12 @@ class MetricsEmitter:
     def signal_generated(self, symbol: str, direction: int, raw_weight: float,
                         lookback_return: float, ewma_vol: float) -> MetricEvent:
         """Record signal generation."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_SIGNAL, "generated", raw_weight,
-            symbol=symbol,
-            metadata={
+            symbol,
+            {
                 "direction": direction,
                 "lookback_return": round(lookback_return, 6),
                 "ewma_vol": round(ewma_vol, 6)
@@ -231,10 +338,12 @@ class MetricsEmitter:
     def signal_confirmation(self, symbol: str, passed: bool, conf_type: str,
                            direction: int) -> MetricEvent:
         """Record confirmation check result."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_SIGNAL, "confirmation_check", 1.0 if passed else 0.0,
-            symbol=symbol,
-            metadata={
+            symbol,
+            {
                 "type": conf_type,
                 "passed": passed,
                 "direction": direction
@@ -245,10 +354,12 @@ class MetricsEmitter:
     def trailing_stop_triggered(self, symbol: str, atr_multiple: float,
                                peak_price: float, current_price: float) -> MetricEvent:
         """Record trailing stop trigger."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_EXIT, "trailing_stop_triggered", atr_multiple,
-            symbol=symbol,
-            metadata={
+            symbol,
+            {
                 "peak_price": peak_price,
                 "current_price": current_price,
                 "drawdown_pct": (peak_price - current_price) / peak_price if peak_price else 0
@@ -258,10 +369,12 @@ class MetricsEmitter:
     def atr_exit_triggered(self, symbol: str, atr_multiple: float,
                           entry_price: float, current_price: float) -> MetricEvent:
         """Record ATR-based exit trigger."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_EXIT, "atr_exit_triggered", atr_multiple,
-            symbol=symbol,
-            metadata={
+            symbol,
+            {
                 "entry_price": entry_price,
                 "current_price": current_price
             }
@@ -270,10 +383,12 @@ class MetricsEmitter:
     def persistence_blocked(self, symbol: str, days: int, required: int,
                            direction: int) -> MetricEvent:
         """Record persistence filter blocking a signal flip."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_EXIT, "persistence_blocked", days,
-            symbol=symbol,
-            metadata={
+            symbol,
+            {
                 "required_days": required,
                 "attempted_direction": direction
             }
@@ -283,10 +398,12 @@ class MetricsEmitter:
     def sector_cap_applied(self, symbol: str, sector: str,
                           exposure_before: float, cap: float) -> MetricEvent:
         """Record sector cap application."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_DIVERSIFICATION, "sector_cap_applied", cap,
-            symbol=symbol,
-            metadata={
+            symbol,
+            {
                 "sector": sector,
                 "exposure_before": round(exposure_before, 4),
                 "cap": cap
@@ -296,10 +413,12 @@ class MetricsEmitter:
     def asset_class_cap_applied(self, symbol: str, asset_class: str,
                                exposure_before: float, cap: float) -> MetricEvent:
         """Record asset class cap application."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_DIVERSIFICATION, "asset_class_cap_applied", cap,
-            symbol=symbol,
-            metadata={
+            symbol,
+            {
                 "asset_class": asset_class,
                 "exposure_before": round(exposure_before, 4),
                 "cap": cap
@@ -309,10 +428,12 @@ class MetricsEmitter:
     def correlation_throttle_applied(self, symbol: str, correlation: float,
                                     scale_factor: float, correlated_with: str) -> MetricEvent:
         """Record correlation throttle application."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_DIVERSIFICATION, "correlation_throttle", correlation,
-            symbol=symbol,
-            metadata={
+            symbol,
+            {
                 "scale_factor": scale_factor,
                 "correlated_with": correlated_with,
                 "correlation": round(correlation, 4)
@@ -323,10 +444,12 @@ class MetricsEmitter:
     def order_sizing(self, symbol: str, target_qty: float, actual_qty: float,
                     fractional: bool, min_notional: float) -> MetricEvent:
         """Record order sizing decision."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_ORDER, "sizing", actual_qty,
-            symbol=symbol,
-            metadata={
+            symbol,
+            {
                 "target_qty": round(target_qty, 4),
                 "actual_qty": round(actual_qty, 4),
                 "fractional": fractional,
@@ -337,29 +460,35 @@ class MetricsEmitter:
 
     def order_skipped(self, symbol: str, reason: str, notional: float) -> MetricEvent:
         """Record skipped order."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_ORDER, "skipped", notional,
-            symbol=symbol,
-            metadata={"reason": reason}
+            symbol,
+            {"reason": reason}
         )
 
     def order_created(self, symbol: str, side: str, qty: float,
                      notional: float) -> MetricEvent:
         """Record order creation."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_ORDER, "created", notional,
-            symbol=symbol,
-            metadata={"side": side, "qty": qty}
+            symbol,
+            {"side": side, "qty": qty}
         )
 
     # Risk metrics
     def single_cap_applied(self, symbol: str, weight_before: float,
                           cap: float) -> MetricEvent:
         """Record single instrument cap."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_RISK, "single_cap_applied", cap,
-            symbol=symbol,
-            metadata={
+            symbol,
+            {
                 "weight_before": round(weight_before, 4),
                 "cap": cap
             }
@@ -368,9 +497,12 @@ class MetricsEmitter:
     def gross_exposure_scaled(self, gross_before: float, gross_after: float,
                              scale_factor: float) -> MetricEvent:
         """Record gross exposure scaling."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_RISK, "gross_exposure_scaled", scale_factor,
-            metadata={
+            None,
+            {
                 "gross_before": round(gross_before, 4),
                 "gross_after": round(gross_after, 4),
                 "scale_factor": round(scale_factor, 4)
@@ -380,9 +512,12 @@ class MetricsEmitter:
     def drawdown_scaling(self, drawdown: float, threshold: float,
                         scale_factor: float) -> MetricEvent:
         """Record drawdown-based scaling."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_RISK, "drawdown_scaling", drawdown,
-            metadata={
+            None,
+            {
                 "drawdown": round(drawdown, 4),
                 "threshold": threshold,
                 "scale_factor": scale_factor
@@ -392,9 +527,12 @@ class MetricsEmitter:
     def kill_switch_triggered(self, daily_pnl: float, threshold: float,
                              cancelled_orders: int) -> MetricEvent:
         """Record kill switch activation."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_RISK, "kill_switch_triggered", daily_pnl,
-            metadata={
+            None,
+            {
                 "daily_pnl": round(daily_pnl, 4),
                 "threshold": threshold,
                 "cancelled_orders": cancelled_orders
@@ -405,9 +543,12 @@ class MetricsEmitter:
     def batch_processed(self, stage: str, count: int, success: int,
                        failed: int, duration_ms: float) -> MetricEvent:
         """Record batch processing completion."""
-        return self.emit(
+        if not self._enabled:
+            return None
+        return self._record(
             self.CATEGORY_PIPELINE, "batch_processed", count,
-            metadata={
+            None,
+            {
                 "stage": stage,
                 "success": success,
                 "failed": failed,
@@ -433,32 +574,46 @@ class MetricsEmitter:
         Returns:
             Dictionary with aggregated metrics
         """
-        from datetime import timedelta
-
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-        recent = [e for e in self._buffer if e.timestamp >= cutoff]
-
-        # Count by category and event type
-        by_category: Dict[str, int] = {}
-        by_event: Dict[str, int] = {}
-
-        confirmation_passed = 0
-        confirmation_total = 0
-
-        for event in recent:
-            by_category[event.category] = by_category.get(event.category, 0) + 1
-            key = f"{event.category}/{event.event_type}"
-            by_event[key] = by_event.get(key, 0) + 1
-
-            # Track confirmation rate
-            if event.event_type == "confirmation_check":
-                confirmation_total += 1
-                if event.value == 1.0:
-                    confirmation_passed += 1
+        cutoff_ns = time.time_ns() - hours * 3600 * 1_000_000_000
+
+        if not self._buffer or self._buffer[0].timestamp_ns >= cutoff_ns:
+            # Whole buffer is inside the window - use the running counters
+            total = len(self._buffer)
+            by_category = {k: v for k, v in self._count_cat.items() if v > 0}
+            by_event = {
+                f"{cat}/{evt}": v
+                for (cat, evt), v in self._count_event.items() if v > 0
+            }
+            confirmation_passed = self._conf_passed
+            confirmation_total = self._conf_total
+        else:
+            # Events are appended in emit order, so timestamps are sorted and
+            # the window start can be found by bisection
+            start = bisect_left(self._buffer, cutoff_ns, key=_timestamp_ns)
+            recent = list(islice(self._buffer, start, None))
+            total = len(recent)
+
+            # Count by category and event type
+            by_category: Dict[str, int] = {}
+            by_event: Dict[str, int] = {}
+
+            confirmation_passed = 0
+            confirmation_total = 0
+
+            for event in recent:
+                by_category[event.category] = by_category.get(event.category, 0) + 1
+                key = f"{event.category}/{event.event_type}"
+                by_event[key] = by_event.get(key, 0) + 1
+
+                # Track confirmation rate
+                if event.event_type == "confirmation_check":
+                    confirmation_total += 1
+                    if event.value == 1.0:
+                        confirmation_passed += 1
 
         return {
             "period_hours": hours,
-            "total_events": len(recent),
+            "total_events": total,
             "by_category": by_category,
             "by_event": by_event,
             "confirmation_rate": (
@@ -475,7 +630,11 @@ class MetricsEmitter:
     def clear_buffer(self) -> int:
         """Clear buffer and return count of cleared events."""
         count = len(self._buffer)
-        self._buffer = []
+        self._buffer.clear()
+        self._count_cat.clear()
+        self._count_event.clear()
+        self._conf_passed = 0
+        self._conf_total = 0
         return count
 
 
@@ -4,25 +4,42 @@ Redis connection and stream management.
 Provides Redis client for both sync and async operations.
 """
 
-from typing import Optional
+import threading
+from typing import Final, Optional
 from redis import Redis
 from redis.asyncio import Redis as AsyncRedis
-from stocker.core.config import settings
+from stocker.core.config import get_settings
+
+# Keepalive/health options for the long-lived shared clients
+_CLIENT_OPTIONS = {
+    "health_check_interval": 30,
+    "socket_keepalive": True,
+    "retry_on_timeout": True,
+}
 
 # Synchronous Redis client (for Celery tasks)
 redis_client: Optional[Redis] = None
+_sync_lock = threading.Lock()
 
 
 def get_redis() -> Redis:
     """Get synchronous Redis client."""
     global redis_client
-    if redis_client is None:
-        redis_client = Redis.from_url(
-            settings.REDIS_URL,
-            decode_responses=True,
-            max_connections=settings.REDIS_MAX_CONNECTIONS,
-        )
-    return redis_client
+    client = redis_client
+    if client is not None:
+        return client
+
+    # Threads can race here (worker pools, FastAPI's threadpool)
+    with _sync_lock:
+        if redis_client is None:
+            settings = get_settings()
+            redis_client = Redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                **_CLIENT_OPTIONS,
+            )
+        return redis_client
 
 
 # Async Redis client (for stream consumers)
@@ -32,18 +49,43 @@ async_redis_client: Optional[AsyncRedis] = None
 async def get_async_redis() -> AsyncRedis:
     """Get async Redis client."""
     global async_redis_client
+    # No await between the check and the assignment, so coroutines on the
+    # loop cannot interleave here and no lock is needed
     if async_redis_client is None:
+        settings = get_settings()
         async_redis_client = AsyncRedis.from_url(
             settings.REDIS_URL,
             decode_responses=True,
             max_connections=settings.REDIS_MAX_CONNECTIONS,
+            **_CLIENT_OPTIONS,
         )
     return async_redis_client
 
 
+# Bytes-mode async client for high-volume producers (metrics XADD).
+# Payloads go out as pre-encoded bytes and replies are only entry IDs, so
+# skipping response decoding saves a str round-trip per command. Readers
+# and convenience paths keep the decoded client above.
+async_redis_bytes_client: Optional[AsyncRedis] = None
+
+
+async def get_async_redis_bytes() -> AsyncRedis:
+    """Get async Redis client that returns raw bytes (producer side)."""
+    global async_redis_bytes_client
+    if async_redis_bytes_client is None:
+        settings = get_settings()
+        async_redis_bytes_client = AsyncRedis.from_url(
+            settings.REDIS_URL,
+            decode_responses=False,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            **_CLIENT_OPTIONS,
+        )
+    return async_redis_bytes_client
+
+
 async def close_redis() -> None:
     """Close Redis connections."""
-    global redis_client, async_redis_client
+    global redis_client, async_redis_client, async_redis_bytes_client
 
     if redis_client is not None:
         redis_client.close()
@@ -53,29 +95,57 @@ async def close_redis() -> None:
         await async_redis_client.close()
         async_redis_client = None
 
+    if async_redis_bytes_client is not None:
+        await async_redis_bytes_client.close()
+        async_redis_bytes_client = None
+
 
 # Redis Stream Names
+STREAM_MARKET_BARS: Final[str] = "market-bars"
+STREAM_SIGNALS: Final[str] = "signals"
+STREAM_TARGETS: Final[str] = "targets"
+STREAM_ORDERS: Final[str] = "orders"
+STREAM_FILLS: Final[str] = "fills"
+STREAM_DERIVED_METRICS: Final[str] = "derived-metrics"
+STREAM_PORTFOLIO_STATE: Final[str] = "portfolio-state"
+STREAM_ALERTS: Final[str] = "alerts"
+STREAM_METRICS: Final[str] = "metrics"  # Observability metrics stream
+
+
 class StreamNames:
-    """Redis Stream names for the event bus."""
+    """Redis Stream names for the event bus (namespace over the STREAM_* constants)."""
 
-    MARKET_BARS = "market-bars"
-    SIGNALS = "signals"
-    TARGETS = "targets"
-    ORDERS = "orders"
-    FILLS = "fills"
-    DERIVED_METRICS = "derived-metrics"
-    PORTFOLIO_STATE = "portfolio-state"
-    ALERTS = "alerts"
-    METRICS = "metrics"  # Observability metrics stream
+    MARKET_BARS: Final[str] = STREAM_MARKET_BARS
+    SIGNALS: Final[str] = STREAM_SIGNALS
+    TARGETS: Final[str] = STREAM_TARGETS
+    ORDERS: Final[str] = STREAM_ORDERS
+    FILLS: Final[str] = STREAM_FILLS
+    DERIVED_METRICS: Final[str] = STREAM_DERIVED_METRICS
+    PORTFOLIO_STATE: Final[str] = STREAM_PORTFOLIO_STATE
+    ALERTS: Final[str] = STREAM_ALERTS
+    METRICS: Final[str] = STREAM_METRICS
+
+
+# Pub/sub channel fanned out to SSE clients. Publishers send the final JSON
+# payload string; the SSE endpoint forwards it to clients verbatim.
+UI_UPDATES_CHANNEL: Final[str] = "ui-updates"
 
 
 # Consumer Group Names
+GROUP_SIGNAL_PROCESSORS: Final[str] = "signal-processors"
+GROUP_PORTFOLIO_PROCESSORS: Final[str] = "portfolio-processors"
+GROUP_ORDER_GENERATORS: Final[str] = "order-generators"
+GROUP_BROKER_EXECUTORS: Final[str] = "broker-executors"
+GROUP_LEDGER_PROCESSORS: Final[str] = "ledger-processors"
+GROUP_SYSTEM_MONITORS: Final[str] = "system-monitors"
+
+
 class ConsumerGroups:
-    """Consumer group names for Redis Streams."""
-
-    SIGNAL_PROCESSORS = "signal-processors"
-    PORTFOLIO_PROCESSORS = "portfolio-processors"
-    ORDER_GENERATORS = "order-generators"
-    BROKER_EXECUTORS = "broker-executors"
-    LEDGER_PROCESSORS = "ledger-processors"
-    SYSTEM_MONITORS = "system-monitors"
+    """Consumer group names for Redis Streams (namespace over the GROUP_* constants)."""
+
+    SIGNAL_PROCESSORS: Final[str] = GROUP_SIGNAL_PROCESSORS
+    PORTFOLIO_PROCESSORS: Final[str] = GROUP_PORTFOLIO_PROCESSORS
+    ORDER_GENERATORS: Final[str] = GROUP_ORDER_GENERATORS
+    BROKER_EXECUTORS: Final[str] = GROUP_BROKER_EXECUTORS
+    LEDGER_PROCESSORS: Final[str] = GROUP_LEDGER_PROCESSORS
+    SYSTEM_MONITORS: Final[str] = GROUP_SYSTEM_MONITORS
@@ -1,51 +1,85 @@
+"""
+ORM models.
+
+Model classes are imported on first attribute access (PEP 562), so
+`from stocker.models import DailyBar` only loads the modules it needs.
+Call load_all() where every table must be registered on Base.metadata
+(Alembic, create_all).
+"""
+import importlib
+from typing import Any
+
 # Base
-from stocker.models.base import TimestampMixin, IdMixin
-
-# Market Data
-from stocker.models.daily_bar import DailyBar
-from stocker.models.intraday_bar import IntradayBar
-from stocker.models.instrument_info import InstrumentInfo
-from stocker.models.instrument_metrics import InstrumentMetrics
-from stocker.models.corporate_action import CorporateAction
-from stocker.models.market_sentiment import MarketSentiment
-from stocker.models.market_breadth import MarketBreadth
-from stocker.models.trading_universe import TradingUniverse
-from stocker.models.instrument_universe import InstrumentUniverse
-from stocker.models.instrument_universe_member import InstrumentUniverseMember
-from stocker.models.strategy_universe import StrategyUniverse
-from stocker.models.derived_metric_definition import DerivedMetricDefinition
-from stocker.models.derived_metric_value import DerivedMetricValue
-from stocker.models.derived_metric_rule_set import DerivedMetricRuleSet
-from stocker.models.derived_metric_rule import DerivedMetricRule
-from stocker.models.derived_metric_score import DerivedMetricScore
-
-# Strategy & Portfolio
-from stocker.models.signal import Signal
-from stocker.models.target_exposure import TargetExposure
-
-# Execution
-from stocker.models.order import Order
-from stocker.models.fill import Fill
-
-# Accounting
-from stocker.models.holding import Holding
-from stocker.models.portfolio_state import PortfolioState
-from stocker.models.position_snapshot import PositionSnapshot
-
-# Performance Analytics
-from stocker.models.performance_metrics_daily import PerformanceMetricsDaily
-from stocker.models.execution_metrics_daily import ExecutionMetricsDaily
-from stocker.models.signal_performance import SignalPerformance
-
-# Position Management
-from stocker.models.position_state import PositionState
-
-# Configuration
-from stocker.models.strategy_config import StrategyConfig
+from stocker.models.base import TimestampMixin, IdMixin, BulkInsertMixin
+
+_LAZY: dict[str, str] = {
+    # Market Data
+    "DailyBar": "stocker.models.daily_bar",
+    "IntradayBar": "stocker.models.intraday_bar",
+    "InstrumentInfo": "stocker.models.instrument_info",
+    "InstrumentMetrics": "stocker.models.instrument_metrics",
+    "CorporateAction": "stocker.models.corporate_action",
+    "MarketSentiment": "stocker.models.market_sentiment",
+    "MarketBreadth": "stocker.models.market_breadth",
+    "TradingUniverse": "stocker.models.trading_universe",
+    "InstrumentUniverse": "stocker.models.instrument_universe",
+    "InstrumentUniverseMember": "stocker.models.instrument_universe_member",
+    "StrategyUniverse": "stocker.models.strategy_universe",
+    "DerivedMetricDefinition": "stocker.models.derived_metric_definition",
+    "DerivedMetricValue": "stocker.models.derived_metric_value",
+    "DerivedMetricRuleSet": "stocker.models.derived_metric_rule_set",
+    "DerivedMetricRule": "stocker.models.derived_metric_rule",
+    "DerivedMetricScore": "stocker.models.derived_metric_score",
+
+    # Strategy & Portfolio
+    "Signal": "stocker.models.signal",
+    "TargetExposure": "stocker.models.target_exposure",
+
+    # Execution
+    "Order": "stocker.models.order",
+    "Fill": "stocker.models.fill",
+
+    # Accounting
+    "Holding": "stocker.models.holding",
+    "PortfolioState": "stocker.models.portfolio_state",
+    "PositionSnapshot": "stocker.models.position_snapshot",
+
+    # Performance Analytics
+    "PerformanceMetricsDaily": "stocker.models.performance_metrics_daily",
+    "ExecutionMetricsDaily": "stocker.models.execution_metrics_daily",
+    "SignalPerformance": "stocker.models.signal_performance",
+
+    # Position Management
+    "PositionState": "stocker.models.position_state",
+
+    # Configuration
+    "StrategyConfig": "stocker.models.strategy_config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(module), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+def load_all() -> None:
+    """Import every model module so all tables are registered on Base.metadata."""
+    for module in set(_LAZY.values()):
+        importlib.import_module(module)
+
 
 __all__ = [
     "TimestampMixin",
     "IdMixin",
+    "BulkInsertMixin",
     "DailyBar",
     "IntradayBar",
     "InstrumentInfo",
@@ -74,4 +108,5 @@ __all__ = [
     "PerformanceMetricsDaily",
     "ExecutionMetricsDaily",
     "SignalPerformance",
+    "load_all",
 ]
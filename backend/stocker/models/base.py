@@ -1,12 +1,148 @@
-from datetime import datetime
-from sqlalchemy import Column, DateTime, Integer
+import hashlib
+import struct
+import uuid
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterable, Optional, Sequence
+
+from sqlalchemy import Column, DateTime, Integer, Numeric, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import declarative_mixin
 
+# OHLC price columns: NUMERIC(14,4) storage, returned to Python as float.
+# Every consumer (signals, backtests, exits, sizing) works in float, so the
+# conversion happens once in SQLAlchemy's C result processor and no Decimal
+# objects are kept on loaded bars.
+PriceNumeric = Numeric(14, 4, asdecimal=False)
+
+# Naive UTC "now" evaluated by Postgres, once per statement, so inserts
+# (bulk ingest especially) carry no client-side timestamp per row
+UTC_NOW = text("timezone('utc', now())")
+
+# Rows per executemany call in BulkInsertMixin.bulk_insert
+BULK_INSERT_BATCH_SIZE = 10_000
+
+# Digest size of source_hash values (hex string is twice as long)
+SOURCE_HASH_BYTES = 16
+
+def row_hash(key: str, day: date, *values: float) -> str:
+    """
+    BLAKE2b-128 hex digest (32 chars) identifying an ingested row, for
+    source_hash columns. A provenance/change marker, not a security hash.
+
+    The output must stay stable for the same inputs so stored hashes can be
+    compared with fresh ones; changing the payload or digest makes every
+    stored hash stale, and the next ingest rewrites its window.
+
+    The day ordinal and numeric values are hashed as packed binary rather
+    than formatted into a string first.
+    """
+    digest = hashlib.blake2b(key.encode(), digest_size=SOURCE_HASH_BYTES)
+    digest.update(struct.pack(f"<I{len(values)}d", day.toordinal(), *values))
+    return digest.hexdigest()
+
 @declarative_mixin
 class TimestampMixin:
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = Column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow)
 
 @declarative_mixin
 class IdMixin:
     id = Column(Integer, primary_key=True, autoincrement=True)
+
+@declarative_mixin
+class BulkInsertMixin:
+    """
+    Batched Postgres upsert for ingest tables.
+
+    One compiled INSERT ... ON CONFLICT statement is executed with each
+    chunk of rows as executemany parameters, instead of rendering a fresh
+    multi-VALUES statement (and bind names) per batch.
+    """
+
+    @classmethod
+    async def bulk_insert(
+        cls,
+        session: AsyncSession,
+        rows: Iterable[dict[str, Any]],
+        *,
+        constraint: str,
+        update_columns: Optional[Sequence[str]] = None,
+        batch_size: int = BULK_INSERT_BATCH_SIZE,
+    ) -> int:
+        """
+        Insert rows, updating update_columns on conflict (or skipping the
+        row when none are given). Returns the number of rows sent.
+        """
+        stmt = cls._upsert_statement(constraint, tuple(update_columns or ()))
+
+        total = 0
+        it = iter(rows)
+        while chunk := list(islice(it, batch_size)):
+            await session.execute(stmt, chunk)
+            total += len(chunk)
+        return total
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _upsert_statement(cls, constraint: str, update_columns: tuple[str, ...]):
+        """
+        INSERT ... ON CONFLICT for this model, built once per (constraint,
+        update_columns). Reusing the statement object also reuses its SQL
+        compilation cache key, so repeat calls skip construction entirely.
+        """
+        stmt = insert(cls.__table__)
+        if update_columns:
+            set_ = {name: stmt.excluded[name] for name in update_columns}
+            # Callers never send created_at, so EXCLUDED.created_at is its
+            # UTC_NOW server default: the statement's own timestamp
+            set_["updated_at"] = stmt.excluded.created_at
+            return stmt.on_conflict_do_update(constraint=constraint, set_=set_)
+        return stmt.on_conflict_do_nothing(constraint=constraint)
+
+    @classmethod
+    async def bulk_copy(
+        cls,
+        session: AsyncSession,
+        columns: Sequence[str],
+        records: Iterable[Sequence[Any]],
+        *,
+        constraint: str,
+        update_columns: Optional[Sequence[str]] = None,
+    ) -> None:
+        """
+        Upsert records (tuples in columns order) through a temp staging table:
+        binary COPY in via asyncpg, then one INSERT ... SELECT ... ON CONFLICT
+        with the same conflict handling as bulk_insert.
+
+        Rows never become per-row parameter dicts; for large batches.
+        """
+        table = cls.__table__.name
+        # Unique per call, and dropped at commit/rollback even if a step fails
+        stage = f"_stage_{table}_{uuid.uuid4().hex[:12]}"
+        column_list = ", ".join(f'"{name}"' for name in columns)
+        if update_columns:
+            assignments = [f'"{name}" = EXCLUDED."{name}"' for name in update_columns]
+            # EXCLUDED.created_at is the UTC_NOW default (not a copied column)
+            assignments.append("updated_at = EXCLUDED.created_at")
+            on_conflict = f"DO UPDATE SET {', '.join(assignments)}"
+        else:
+            on_conflict = "DO NOTHING"
+
+        await session.execute(text(
+            f"CREATE TEMP TABLE {stage} ON COMMIT DROP "
+            f"AS SELECT {column_list} FROM {table} WITH NO DATA"
+        ))
+        # Same connection and transaction as the session
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            stage, records=records, columns=list(columns)
+        )
+        await session.execute(text(
+            f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {stage} "
+            f"ON CONFLICT ON CONSTRAINT {constraint} {on_conflict}"
+        ))
+        await session.execute(text(f"DROP TABLE {stage}"))
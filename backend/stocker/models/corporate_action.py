@@ -1,8 +1,8 @@
 from sqlalchemy import Column, String, Date, Numeric, UniqueConstraint
 from stocker.core.database import Base
-from stocker.models.base import IdMixin, TimestampMixin
+from stocker.models.base import BulkInsertMixin, IdMixin, TimestampMixin
 
-class CorporateAction(Base, IdMixin, TimestampMixin):
+class CorporateAction(Base, IdMixin, TimestampMixin, BulkInsertMixin):
     """
     Splits and dividends.
     """
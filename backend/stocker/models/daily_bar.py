@@ -1,24 +1,45 @@
-from sqlalchemy import Column, String, Date, Numeric, BigInteger, UniqueConstraint
+from sqlalchemy import DDL, Column, String, Date, BigInteger, UniqueConstraint, Index, event
 from stocker.core.database import Base
-from stocker.models.base import IdMixin, TimestampMixin
+from stocker.models.base import BulkInsertMixin, IdMixin, PriceNumeric, TimestampMixin
 
-class DailyBar(Base, IdMixin, TimestampMixin):
+class DailyBar(Base, IdMixin, TimestampMixin, BulkInsertMixin):
     """
     Daily OHLCV data.
     Source of truth for historical and daily intake data.
+
+    RANGE-partitioned by year on date; the partition key is part of the
+    primary key as Postgres requires.
     """
     __tablename__ = "prices_daily"
     __table_args__ = (
         UniqueConstraint("symbol", "date", name="uq_prices_daily_symbol_date"),
+        # Covers per-symbol price history reads without heap visits; also
+        # serves symbol-prefix lookups, so symbol has no index of its own
+        Index(
+            "ix_prices_daily_symbol_date_inc",
+            "symbol",
+            "date",
+            postgresql_include=["close", "adj_close", "volume"],
+        ),
+        {"postgresql_partition_by": "RANGE (date)"},
     )
 
-    symbol = Column(String(20), nullable=False, index=True)
-    date = Column(Date, nullable=False, index=True)
-    open = Column(Numeric(14, 4), nullable=False)
-    high = Column(Numeric(14, 4), nullable=False)
-    low = Column(Numeric(14, 4), nullable=False)
-    close = Column(Numeric(14, 4), nullable=False)
-    adj_close = Column(Numeric(14, 4), nullable=False)
+    symbol = Column(String(20), nullable=False)
+    date = Column(Date, primary_key=True, nullable=False, index=True)
+    open = Column(PriceNumeric, nullable=False)
+    high = Column(PriceNumeric, nullable=False)
+    low = Column(PriceNumeric, nullable=False)
+    close = Column(PriceNumeric, nullable=False)
+    adj_close = Column(PriceNumeric, nullable=False)
     volume = Column(BigInteger, nullable=False)
-    source = Column(String(50), nullable=False, default="yfinance")
-    source_hash = Column(String(64))  # SHA256 for deduplication
+    source = Column(String(50), nullable=False, server_default="yfinance")
+    source_hash = Column(String(64))  # see models.base.row_hash
+
+
+# Yearly partitions come from the migration and stocker.tasks.partitions;
+# a table built by create_all() gets a DEFAULT partition so inserts work
+event.listen(
+    DailyBar.__table__,
+    "after_create",
+    DDL("CREATE TABLE %(table)s_default PARTITION OF %(table)s DEFAULT"),
+)
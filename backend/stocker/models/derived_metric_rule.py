@@ -2,6 +2,8 @@ from sqlalchemy import Boolean, Column, ForeignKey, Integer, Numeric, String, In
 
 from stocker.core.database import Base
 from stocker.models.base import IdMixin, TimestampMixin
+import stocker.models.derived_metric_rule_set  # noqa: F401 - registers the ForeignKey target
+import stocker.models.derived_metric_definition  # noqa: F401 - registers the ForeignKey target
 
 
 class DerivedMetricRule(Base, IdMixin, TimestampMixin):
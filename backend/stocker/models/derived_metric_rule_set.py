@@ -2,6 +2,7 @@ from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Text, Uniqu
 
 from stocker.core.database import Base
 from stocker.models.base import IdMixin, TimestampMixin
+import stocker.models.instrument_universe  # noqa: F401 - registers the ForeignKey target
 
 
 class DerivedMetricRuleSet(Base, IdMixin, TimestampMixin):
@@ -1,10 +1,11 @@
-from sqlalchemy import Column, Date, ForeignKey, Integer, Numeric, String, UniqueConstraint, Index, Boolean
+from sqlalchemy import Column, Date, ForeignKey, Integer, Numeric, String, UniqueConstraint, Index, Boolean, text
 
 from stocker.core.database import Base
-from stocker.models.base import IdMixin, TimestampMixin
+from stocker.models.base import BulkInsertMixin, IdMixin, TimestampMixin
+import stocker.models.derived_metric_rule_set  # noqa: F401 - registers the ForeignKey target
 
 
-class DerivedMetricScore(Base, IdMixin, TimestampMixin):
+class DerivedMetricScore(Base, IdMixin, TimestampMixin, BulkInsertMixin):
     """Materialized composite scores for rule sets."""
 
     __tablename__ = "derived_metric_scores"
@@ -25,4 +26,4 @@ class DerivedMetricScore(Base, IdMixin, TimestampMixin):
     score = Column(Numeric(20, 8))
     rank = Column(Integer)
     percentile = Column(Numeric(6, 4))
-    passes_required = Column(Boolean, nullable=False, default=False)
+    passes_required = Column(Boolean, nullable=False, server_default=text('false'))
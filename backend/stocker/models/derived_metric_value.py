@@ -1,10 +1,11 @@
 from sqlalchemy import Column, Date, ForeignKey, Integer, Numeric, String, UniqueConstraint, Index
 
 from stocker.core.database import Base
-from stocker.models.base import IdMixin, TimestampMixin
+from stocker.models.base import BulkInsertMixin, IdMixin, TimestampMixin
+import stocker.models.derived_metric_definition  # noqa: F401 - registers the ForeignKey target
 
 
-class DerivedMetricValue(Base, IdMixin, TimestampMixin):
+class DerivedMetricValue(Base, IdMixin, TimestampMixin, BulkInsertMixin):
     """Computed metric values per symbol/date with normalization for ranking."""
 
     __tablename__ = "derived_metric_values"
@@ -16,7 +17,12 @@ class DerivedMetricValue(Base, IdMixin, TimestampMixin):
             name="uq_derived_metric_values_symbol_date_metric",
         ),
         Index("ix_derived_metric_values_metric_date", "metric_id", "as_of_date"),
-        Index("ix_derived_metric_values_symbol_date", "symbol", "as_of_date"),
+        Index(
+            "ix_derived_metric_values_symbol_date_inc",
+            "symbol",
+            "as_of_date",
+            postgresql_include=["value", "zscore", "percentile"],
+        ),
     )
 
     symbol = Column(String(20), nullable=False, index=True)
@@ -27,4 +33,4 @@ class DerivedMetricValue(Base, IdMixin, TimestampMixin):
     percentile = Column(Numeric(6, 4))
     rank = Column(Integer)
     source = Column(String(50), nullable=False)
-    calc_version = Column(String(20), nullable=False, default="v1")
+    calc_version = Column(String(20), nullable=False, server_default="v1")
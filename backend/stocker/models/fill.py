@@ -2,6 +2,7 @@ from sqlalchemy import Column, String, Numeric, Uuid, TIMESTAMP, ForeignKey
 from sqlalchemy.orm import relationship
 from stocker.core.database import Base
 from stocker.models.base import IdMixin
+import stocker.models.order  # noqa: F401 - registers the relationship target
 
 class Fill(Base, IdMixin):
     """
@@ -19,4 +20,4 @@ class Fill(Base, IdMixin):
     commission = Column(Numeric(10, 4), default=0)
     exchange = Column(String(50))
 
-    order = relationship("Order", back_populates="fills")
+    order = relationship("Order", back_populates="fills", lazy="raise")
@@ -1,7 +1,8 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String, UniqueConstraint
 
 from stocker.core.database import Base
 from stocker.models.base import IdMixin, TimestampMixin
+import stocker.models.instrument_universe  # noqa: F401 - registers the ForeignKey target
 
 
 class InstrumentUniverseMember(Base, IdMixin, TimestampMixin):
@@ -10,6 +11,8 @@ class InstrumentUniverseMember(Base, IdMixin, TimestampMixin):
     __tablename__ = "instrument_universe_member"
     __table_args__ = (
         UniqueConstraint("universe_id", "symbol", name="uq_universe_symbol"),
+        # Covers paginated active-member listings (index-only scan)
+        Index("ix_universe_member_universe_deleted_symbol", "universe_id", "is_deleted", "symbol"),
     )
 
     universe_id = Column(Integer, ForeignKey("instrument_universe.id"), nullable=False, index=True)
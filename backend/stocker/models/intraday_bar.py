@@ -1,21 +1,34 @@
-from sqlalchemy import Column, String, TIMESTAMP, Numeric, BigInteger, UniqueConstraint
+from sqlalchemy import DDL, Column, String, TIMESTAMP, BigInteger, UniqueConstraint, event
 from stocker.core.database import Base
-from stocker.models.base import IdMixin, TimestampMixin
+from stocker.models.base import BulkInsertMixin, IdMixin, PriceNumeric, TimestampMixin
 
-class IntradayBar(Base, IdMixin, TimestampMixin):
+class IntradayBar(Base, IdMixin, TimestampMixin, BulkInsertMixin):
     """
     Historical and live intraday data (e.g., 1-minute, 5-minute bars).
+
+    RANGE-partitioned by month on timestamp; the partition key is part of
+    the primary key as Postgres requires.
     """
     __tablename__ = "prices_intraday"
     __table_args__ = (
         UniqueConstraint("symbol", "timestamp", "interval", name="uq_prices_intraday_symbol_ts_interval"),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
     )
 
     symbol = Column(String(20), nullable=False, index=True)
-    timestamp = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
+    timestamp = Column(TIMESTAMP(timezone=True), primary_key=True, nullable=False, index=True)
     interval = Column(String(10), nullable=False)  # e.g., '1m', '5m', '1h'
-    open = Column(Numeric(14, 4), nullable=False)
-    high = Column(Numeric(14, 4), nullable=False)
-    low = Column(Numeric(14, 4), nullable=False)
-    close = Column(Numeric(14, 4), nullable=False)
+    open = Column(PriceNumeric, nullable=False)
+    high = Column(PriceNumeric, nullable=False)
+    low = Column(PriceNumeric, nullable=False)
+    close = Column(PriceNumeric, nullable=False)
     volume = Column(BigInteger, nullable=False)
+
+
+# Monthly partitions come from the migration and stocker.tasks.partitions;
+# a table built by create_all() gets a DEFAULT partition so inserts work
+event.listen(
+    IntradayBar.__table__,
+    "after_create",
+    DDL("CREATE TABLE %(table)s_default PARTITION OF %(table)s DEFAULT"),
+)
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, Date, Numeric, Integer, UniqueConstraint
+from sqlalchemy import Column, String, Date, Float, Integer, UniqueConstraint
 from stocker.core.database import Base
-from stocker.models.base import IdMixin, TimestampMixin
+from stocker.models.base import BulkInsertMixin, IdMixin, TimestampMixin
 
-class MarketSentiment(Base, IdMixin, TimestampMixin):
+class MarketSentiment(Base, IdMixin, TimestampMixin, BulkInsertMixin):
     """
     Aggregated sentiment data derived from news/social.
     """
@@ -21,10 +21,11 @@ class MarketSentiment(Base, IdMixin, TimestampMixin):
     symbol = Column(String(20), index=True, nullable=True)  # Nullable if market-wide
     date = Column(Date, nullable=False, index=True)
     source = Column(String(50), nullable=False)
-    period = Column(String(10), nullable=False, default="WEEKLY")
-    window_days = Column(Integer, nullable=False, default=7)
-    sentiment_score = Column(Numeric(5, 4), nullable=False)  # -1.0 to 1.0
-    sentiment_magnitude = Column(Numeric(10, 4))
+    period = Column(String(10), nullable=False, server_default="WEEKLY")
+    window_days = Column(Integer, nullable=False, server_default="7")
+    # Model outputs, not exact quantities: DOUBLE PRECISION, read back as float
+    sentiment_score = Column(Float, nullable=False)  # -1.0 to 1.0
+    sentiment_magnitude = Column(Float)
     article_count = Column(Integer)
     positive_count = Column(Integer)
     neutral_count = Column(Integer)
@@ -2,6 +2,7 @@ from sqlalchemy import Column, String, Date, Numeric, Uuid, TIME, TIMESTAMP, Uni
 from sqlalchemy.orm import relationship
 from stocker.core.database import Base
 from stocker.models.base import IdMixin, TimestampMixin
+import stocker.models.fill  # noqa: F401 - registers the relationship target
 import uuid
 
 class Order(Base, IdMixin, TimestampMixin):
@@ -24,5 +25,5 @@ class Order(Base, IdMixin, TimestampMixin):
     broker_order_id = Column(String(100))
     rejection_reason = Column(Text)
 
-    # Relationship to executions
-    fills = relationship("Fill", back_populates="order")
+    # Relationship to executions; load explicitly (selectinload), never lazily
+    fills = relationship("Fill", back_populates="order", lazy="raise")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date, Numeric, UniqueConstraint, Index
+from sqlalchemy import Column, String, Date, Float, Numeric, UniqueConstraint, Index
 from stocker.core.database import Base
 from stocker.models.base import IdMixin, TimestampMixin
 
@@ -17,10 +17,10 @@ class PerformanceMetricsDaily(Base, IdMixin, TimestampMixin):
     daily_return = Column(Numeric(12, 8))
     daily_pnl = Column(Numeric(18, 4))
 
-    # Rolling metrics (30-day lookback)
-    rolling_sharpe_30d = Column(Numeric(10, 6))
-    rolling_vol_30d = Column(Numeric(10, 6))
-    rolling_max_dd_30d = Column(Numeric(10, 6))
+    # Rolling metrics (30-day lookback); statistical estimates, so stored as float
+    rolling_sharpe_30d = Column(Float)
+    rolling_vol_30d = Column(Float)
+    rolling_max_dd_30d = Column(Float)
 
     # Exposure breakdown
     long_exposure = Column(Numeric(10, 6))
@@ -28,5 +28,10 @@ class PerformanceMetricsDaily(Base, IdMixin, TimestampMixin):
 
     __table_args__ = (
         UniqueConstraint('portfolio_id', 'date', name='uq_perf_metrics_daily_port_date'),
-        Index('ix_perf_metrics_daily_portfolio_date', 'portfolio_id', 'date'),
+        Index(
+            'ix_perf_metrics_daily_portfolio_date_inc',
+            'portfolio_id',
+            'date',
+            postgresql_include=['daily_return', 'daily_pnl'],
+        ),
     )
@@ -5,12 +5,12 @@ Tracks entry prices, peak/trough prices, and signal persistence
 for implementing trailing stops, ATR exits, and persistence filters.
 """
 
-from sqlalchemy import Column, String, SmallInteger, Integer, Date, Numeric, UniqueConstraint
+from sqlalchemy import Column, String, SmallInteger, Integer, Date, Float, Numeric, UniqueConstraint, Index, text
 from stocker.core.database import Base
-from stocker.models.base import TimestampMixin, IdMixin
+from stocker.models.base import PriceNumeric, TimestampMixin, IdMixin, BulkInsertMixin
 
 
-class PositionState(Base, IdMixin, TimestampMixin):
+class PositionState(Base, IdMixin, TimestampMixin, BulkInsertMixin):
     """
     Track position state for exit rule evaluation.
 
@@ -18,11 +18,11 @@ class PositionState(Base, IdMixin, TimestampMixin):
     """
     __tablename__ = "position_states"
 
-    portfolio_id = Column(String(50), nullable=False, index=True)
-    symbol = Column(String(20), nullable=False, index=True)
+    portfolio_id = Column(String(50), nullable=False)
+    symbol = Column(String(20), nullable=False)
 
     # Current position direction: -1 (short), 0 (flat), 1 (long)
-    direction = Column(SmallInteger, nullable=False, default=0)
+    direction = Column(SmallInteger, nullable=False, server_default=text('0'))
 
     # Entry tracking
     entry_date = Column(Date, nullable=True)
@@ -31,20 +31,28 @@ class PositionState(Base, IdMixin, TimestampMixin):
     # Peak/Trough tracking for trailing stops
     # For longs: track highest price since entry
     # For shorts: track lowest price since entry
-    peak_price = Column(Numeric(14, 4), nullable=True)
-    trough_price = Column(Numeric(14, 4), nullable=True)
+    peak_price = Column(PriceNumeric, nullable=True)
+    trough_price = Column(PriceNumeric, nullable=True)
 
     # Persistence tracking for signal flip filtering
     # When signal starts flipping, track how many days it persists
     pending_direction = Column(SmallInteger, nullable=True)  # Direction signal is trying to flip to
     signal_flip_date = Column(Date, nullable=True)  # When signal started flipping
-    consecutive_flip_days = Column(Integer, default=0)  # Days signal has persisted in new direction
+    consecutive_flip_days = Column(Integer, server_default=text('0'))  # Days signal has persisted in new direction
 
     # ATR at entry (for ATR-based exits)
-    entry_atr = Column(Numeric(10, 4), nullable=True)
+    entry_atr = Column(Float, nullable=True)
 
     __table_args__ = (
+        # One row per portfolio/symbol, updated in place (flat rows included);
+        # also serves per-portfolio sweeps as its leading column
         UniqueConstraint('portfolio_id', 'symbol', name='uq_position_states_port_sym'),
+        # Exit checks only look at open positions
+        Index(
+            'ix_position_states_port_active',
+            'portfolio_id',
+            postgresql_where=text('direction != 0'),
+        ),
     )
 
     def __repr__(self) -> str:
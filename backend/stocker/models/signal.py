@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, Date, Numeric, SmallInteger, UniqueConstraint
+from sqlalchemy import Column, String, Date, Float, SmallInteger, UniqueConstraint
 from stocker.core.database import Base
-from stocker.models.base import IdMixin, TimestampMixin
+from stocker.models.base import IdMixin, TimestampMixin, BulkInsertMixin
 
-class Signal(Base, IdMixin, TimestampMixin):
+class Signal(Base, IdMixin, TimestampMixin, BulkInsertMixin):
     """
     Trading signals.
     """
@@ -14,7 +14,7 @@ class Signal(Base, IdMixin, TimestampMixin):
     strategy_version = Column(String(50), nullable=False)
     symbol = Column(String(20), nullable=False, index=True)
     date = Column(Date, nullable=False, index=True)
-    lookback_return = Column(Numeric(10, 6))
-    ewma_vol = Column(Numeric(10, 6))
+    lookback_return = Column(Float)
+    ewma_vol = Column(Float)
     direction = Column(SmallInteger)  # -1, 0, 1
-    target_weight = Column(Numeric(10, 6))
+    target_weight = Column(Float)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date, Numeric, Integer, SmallInteger, Boolean, Index
+from sqlalchemy import Column, String, Date, Float, Numeric, Integer, SmallInteger, Boolean, Index, text
 from stocker.core.database import Base
 from stocker.models.base import IdMixin, TimestampMixin
 
@@ -25,15 +25,23 @@ class SignalPerformance(Base, IdMixin, TimestampMixin):
     exit_date = Column(Date)
     exit_price = Column(Numeric(14, 4))
     holding_days = Column(Integer)
-    realized_return = Column(Numeric(12, 8))
+    realized_return = Column(Float)
 
     # Classification
     is_winner = Column(Boolean)
     exit_reason = Column(String(50))  # 'signal_flip', 'trailing_stop', 'atr_exit', etc.
 
     __table_args__ = (
-        Index('ix_signal_perf_portfolio', 'portfolio_id'),
-        Index('ix_signal_perf_symbol', 'symbol'),
-        Index('ix_signal_perf_signal_date', 'signal_date'),
-        Index('ix_signal_perf_exit_date', 'exit_date'),
+        # Ledger: open record for a portfolio/symbol/direction
+        Index(
+            'ix_signal_perf_open',
+            'portfolio_id', 'symbol', 'direction',
+            postgresql_where=text('exit_date IS NULL'),
+        ),
+        # Hit-rate analytics: closed records for a portfolio by signal date
+        Index(
+            'ix_signal_perf_closed_port_sigdate',
+            'portfolio_id', 'signal_date',
+            postgresql_where=text('exit_date IS NOT NULL'),
+        ),
     )
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, UniqueConstraint
 
 from stocker.core.database import Base
 from stocker.models.base import IdMixin, TimestampMixin
+import stocker.models.instrument_universe  # noqa: F401 - registers the ForeignKey target
 
 
 class StrategyUniverse(Base, IdMixin, TimestampMixin):
@@ -10,7 +11,13 @@ class StrategyUniverse(Base, IdMixin, TimestampMixin):
     __tablename__ = "strategy_universe"
     __table_args__ = (
         UniqueConstraint("strategy_id", name="uq_strategy_universe_strategy"),
+        # Strategy -> universe lookups are answered from the index alone
+        Index(
+            "ix_strategy_universe_strategy_cov",
+            "strategy_id",
+            postgresql_include=["universe_id"],
+        ),
     )
 
-    strategy_id = Column(String(100), nullable=False, index=True)
+    strategy_id = Column(String(100), nullable=False)
     universe_id = Column(Integer, ForeignKey("instrument_universe.id"), nullable=False)
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, Date, Numeric, Boolean, Text, UniqueConstraint
+from sqlalchemy import Column, String, Date, Float, Numeric, Boolean, Text, UniqueConstraint, text
 from stocker.core.database import Base
-from stocker.models.base import IdMixin, TimestampMixin
+from stocker.models.base import IdMixin, TimestampMixin, BulkInsertMixin
 
-class TargetExposure(Base, IdMixin, TimestampMixin):
+class TargetExposure(Base, IdMixin, TimestampMixin, BulkInsertMixin):
     """
     Target portfolio exposures.
     """
@@ -15,6 +15,6 @@ class TargetExposure(Base, IdMixin, TimestampMixin):
     date = Column(Date, nullable=False)
     symbol = Column(String(20), nullable=False)
     target_exposure = Column(Numeric(10, 6), nullable=False)
-    scaling_factor = Column(Numeric(5, 4), default=1.0)
-    is_capped = Column(Boolean, default=False)
+    scaling_factor = Column(Float, server_default=text('1.0'))
+    is_capped = Column(Boolean, server_default=text('false'))
     reason = Column(Text)
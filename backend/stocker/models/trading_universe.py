@@ -1,10 +1,10 @@
 from sqlalchemy import Column, Date, Integer, Numeric, String, UniqueConstraint
 
 from stocker.core.database import Base
-from stocker.models.base import IdMixin, TimestampMixin
+from stocker.models.base import BulkInsertMixin, IdMixin, TimestampMixin
 
 
-class TradingUniverse(Base, IdMixin, TimestampMixin):
+class TradingUniverse(Base, IdMixin, TimestampMixin, BulkInsertMixin):
     """Daily snapshot of the dynamic trading universe."""
 
     __tablename__ = "trading_universe"
@@ -17,7 +17,8 @@ class TradingUniverse(Base, IdMixin, TimestampMixin):
         ),
     )
 
-    as_of_date = Column(Date, nullable=False, index=True)
+    # Date lookups use the leading column of the unique constraint
+    as_of_date = Column(Date, nullable=False)
     symbol = Column(String(20), nullable=False, index=True)
     rank = Column(Integer, nullable=False)
     avg_dollar_volume = Column(Numeric(20, 2))
@@ -2,6 +2,12 @@ from celery import Celery
 from celery.schedules import crontab
 
 from stocker.core.config import settings
+from stocker.core.database import use_null_pool
+
+# Tasks run under a fresh asyncio.run() loop each, which pooled asyncpg
+# connections cannot outlive; workers (and anything importing the tasks)
+# open a connection per session instead
+use_null_pool()
 
 app = Celery("stocker")
 app.conf.broker_url = settings.CELERY_BROKER_URL
@@ -11,6 +17,7 @@ app.conf.enable_utc = False
 
 app.autodiscover_tasks(["stocker"])
 
+
 app.conf.beat_schedule = {
     "ingest-market-data": {
         "task": "stocker.tasks.market_data.ingest_market_data",
@@ -88,4 +95,8 @@ app.conf.beat_schedule = {
         ),
         "options": {"expires": 3600},
     },
+    "ensure-price-partitions": {
+        "task": "stocker.tasks.partitions.ensure_price_partitions",
+        "schedule": crontab(hour=0, minute=30),
+    },
 }
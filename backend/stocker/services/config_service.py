@@ -7,9 +7,10 @@ DB values take precedence over environment variables.
 
 import logging
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import func, select, update
+from sqlalchemy import String, column, func, select, update, values
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -243,6 +244,29 @@ TRADING_PARAMS: Dict[str, Dict[str, Any]] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class ParamMeta:
+    """Typed view of one TRADING_PARAMS entry."""
+    key: str
+    value_type: str
+    category: str
+    description: str
+    tooltip: Optional[str] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    options: Optional[tuple[str, ...]] = None
+
+
+# Built once at import; validation and seeding read attributes, not dict keys
+TRADING_PARAMS_BY_KEY: Dict[str, ParamMeta] = {
+    key: ParamMeta(
+        key=key,
+        **{**metadata, "options": tuple(metadata["options"]) if "options" in metadata else None},
+    )
+    for key, metadata in TRADING_PARAMS.items()
+}
+
+
 class ConfigService:
     """
     Service for managing strategy configuration.
@@ -294,8 +318,9 @@ class ConfigService:
             ValueError: If value fails validation
         """
         # Validate the value
-        if key in TRADING_PARAMS:
-            self._validate_value(key, value, TRADING_PARAMS[key])
+        param = TRADING_PARAMS_BY_KEY.get(key)
+        if param is not None:
+            self._validate_value(value, param)
 
         async with self._get_session() as session:
             stmt = (
@@ -322,20 +347,32 @@ class ConfigService:
         """
         # Validate all values first
         for key, value in updates.items():
-            if key in TRADING_PARAMS:
-                self._validate_value(key, value, TRADING_PARAMS[key])
+            param = TRADING_PARAMS_BY_KEY.get(key)
+            if param is not None:
+                self._validate_value(value, param)
+
+        if not updates:
+            return []
+
+        # UPDATE ... FROM (VALUES ...): every key in one statement
+        new_values = values(
+            column("key", String), column("value", String), name="new_values"
+        ).data(list(updates.items()))
 
         async with self._get_session() as session:
+            stmt = (
+                update(StrategyConfig)
+                .where(StrategyConfig.key == new_values.c.key)
+                .values(value=new_values.c.value, updated_at=func.now())
+                .returning(StrategyConfig)
+            )
+            result = await session.execute(stmt)
+            rows = {row.key: row for row in result.scalars().all()}
+
+            # Keep the request order; unknown keys are skipped
             updated = []
             for key, value in updates.items():
-                stmt = (
-                    update(StrategyConfig)
-                    .where(StrategyConfig.key == key)
-                    .values(value=value, updated_at=func.now())
-                    .returning(StrategyConfig)
-                )
-                result = await session.execute(stmt)
-                row = result.scalar_one_or_none()
+                row = rows.get(key)
                 if row:
                     updated.append(row)
                     logger.info("Config updated: %s = %s", key, value)
@@ -346,7 +383,7 @@ class ConfigService:
         async with self._get_session() as session:
             stmt = select(func.distinct(StrategyConfig.category)).order_by(StrategyConfig.category)
             result = await session.execute(stmt)
-            return [row[0] for row in result.all()]
+            return list(result.scalars().all())
 
     async def seed_missing_configs(self) -> int:
         """
@@ -358,40 +395,39 @@ class ConfigService:
             Number of entries seeded
         """
         async with self._get_session() as session:
-            seeded = 0
-            for key, metadata in TRADING_PARAMS.items():
-                # Check if key exists
-                stmt = select(StrategyConfig).where(StrategyConfig.key == key)
-                result = await session.execute(stmt)
-                existing = result.scalar_one_or_none()
-
-                if existing is None:
-                    # Get value from settings
-                    env_value = getattr(settings, key, None)
-                    if env_value is None:
-                        logger.warning("Config key %s not found in settings, skipping", key)
-                        continue
-
-                    # Convert to string
-                    value = str(env_value)
-                    if metadata["value_type"] == "bool":
-                        value = value.lower()
-
-                    # Insert
-                    config = StrategyConfig(
-                        key=key,
-                        value=value,
-                        value_type=metadata["value_type"],
-                        category=metadata["category"],
-                        description=metadata["description"],
-                    )
-                    session.add(config)
-                    seeded += 1
-                    logger.info("Seeded config: %s = %s", key, value)
-
-            if seeded > 0:
-                await session.flush()
-            return seeded
+            result = await session.execute(select(StrategyConfig.key))
+            existing = set(result.scalars().all())
+
+            rows = []
+            for param in TRADING_PARAMS_BY_KEY.values():
+                if param.key in existing:
+                    continue
+
+                # Get value from settings
+                env_value = getattr(settings, param.key, None)
+                if env_value is None:
+                    logger.warning("Config key %s not found in settings, skipping", param.key)
+                    continue
+
+                # Convert to string
+                value = str(env_value)
+                if param.value_type == "bool":
+                    value = value.lower()
+
+                rows.append({
+                    "key": param.key,
+                    "value": value,
+                    "value_type": param.value_type,
+                    "category": param.category,
+                    "description": param.description,
+                })
+                logger.info("Seeded config: %s = %s", param.key, value)
+
+            if rows:
+                # Another instance may seed concurrently; first writer wins
+                stmt = insert(StrategyConfig).on_conflict_do_nothing(index_elements=["key"])
+                await session.execute(stmt, rows)
+            return len(rows)
 
     async def get_value(self, key: str) -> Any:
         """
@@ -424,37 +460,37 @@ class ConfigService:
         else:
             return value
 
-    def _validate_value(self, key: str, value: str, metadata: Dict[str, Any]) -> None:
+    def _validate_value(self, value: str, param: ParamMeta) -> None:
         """
         Validate a configuration value.
 
         Raises:
             ValueError: If validation fails
         """
-        value_type = metadata["value_type"]
+        key = param.key
 
         try:
-            if value_type == "int":
+            if param.value_type == "int":
                 int_val = int(value)
-                if "min" in metadata and int_val < metadata["min"]:
-                    raise ValueError(f"{key} must be >= {metadata['min']}")
-                if "max" in metadata and int_val > metadata["max"]:
-                    raise ValueError(f"{key} must be <= {metadata['max']}")
+                if param.min is not None and int_val < param.min:
+                    raise ValueError(f"{key} must be >= {param.min}")
+                if param.max is not None and int_val > param.max:
+                    raise ValueError(f"{key} must be <= {param.max}")
 
-            elif value_type == "float":
+            elif param.value_type == "float":
                 float_val = float(value)
-                if "min" in metadata and float_val < metadata["min"]:
-                    raise ValueError(f"{key} must be >= {metadata['min']}")
-                if "max" in metadata and float_val > metadata["max"]:
-                    raise ValueError(f"{key} must be <= {metadata['max']}")
+                if param.min is not None and float_val < param.min:
+                    raise ValueError(f"{key} must be >= {param.min}")
+                if param.max is not None and float_val > param.max:
+                    raise ValueError(f"{key} must be <= {param.max}")
 
-            elif value_type == "bool":
+            elif param.value_type == "bool":
                 if value.lower() not in ("true", "false", "1", "0", "yes", "no"):
                     raise ValueError(f"{key} must be a boolean value")
 
-            elif value_type == "str":
-                if "options" in metadata and value not in metadata["options"]:
-                    raise ValueError(f"{key} must be one of: {metadata['options']}")
+            elif param.value_type == "str":
+                if param.options is not None and value not in param.options:
+                    raise ValueError(f"{key} must be one of: {list(param.options)}")
 
         except ValueError:
             raise
@@ -1,20 +1,40 @@
-import hashlib
 import logging
+import random
 import time
-from datetime import date
+from datetime import date, timedelta
 from typing import Any, Optional
 
+import pandas as pd
 import yfinance as yf
 
 from stocker.core.config import settings
+from stocker.models.base import row_hash
 from stocker.services.corporate_actions.base import CorporateActionsProvider
 
 logger = logging.getLogger(__name__)
 
+# Tickers per yf.download call
+ACTIONS_BATCH_SIZE = 50
+
+# yf.download action column -> corporate_actions.action_type
+ACTION_COLUMNS = {"Dividends": "DIVIDEND", "Stock Splits": "SPLIT"}
+
 
 class YFinanceCorporateActionsProvider(CorporateActionsProvider):
     """yfinance provider for splits and dividends."""
 
+    def __init__(
+        self,
+        max_retries: int | None = None,
+        backoff_sec: float | None = None,
+    ) -> None:
+        self.max_retries = (
+            settings.CORP_ACTIONS_MAX_RETRIES if max_retries is None else max_retries
+        )
+        self.backoff_sec = (
+            settings.CORP_ACTIONS_RETRY_BACKOFF_SEC if backoff_sec is None else backoff_sec
+        )
+
     def fetch_corporate_actions(
         self,
         symbols: list[str],
@@ -25,101 +45,124 @@ class YFinanceCorporateActionsProvider(CorporateActionsProvider):
             return []
 
         records: list[dict[str, Any]] = []
-        for symbol in symbols:
-            actions = self._fetch_actions_with_retry(symbol)
-            if actions is None or actions.empty:
-                continue
-
-            for action_date, row in actions.iterrows():
-                action_day = _to_date(action_date)
-                if action_day is None:
-                    continue
-                if action_day < start_date or action_day > end_date:
+        for start in range(0, len(symbols), ACTIONS_BATCH_SIZE):
+            batch = symbols[start:start + ACTIONS_BATCH_SIZE]
+            frames = self._fetch_batch_with_retry(batch, start_date, end_date)
+
+            for symbol, actions in frames.items():
+                if actions.empty:
                     continue
 
-                dividend = _num(row.get("Dividends"))
-                split = _num(row.get("Stock Splits"))
-
-                if dividend and dividend > 0:
-                    records.append(
-                        _build_record(
-                            symbol,
-                            action_day,
-                            "DIVIDEND",
-                            dividend,
-                        )
-                    )
-                if split and split > 0:
-                    records.append(
-                        _build_record(
-                            symbol,
-                            action_day,
-                            "SPLIT",
-                            split,
-                        )
+                days = pd.Index(actions.index.date)
+                actions = actions[(days >= start_date) & (days <= end_date)]
+                for column, action_type in ACTION_COLUMNS.items():
+                    if column not in actions.columns:
+                        continue
+                    values = pd.to_numeric(actions[column], errors="coerce")
+                    values = values[values > 0]
+                    records.extend(
+                        _build_record(symbol, action_day, action_type, float(value))
+                        for action_day, value in zip(values.index.date, values.to_numpy())
                     )
 
         return records
 
-    def _fetch_actions_with_retry(self, symbol: str) -> Optional[Any]:
-        max_retries = max(1, settings.CORP_ACTIONS_MAX_RETRIES)
-        backoff = max(0.0, settings.CORP_ACTIONS_RETRY_BACKOFF_SEC)
-        ticker = yf.Ticker(symbol)
-
+    def _fetch_batch_with_retry(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        yf.download the batch (requests issued on yfinance's thread pool) and
+        split it into per-ticker action frames.
+
+        yf.download only logs per-ticker failures (rate limits, timeouts) and
+        leaves those tickers' columns all-NaN, so failed tickers are
+        re-requested on their own with jittered exponential backoff, and any
+        still failing after the last attempt are logged rather than read as
+        "no actions".
+        """
+        max_retries = max(1, self.max_retries)
+        backoff = max(0.0, self.backoff_sec)
+
+        frames: dict[str, pd.DataFrame] = {}
+        pending = list(symbols)
         for attempt in range(1, max_retries + 1):
             try:
-                actions = ticker.actions
-                if actions is None or actions.empty:
-                    logger.info("yfinance returned empty actions for %s", symbol)
-                    return None
-                return actions
+                data = yf.download(
+                    tickers=pending,
+                    start=start_date.isoformat(),
+                    # end is exclusive
+                    end=(end_date + timedelta(days=1)).isoformat(),
+                    interval="1d",
+                    actions=True,
+                    group_by="ticker",
+                    auto_adjust=False,
+                    threads=True,
+                    progress=False,
+                )
             except Exception as exc:
                 logger.warning(
-                    "yfinance actions fetch failed for %s (attempt %s/%s): %s",
-                    symbol,
+                    "yfinance actions fetch failed for %s symbols (attempt %s/%s): %s",
+                    len(pending),
                     attempt,
                     max_retries,
                     exc,
                 )
+                data = None
+
+            if data is not None and not data.empty:
+                for symbol in pending:
+                    frame = _ticker_frame(data, symbol, len(pending))
+                    if frame is not None:
+                        frames[symbol] = frame
+                pending = [symbol for symbol in pending if symbol not in frames]
+            if not pending:
+                break
 
             if attempt < max_retries and backoff:
                 sleep_for = backoff * (2 ** (attempt - 1))
-                time.sleep(sleep_for)
+                # Up to 10% jitter so concurrent syncs don't retry in lockstep
+                time.sleep(sleep_for + random.uniform(0, sleep_for * 0.1))
+
+        if pending:
+            logger.warning(
+                "yfinance returned no data for %s symbols after %s attempts: %s",
+                len(pending),
+                max_retries,
+                ", ".join(pending),
+            )
+        return frames
+
+
+def _ticker_frame(data: pd.DataFrame, symbol: str, batch_size: int) -> Optional[pd.DataFrame]:
+    """
+    Dividends/Stock Splits columns for one ticker of a yf.download result,
+    or None when the ticker is missing or its Close column is all-NaN (how
+    yf.download reports a failed ticker).
+    """
+    if isinstance(data.columns, pd.MultiIndex):
+        if symbol not in data.columns.get_level_values(0):
+            return None
+        frame = data[symbol]
+    elif batch_size == 1:
+        frame = data
+    else:
+        return None
 
+    if "Close" not in frame.columns or frame["Close"].isna().all():
         return None
+    columns = [col for col in ACTION_COLUMNS if col in frame.columns]
+    return frame[columns]
 
 
 def _build_record(symbol: str, action_day: date, action_type: str, value: float) -> dict[str, Any]:
-    payload = f"{symbol}|{action_type}|{action_day.isoformat()}|{value}"
     return {
         "symbol": symbol,
         "date": action_day,
         "action_type": action_type,
         "value": value,
         "source": "yfinance",
-        "source_hash": hashlib.sha256(payload.encode("utf-8")).hexdigest(),
+        "source_hash": row_hash(f"{symbol}|{action_type}", action_day, value),
     }
-
-
-def _num(value: Any) -> Optional[float]:
-    if value is None:
-        return None
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
-
-
-def _to_date(value: Any) -> Optional[date]:
-    if value is None:
-        return None
-    from datetime import datetime as _dt
-
-    if isinstance(value, _dt):
-        return value.date()
-    if isinstance(value, date):
-        return value
-    try:
-        return value.to_pydatetime().date()
-    except Exception:
-        return None
@@ -1,8 +1,9 @@
+import asyncio
 import logging
 from datetime import date
-from typing import Any
 
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from stocker.core.database import AsyncSessionLocal
 from stocker.models.corporate_action import CorporateAction
@@ -10,6 +11,13 @@ from stocker.services.corporate_actions import get_corporate_actions_provider
 
 logger = logging.getLogger(__name__)
 
+# Columns refreshed when an action is re-ingested
+UPDATE_COLUMNS = tuple(
+    column.name
+    for column in CorporateAction.__table__.columns
+    if column.name not in {"id", "symbol", "date", "action_type", "source", "created_at", "updated_at"}
+)
+
 
 class CorporateActionsService:
     """Service to fetch and store corporate actions."""
@@ -27,34 +35,57 @@ class CorporateActionsService:
         if not symbols:
             return 0
 
-        records = self.provider.fetch_corporate_actions(symbols, start_date, end_date)
+        # Blocking HTTP and retry sleeps run off the event loop
+        records = await asyncio.to_thread(
+            self.provider.fetch_corporate_actions, symbols, start_date, end_date
+        )
         if not records:
             logger.warning("No corporate actions returned from provider")
             return 0
 
         async with AsyncSessionLocal() as session:
-            stmt = insert(CorporateAction).values(records)
-            stmt = stmt.on_conflict_do_update(
-                constraint="uq_corporate_actions_symbol_date_type_source",
-                set_=self._build_update_map(stmt),
-            )
             try:
-                await session.execute(stmt)
+                # Re-fetched actions that are already stored hash identically
+                stored = await self._stored_hashes(
+                    session, {r["symbol"] for r in records}, start_date, end_date
+                )
+                changed = [r for r in records if r["source_hash"] not in stored]
+                logger.info(
+                    "Corporate actions: %s fetched, %s unchanged",
+                    len(records),
+                    len(records) - len(changed),
+                )
+                if not changed:
+                    return 0
+
+                await CorporateAction.bulk_insert(
+                    session,
+                    changed,
+                    constraint="uq_corporate_actions_symbol_date_type_source",
+                    update_columns=UPDATE_COLUMNS,
+                )
                 await session.commit()
-                logger.info("Upserted %s corporate action rows", len(records))
-                return len(records)
+                logger.info("Upserted %s corporate action rows", len(changed))
+                return len(changed)
             except Exception as exc:
                 await session.rollback()
                 logger.error("Failed to store corporate actions: %s", exc)
                 return 0
 
-    def _build_update_map(self, stmt: Any) -> dict[str, Any]:
-        excluded = stmt.excluded
-        skip = {"id", "symbol", "date", "action_type", "source", "created_at"}
-        update_map = {
-            column.name: getattr(excluded, column.name)
-            for column in CorporateAction.__table__.columns
-            if column.name not in skip and column.name != "updated_at"
-        }
-        update_map["updated_at"] = excluded.created_at
-        return update_map
+    async def _stored_hashes(
+        self,
+        session: AsyncSession,
+        symbols: set[str],
+        start_date: date,
+        end_date: date,
+    ) -> set[str]:
+        """Stored source_hash values for symbols' actions in the window."""
+        stmt = select(CorporateAction.source_hash).where(
+            CorporateAction.source == self.provider_name,
+            CorporateAction.symbol.in_(symbols),
+            CorporateAction.date >= start_date,
+            CorporateAction.date <= end_date,
+            CorporateAction.source_hash.is_not(None),
+        )
+        result = await session.execute(stmt)
+        return set(result.scalars().all())
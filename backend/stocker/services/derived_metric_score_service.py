@@ -5,8 +5,7 @@ from typing import Any
 import math
 
 import pandas as pd
-from sqlalchemy import select, func
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import select
 
 from stocker.core.database import AsyncSessionLocal
 from stocker.models.derived_metric_rule_set import DerivedMetricRuleSet
@@ -20,9 +19,6 @@ from stocker.services.universe_service import UniverseService
 class DerivedMetricScoreService:
     """Compute consolidated scores for rule sets."""
 
-    _MAX_QUERY_PARAMS = 30000
-    _DEFAULT_COLUMN_OVERHEAD = 2
-
     async def compute_scores(self, as_of_date: date | None = None) -> int:
         target_date = as_of_date or date.today()
         async with AsyncSessionLocal() as session:
@@ -58,19 +54,12 @@ class DerivedMetricScoreService:
             if not rows:
                 return 0
 
-            for chunk in self._chunk_rows(rows):
-                stmt = insert(DerivedMetricScore).values(chunk)
-                stmt = stmt.on_conflict_do_update(
-                    constraint="uq_derived_metric_scores_rule_set_symbol_date",
-                    set_={
-                        "score": stmt.excluded.score,
-                        "rank": stmt.excluded.rank,
-                        "percentile": stmt.excluded.percentile,
-                        "passes_required": stmt.excluded.passes_required,
-                        "updated_at": func.now(),
-                    },
-                )
-                await session.execute(stmt)
+            await DerivedMetricScore.bulk_insert(
+                session,
+                rows,
+                constraint="uq_derived_metric_scores_rule_set_symbol_date",
+                update_columns=("score", "rank", "percentile", "passes_required"),
+            )
             await session.commit()
 
         return len(rows)
@@ -102,91 +91,96 @@ class DerivedMetricScoreService:
         symbols: list[str],
         metric_ids: list[int],
         target_date: date,
-    ) -> dict[tuple[str, int], DerivedMetricValue]:
-        stmt = select(DerivedMetricValue).where(
+    ) -> dict[int, pd.DataFrame]:
+        """Values per metric_id, as float frames (value/zscore/percentile) indexed by symbol."""
+        stmt = select(
+            DerivedMetricValue.symbol,
+            DerivedMetricValue.metric_id,
+            DerivedMetricValue.value,
+            DerivedMetricValue.zscore,
+            DerivedMetricValue.percentile,
+        ).where(
             DerivedMetricValue.as_of_date == target_date,
             DerivedMetricValue.metric_id.in_(metric_ids),
             DerivedMetricValue.symbol.in_(symbols),
         )
         result = await session.execute(stmt)
-        rows = result.scalars().all()
-        return {(row.symbol, row.metric_id): row for row in rows}
+        df = pd.DataFrame(
+            result.all(), columns=["symbol", "metric_id", "value", "zscore", "percentile"]
+        )
+        if df.empty:
+            return {}
+        df = df.set_index("symbol")
+        stats = df[["value", "zscore", "percentile"]].astype(float)
+        # Non-finite values count as missing
+        stats = stats.where(stats.abs() != math.inf)
+        return dict(tuple(stats.groupby(df["metric_id"].to_numpy())))
 
     def _score_symbols(
         self,
         symbols: list[str],
         rules: list[tuple[DerivedMetricRule, DerivedMetricDefinition]],
-        values: dict[tuple[str, int], DerivedMetricValue],
-    ) -> list[dict[str, Any]]:
-        scored = []
-        for symbol in symbols:
-            score = 0.0
-            passes_required = True
-            for rule, _definition in rules:
-                value_record = values.get((symbol, rule.metric_id))
-                selected = self._select_value(value_record, rule.normalize)
-                if selected is None:
-                    if rule.is_required:
-                        passes_required = False
-                        break
-                    continue
-
-                if not self._passes_threshold(rule, selected):
-                    if rule.is_required:
-                        passes_required = False
-                        break
-                    continue
-
-                weight = float(rule.weight or 1.0)
-                score += selected * weight
-
-            scored.append(
-                {
-                    "symbol": symbol,
-                    "score": score if passes_required else None,
-                    "passes_required": passes_required,
-                }
-            )
-        return scored
-
-    def _select_value(
-        self, record: DerivedMetricValue | None, normalize: str | None
-    ) -> float | None:
-        if record is None:
-            return None
-        if normalize == "zscore":
-            return self._to_float(record.zscore)
-        if normalize == "percentile":
-            return self._to_float(record.percentile)
-        return self._to_float(record.value)
+        values: dict[int, pd.DataFrame],
+    ) -> pd.DataFrame:
+        """
+        Evaluate the rule set for all symbols at once, one column operation
+        per rule: weighted sum of passing values; any failed required rule
+        (missing value or threshold miss) voids the score.
+        """
+        index = pd.Index(symbols)
+        score = pd.Series(0.0, index=index)
+        passes_required = pd.Series(True, index=index)
+
+        for rule, _definition in rules:
+            metric_values = values.get(rule.metric_id)
+            if metric_values is None:
+                selected = pd.Series(math.nan, index=index)
+            else:
+                column = rule.normalize if rule.normalize in ("zscore", "percentile") else "value"
+                selected = metric_values[column].reindex(index)
+
+            passed = selected.notna() & self._passes_threshold(rule, selected)
+            if rule.is_required:
+                passes_required &= passed
+            score += selected.where(passed, 0.0) * float(rule.weight or 1.0)
+
+        return pd.DataFrame(
+            {
+                "symbol": symbols,
+                "score": score.where(passes_required).to_numpy(),
+                "passes_required": passes_required.to_numpy(),
+            }
+        )
 
-    def _passes_threshold(self, rule: DerivedMetricRule, value: float) -> bool:
+    def _passes_threshold(self, rule: DerivedMetricRule, values: pd.Series) -> pd.Series:
         op = rule.operator
         low = self._to_float(rule.threshold_low)
         high = self._to_float(rule.threshold_high)
-        if op == ">":
-            return low is not None and value > low
-        if op == ">=":
-            return low is not None and value >= low
-        if op == "<":
-            return low is not None and value < low
-        if op == "<=":
-            return low is not None and value <= low
+        if op in (">", ">=", "<", "<="):
+            if low is None:
+                return pd.Series(False, index=values.index)
+            if op == ">":
+                return values > low
+            if op == ">=":
+                return values >= low
+            if op == "<":
+                return values < low
+            return values <= low
         if op == "between":
             if low is None or high is None:
-                return False
-            return low <= value <= high
-        if op == "any":
-            return True
-        return True
+                return pd.Series(False, index=values.index)
+            return (values >= low) & (values <= high)
+        # "any" and unrecognised operators always pass
+        return pd.Series(True, index=values.index)
 
     def _attach_ranks(
         self,
         rule_set_id: int,
         target_date: date,
-        scores: list[dict[str, Any]],
+        scores: pd.DataFrame,
     ) -> list[dict[str, Any]]:
-        df = pd.DataFrame(scores)
+        # rank/percentile stay NaN for symbols without a valid score
+        df = scores.assign(rank=math.nan, percentile=math.nan)
         if df.empty:
             return []
 
@@ -231,10 +225,3 @@ class DerivedMetricScoreService:
         if not math.isfinite(numeric):
             return None
         return numeric
-
-    def _chunk_rows(self, rows: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
-        if not rows:
-            return []
-        row_size = max(1, len(rows[0]) + self._DEFAULT_COLUMN_OVERHEAD)
-        batch_size = max(1, min(2000, self._MAX_QUERY_PARAMS // row_size))
-        return [rows[i : i + batch_size] for i in range(0, len(rows), batch_size)]
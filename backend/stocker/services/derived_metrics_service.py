@@ -17,6 +17,14 @@ from stocker.models.derived_metric_value import DerivedMetricValue
 from stocker.strategy.derived_metrics_engine import DerivedMetricsEngine
 from stocker.services.universe_service import UniverseService
 
+# Rows fetched per round trip when streaming daily bars
+BAR_STREAM_BATCH_SIZE = 10_000
+_BAR_COLUMNS = ("symbol", "date", "open", "high", "low", "close", "adj_close", "volume")
+# Column order of the records written by compute_and_store
+_VALUE_COLUMNS = (
+    "symbol", "as_of_date", "metric_id", "value", "zscore", "percentile", "rank", "source", "calc_version",
+)
+
 
 METRIC_DEFINITIONS: list[dict[str, Any]] = [
     {
@@ -367,9 +375,6 @@ METRIC_DEFINITIONS: list[dict[str, Any]] = [
 class DerivedMetricsService:
     """Fetch inputs, compute derived metrics, and store normalized values."""
 
-    _MAX_QUERY_PARAMS = 30000
-    _DEFAULT_COLUMN_OVERHEAD = 2
-
     def __init__(
         self,
         lookback_days: int | None = None,
@@ -422,46 +427,32 @@ class DerivedMetricsService:
             if not normalized_rows:
                 return 0
 
-            rows = []
+            # Every normalized metric_key has a definition (filtered upstream)
+            records = []
             for row in normalized_rows:
-                definition = definition_map.get(row["metric_key"])
-                if not definition:
-                    continue
-                rows.append(
-                    {
-                        "symbol": row["symbol"],
-                        "as_of_date": target_date,
-                        "metric_id": definition.id,
-                        "value": row["value"],
-                        "zscore": row["zscore"],
-                        "percentile": row["percentile"],
-                        "rank": row["rank"],
-                        "source": definition.source_table or "computed",
-                        "calc_version": self.calc_version,
-                    }
-                )
-
-            if not rows:
-                return 0
-
-            for chunk in self._chunk_rows(rows):
-                stmt = insert(DerivedMetricValue).values(chunk)
-                stmt = stmt.on_conflict_do_update(
-                    constraint="uq_derived_metric_values_symbol_date_metric",
-                    set_={
-                        "value": stmt.excluded.value,
-                        "zscore": stmt.excluded.zscore,
-                        "percentile": stmt.excluded.percentile,
-                        "rank": stmt.excluded.rank,
-                        "source": stmt.excluded.source,
-                        "calc_version": stmt.excluded.calc_version,
-                        "updated_at": func.now(),
-                    },
-                )
-                await session.execute(stmt)
+                definition = definition_map[row["metric_key"]]
+                records.append((
+                    row["symbol"],
+                    target_date,
+                    definition.id,
+                    row["value"],
+                    row["zscore"],
+                    row["percentile"],
+                    row["rank"],
+                    definition.source_table or "computed",
+                    self.calc_version,
+                ))
+
+            await DerivedMetricValue.bulk_copy(
+                session,
+                _VALUE_COLUMNS,
+                records,
+                constraint="uq_derived_metric_values_symbol_date_metric",
+                update_columns=("value", "zscore", "percentile", "rank", "source", "calc_version"),
+            )
             await session.commit()
 
-        return len(rows)
+        return len(records)
 
     async def _resolve_universe(self) -> list[str]:
         universe_service = UniverseService()
@@ -476,30 +467,28 @@ class DerivedMetricsService:
         start_date: date,
         end_date: date,
     ) -> dict[str, pd.DataFrame]:
-        stmt = select(DailyBar).where(
-            DailyBar.symbol.in_(symbols),
-            DailyBar.date >= start_date,
-            DailyBar.date <= end_date,
-        ).order_by(DailyBar.symbol.asc(), DailyBar.date.asc())
-        result = await session.execute(stmt)
-        rows = result.scalars().all()
-        if not rows:
+        # Plain column rows streamed from a server-side cursor: no ORM
+        # identity map, and memory bounded by one batch at a time
+        stmt = (
+            select(*(getattr(DailyBar, name) for name in _BAR_COLUMNS))
+            .where(
+                DailyBar.symbol.in_(symbols),
+                DailyBar.date >= start_date,
+                DailyBar.date <= end_date,
+            )
+            .order_by(DailyBar.symbol.asc(), DailyBar.date.asc())
+            .execution_options(yield_per=BAR_STREAM_BATCH_SIZE)
+        )
+        result = await session.stream(stmt)
+        frames = [
+            pd.DataFrame(batch, columns=_BAR_COLUMNS)
+            async for batch in result.partitions()
+        ]
+        if not frames:
             return {}
 
-        data = [
-            {
-                "symbol": row.symbol,
-                "date": row.date,
-                "open": float(row.open),
-                "high": float(row.high),
-                "low": float(row.low),
-                "close": float(row.close),
-                "adj_close": float(row.adj_close),
-                "volume": float(row.volume),
-            }
-            for row in rows
-        ]
-        df = pd.DataFrame(data)
+        df = pd.concat(frames, ignore_index=True)
+        df["volume"] = df["volume"].astype(float)
         df["date"] = pd.to_datetime(df["date"])
         grouped = {}
         for symbol, group in df.groupby("symbol"):
@@ -556,7 +545,7 @@ class DerivedMetricsService:
             {
                 "symbol": row.symbol,
                 "date": row.date,
-                "sentiment_score": float(row.sentiment_score),
+                "sentiment_score": row.sentiment_score,
             }
             for row in rows
             if row.symbol
@@ -643,44 +632,24 @@ class DerivedMetricsService:
         if not records:
             return []
 
+        # Cross-sectional stats for every metric in one grouped pass
         df = pd.DataFrame(records)
-        normalized_rows: list[dict[str, Any]] = []
-
-        for metric_key, group in df.groupby("metric_key"):
-            definition = definition_map[metric_key]
-            values = group["value"].astype(float)
-            mean = values.mean()
-            std = values.std(ddof=0)
-            if std == 0 or pd.isna(std):
-                zscores = pd.Series([0.0] * len(values), index=group.index)
-            else:
-                zscores = (values - mean) / std
-
-            ascending = definition.direction == "lower_is_better"
-            ranks = values.rank(ascending=ascending, method="min")
-            if len(values) == 1:
-                percentiles = pd.Series([1.0] * len(values), index=group.index)
-            else:
-                percentiles = 1 - (ranks - 1) / (len(values) - 1)
-
-            group = group.copy()
-            group["zscore"] = zscores.values
-            group["percentile"] = percentiles.values
-            group["rank"] = ranks.astype(int).values
-
-            for row in group.itertuples(index=False):
-                normalized_rows.append(
-                    {
-                        "symbol": row.symbol,
-                        "metric_key": metric_key,
-                        "value": row.value,
-                        "zscore": row.zscore,
-                        "percentile": row.percentile,
-                        "rank": int(row.rank),
-                    }
-                )
+        by_metric = df.groupby("metric_key")["value"]
+        mean = by_metric.transform("mean")
+        std = by_metric.transform("std", ddof=0)
+        count = by_metric.transform("size")
+
+        df["zscore"] = ((df["value"] - mean) / std).where((std != 0) & std.notna(), 0.0)
+
+        # Rank 1 = best: negate higher-is-better values so one ascending rank serves both
+        lower_is_better = df["metric_key"].map(
+            {key: definition.direction == "lower_is_better" for key, definition in definition_map.items()}
+        )
+        ranks = df["value"].where(lower_is_better, -df["value"]).groupby(df["metric_key"]).rank(method="min")
+        df["percentile"] = (1 - (ranks - 1) / (count - 1)).where(count > 1, 1.0)
+        df["rank"] = ranks.astype(int)
 
-        return normalized_rows
+        return df.to_dict("records")
 
     def _instrument_row_to_dict(self, row: InstrumentMetrics) -> dict[str, float | None]:
         return {
@@ -704,10 +673,3 @@ class DerivedMetricsService:
             return float(value)
         except (TypeError, ValueError):
             return None
-
-    def _chunk_rows(self, rows: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
-        if not rows:
-            return []
-        row_size = max(1, len(rows[0]) + self._DEFAULT_COLUMN_OVERHEAD)
-        batch_size = max(1, min(1000, self._MAX_QUERY_PARAMS // row_size))
-        return [rows[i : i + batch_size] for i in range(0, len(rows), batch_size)]
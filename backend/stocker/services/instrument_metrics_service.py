@@ -1,6 +1,7 @@
+import hashlib
 import logging
 from datetime import date
-from typing import Any
+from typing import Any, Iterable
 
 from sqlalchemy.dialects.postgresql import insert
 
@@ -11,6 +12,19 @@ from stocker.services.fundamentals import get_fundamentals_provider
 
 logger = logging.getLogger(__name__)
 
+# Redis cache for the latest as-of date per symbol served by /universes/metrics
+METRICS_STATUS_CACHE_PREFIX = "metrics_status:"
+METRICS_STATUS_CACHE_TTL_SEC = 30
+
+
+def metrics_status_cache_key(symbols: Iterable[str]) -> str:
+    """Build a stable cache key for a set of symbols."""
+    digest = hashlib.blake2b(
+        b"\0".join(sorted(symbol.encode() for symbol in symbols)),
+        digest_size=16,
+    ).hexdigest()
+    return METRICS_STATUS_CACHE_PREFIX + digest
+
 
 class InstrumentMetricsService:
     """Service to fetch and store investor-facing fundamentals and valuation metrics."""
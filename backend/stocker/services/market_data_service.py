@@ -1,4 +1,3 @@
-import hashlib
 import json
 from dataclasses import dataclass
 from datetime import date, timedelta
@@ -6,8 +5,8 @@ from typing import List, Optional, Tuple
 import pandas as pd
 import numpy as np
 from sqlalchemy.future import select
-from sqlalchemy.dialects.postgresql import insert
 from stocker.core.database import AsyncSessionLocal
+from stocker.models.base import row_hash
 from stocker.models.daily_bar import DailyBar
 from stocker.services.market_data import get_market_data_provider
 from stocker.core.config import settings
@@ -229,38 +228,20 @@ class MarketDataService:
         if not records:
             return 0, self.validator.get_alerts()
 
-        # 3. Store (Upsert) in batches to avoid parameter limit
-        # SQLAlchemy has a limit of ~32k parameters
-        # Each record has ~12 fields, so batch size of 1000 = 12k parameters
-        BATCH_SIZE = 1000
-        total_inserted = 0
-
+        # 3. Store (Upsert). One compiled ON CONFLICT statement is run as an
+        # executemany per chunk, so there is no per-batch SQL rendering or
+        # bind-parameter limit to work around. Index is (symbol, date).
         async with AsyncSessionLocal() as session:
             try:
-                for i in range(0, len(records), BATCH_SIZE):
-                    batch = records[i:i + BATCH_SIZE]
-
-                    # We use Postgres bulk upsert (ON CONFLICT DO UPDATE)
-                    # Index is (symbol, date)
-                    stmt = insert(DailyBar).values(batch)
-                    stmt = stmt.on_conflict_do_update(
-                        constraint="uq_prices_daily_symbol_date",
-                        set_={
-                            "open": stmt.excluded.open,
-                            "high": stmt.excluded.high,
-                            "low": stmt.excluded.low,
-                            "close": stmt.excluded.close,
-                            "adj_close": stmt.excluded.adj_close,
-                            "volume": stmt.excluded.volume,
-                            "source": stmt.excluded.source,
-                            "source_hash": stmt.excluded.source_hash,
-                            "updated_at": stmt.excluded.created_at  # roughly usable as update time
-                        }
-                    )
-
-                    await session.execute(stmt)
-                    total_inserted += len(batch)
-                    logger.info(f"Upserted batch {i // BATCH_SIZE + 1}: {len(batch)} bars (total: {total_inserted}/{len(records)})")
+                total_inserted = await DailyBar.bulk_insert(
+                    session,
+                    records,
+                    constraint="uq_prices_daily_symbol_date",
+                    update_columns=(
+                        "open", "high", "low", "close", "adj_close",
+                        "volume", "source", "source_hash",
+                    ),
+                )
 
                 await session.commit()
                 logger.info(f"Successfully upserted {total_inserted} daily bars")
@@ -306,13 +287,13 @@ class MarketDataService:
     def _prepare_record(self, row: pd.Series) -> Optional[dict]:
         """Convert DataFrame row to dictionary for DB insert."""
         try:
+            symbol = str(row['symbol'])
+
             # Create content hash for audit
-            # We strictly cast to string to ensure consistent hashing
-            raw_content = f"{row['symbol']}|{row['date']}|{row['close']}|{row['volume']}"
-            content_hash = hashlib.sha256(raw_content.encode()).hexdigest()
-            
+            content_hash = row_hash(symbol, row['date'], float(row['close']), float(row['volume']))
+
             return {
-                "symbol": str(row['symbol']),
+                "symbol": symbol,
                 "date": row['date'],
                 "open": float(row['open']),
                 "high": float(row['high']),
@@ -1,9 +1,7 @@
 import logging
 from datetime import date
-from typing import Any
 
 from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
 
 from stocker.core.config import settings
 from stocker.core.database import AsyncSessionLocal
@@ -13,6 +11,13 @@ from stocker.services.sentiment import get_sentiment_provider
 
 logger = logging.getLogger(__name__)
 
+# Columns refreshed when a sentiment row is re-ingested
+UPDATE_COLUMNS = tuple(
+    column.name
+    for column in MarketSentiment.__table__.columns
+    if column.name not in {"id", "symbol", "date", "source", "period", "window_days", "created_at", "updated_at"}
+)
+
 
 class MarketSentimentService:
     """Service to fetch and store symbol-level market sentiment."""
@@ -70,13 +75,13 @@ class MarketSentimentService:
             return 0
 
         async with AsyncSessionLocal() as session:
-            stmt = insert(MarketSentiment).values(records)
-            stmt = stmt.on_conflict_do_update(
-                constraint="uq_market_sentiment_symbol_date_source_period",
-                set_=self._build_update_map(stmt),
-            )
             try:
-                await session.execute(stmt)
+                await MarketSentiment.bulk_insert(
+                    session,
+                    records,
+                    constraint="uq_market_sentiment_symbol_date_source_period",
+                    update_columns=UPDATE_COLUMNS,
+                )
                 await session.commit()
                 logger.info("Upserted %s market sentiment rows", len(records))
                 return len(records)
@@ -128,14 +133,3 @@ class MarketSentimentService:
             seen.add(value)
             normalized.append(value)
         return normalized
-
-    def _build_update_map(self, stmt: Any) -> dict[str, Any]:
-        excluded = stmt.excluded
-        skip = {"id", "symbol", "date", "source", "period", "window_days", "created_at"}
-        update_map = {
-            column.name: getattr(excluded, column.name)
-            for column in MarketSentiment.__table__.columns
-            if column.name not in skip and column.name != "updated_at"
-        }
-        update_map["updated_at"] = excluded.created_at
-        return update_map
@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 
 from stocker.core.config import settings
+from stocker.models.base import SOURCE_HASH_BYTES
 from stocker.services.sentiment.base import SentimentProvider
 
 logger = logging.getLogger(__name__)
@@ -119,7 +120,9 @@ class GdeltSentimentProvider(SentimentProvider):
                         "positive_count": pos,
                         "neutral_count": neu,
                         "negative_count": neg,
-                        "source_hash": hashlib.sha256(response_text.encode("utf-8")).hexdigest(),
+                        "source_hash": hashlib.blake2b(
+                            response_text.encode("utf-8"), digest_size=SOURCE_HASH_BYTES
+                        ).hexdigest(),
                     }
 
             import asyncio
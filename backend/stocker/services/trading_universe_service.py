@@ -3,7 +3,6 @@ from datetime import date, timedelta
 from typing import Any, Iterable
 
 from sqlalchemy import desc, func, select
-from sqlalchemy.dialects.postgresql import insert
 
 from stocker.core.config import settings
 from stocker.core.database import AsyncSessionLocal
@@ -12,6 +11,13 @@ from stocker.models.trading_universe import TradingUniverse
 
 logger = logging.getLogger(__name__)
 
+# Columns refreshed when a snapshot row is re-ingested
+UPDATE_COLUMNS = tuple(
+    column.name
+    for column in TradingUniverse.__table__.columns
+    if column.name not in {"id", "as_of_date", "symbol", "source", "created_at", "updated_at"}
+)
+
 
 class TradingUniverseService:
     """Builds and retrieves the dynamic trading universe (legacy/suggestions)."""
@@ -44,14 +50,13 @@ class TradingUniverseService:
                 )
                 return 0
 
-            insert_stmt = insert(TradingUniverse).values(records)
-            insert_stmt = insert_stmt.on_conflict_do_update(
-                constraint="uq_trading_universe_date_symbol_source",
-                set_=self._build_update_map(insert_stmt),
-            )
-
             try:
-                await session.execute(insert_stmt)
+                await TradingUniverse.bulk_insert(
+                    session,
+                    records,
+                    constraint="uq_trading_universe_date_symbol_source",
+                    update_columns=UPDATE_COLUMNS,
+                )
                 await session.commit()
                 logger.info(
                     "Refreshed trading universe with %s symbols for %s",
@@ -83,7 +88,7 @@ class TradingUniverseService:
                 f"No dynamic universe data for {as_of_date}, "
                 f"falling back to static TRADING_UNIVERSE"
             )
-            return settings.TRADING_UNIVERSE
+            return list(settings.TRADING_UNIVERSE)
 
         logger.info(f"Retrieved {len(symbols)} symbols from dynamic universe")
         return symbols
@@ -276,14 +281,3 @@ class TradingUniverseService:
         if volume <= 0 or close <= 0:
             return None
         return close * volume
-
-    def _build_update_map(self, stmt: Any) -> dict[str, Any]:
-        excluded = stmt.excluded
-        skip = {"id", "as_of_date", "symbol", "source", "created_at"}
-        update_map = {
-            column.name: getattr(excluded, column.name)
-            for column in TradingUniverse.__table__.columns
-            if column.name not in skip and column.name != "updated_at"
-        }
-        update_map["updated_at"] = excluded.created_at
-        return update_map
@@ -169,7 +169,7 @@ class UniverseService:
                     return await self._get_dynamic_universe()
                 else:
                     logger.info("Using static TRADING_UNIVERSE fallback")
-                    return settings.TRADING_UNIVERSE
+                    return list(settings.TRADING_UNIVERSE)
 
             symbols_stmt = (
                 select(InstrumentUniverseMember.symbol)
@@ -193,7 +193,7 @@ class UniverseService:
                     return await self._get_dynamic_universe()
                 else:
                     logger.info("Using static TRADING_UNIVERSE fallback")
-                    return settings.TRADING_UNIVERSE
+                    return list(settings.TRADING_UNIVERSE)
             return symbols
 
     async def get_all_symbols(self) -> list[str]:
@@ -211,7 +211,7 @@ class UniverseService:
             symbols = [row[0] for row in result.all()]
             if symbols:
                 return symbols
-            return settings.TRADING_UNIVERSE
+            return list(settings.TRADING_UNIVERSE)
 
     async def get_global_symbols(self) -> list[str]:
         async with self._get_session() as session:
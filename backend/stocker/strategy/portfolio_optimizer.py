@@ -1,6 +1,8 @@
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import date
+import numpy as np
 import pandas as pd
 
 from stocker.strategy.signal_strategy import Signal
@@ -117,29 +119,107 @@ class PortfolioOptimizer:
         Returns:
             List of TargetExposure objects with final weights
         """
-        targets = []
-        
         # 0. Apply signal enhancement (conviction, sentiment, regime, quality)
-        enhanced_weights = {}
-        if self.config.enhancement_enabled:
-            enhancements = enhance_signals(
-                signals=signals,
-                enhancer=self.enhancer,
-                sentiment_data=sentiment_data,
-                metrics_data=instrument_metrics,
-                market_breadth=market_breadth,
-                vix_level=vix_level
+        enhanced_weights = self._enhanced_weights(
+            signals,
+            sentiment_data=sentiment_data,
+            instrument_metrics=instrument_metrics,
+            market_breadth=market_breadth,
+            vix_level=vix_level
+        )
+
+        # 1-3. Drawdown scaling, single instrument cap, gross exposure scaling
+        weights, single_capped, gross_scaler, drawdown_reason = self._sized_weights(
+            signals, enhanced_weights, current_drawdown
+        )
+
+        targets = []
+        for signal, weight, capped in zip(signals, weights.tolist(), single_capped.tolist()):
+            reason = []
+            if capped:
+                reason.append(f"Capped at {self.config.single_instrument_cap:.0%}")
+            if gross_scaler < 1.0:
+                reason.append(f"Gross exposure scaled by {gross_scaler:.2f}")
+            if drawdown_reason:
+                reason.append(drawdown_reason)
+
+            targets.append(TargetExposure(
+                symbol=signal.symbol,
+                target_exposure=weight,
+                is_capped=capped or gross_scaler < 1.0,
+                reason="; ".join(reason) if reason else None
+            ))
+
+        # 4. Apply diversification controls
+        if instrument_metadata:
+            targets = self.diversification.apply_all(
+                targets=targets,
+                metadata=instrument_metadata,
+                returns=returns,
+                current_positions=current_positions
             )
-            enhanced_weights = {
-                sym: result.enhanced_weight
-                for sym, result in enhancements.items()
-            }
-        
-        # Use enhanced weights if available, otherwise raw
-        raw_exposures = {
-            s.symbol: enhanced_weights.get(s.symbol, s.raw_weight)
-            for s in signals
-        }
+
+        return targets
+
+    def compute_target_vector(
+        self,
+        signals: List[Signal],
+        symbol_to_col: Dict[str, int],
+        current_drawdown: float = 0.0
+    ) -> np.ndarray:
+        """
+        Compute target weights as an array aligned to a fixed symbol order.
+
+        Runs the same enhancement and _sized_weights rules as compute_targets,
+        without building TargetExposure objects. Diversification controls
+        need instrument metadata and are not applied here.
+
+        Args:
+            signals: List of Signal objects with raw weights
+            symbol_to_col: symbol -> position in the returned array
+            current_drawdown: Current portfolio drawdown (0.0 to 1.0)
+
+        Returns:
+            Array of final weights, zero for symbols without a signal
+
+        Raises:
+            ValueError: If a symbol has more than one signal
+        """
+        weights = np.zeros(len(symbol_to_col))
+        if not signals:
+            return weights
+
+        sized, _, _, _ = self._sized_weights(
+            signals, self._enhanced_weights(signals), current_drawdown
+        )
+        cols = np.array([symbol_to_col[s.symbol] for s in signals], dtype=np.intp)
+        weights[cols] = sized
+        return weights
+
+    def _sized_weights(
+        self,
+        signals: List[Signal],
+        enhanced_weights: Dict[str, float],
+        current_drawdown: float
+    ) -> Tuple[np.ndarray, np.ndarray, float, Optional[str]]:
+        """
+        Drawdown scaling, single instrument cap and gross exposure scaling,
+        shared by compute_targets and compute_target_vector.
+
+        Returns:
+            (weights in signal order rounded to 4dp, mask of weights clipped
+            to the single instrument cap, gross scaler, drawdown reason)
+
+        Raises:
+            ValueError: If a symbol has more than one signal
+        """
+        symbols = [s.symbol for s in signals]
+        duplicates = sorted(sym for sym, n in Counter(symbols).items() if n > 1)
+        if duplicates:
+            raise ValueError(f"Duplicate signals for: {', '.join(duplicates)}")
+
+        # Use enhanced weight if available, otherwise raw weight
+        base = [enhanced_weights.get(s.symbol, s.raw_weight) for s in signals]
 
         # 1. Apply Drawdown Scaling
         scale_factor = 1.0
@@ -156,7 +236,7 @@ class PortfolioOptimizer:
             )
 
         # 2. Calculate gross exposure for scaling
-        current_gross = sum(abs(w) for w in raw_exposures.values()) * scale_factor
+        current_gross = sum(abs(w) for w in base) * scale_factor
 
         # If gross exposure > cap, scale down everything
         gross_scaler = 1.0
@@ -170,52 +250,46 @@ class PortfolioOptimizer:
                 scale_factor=gross_scaler
             )
 
-        # 3. Process each signal through individual caps
-        for signal in signals:
-            # Use enhanced weight if available, otherwise raw weight
-            base_weight = raw_exposures.get(signal.symbol, signal.raw_weight)
-            weight = base_weight * scale_factor
-
-            reason = []
-            is_capped = False
-
-            # Single instrument cap
-            if abs(weight) > self.config.single_instrument_cap:
-                original_weight = weight
-                weight = self.config.single_instrument_cap * (1 if weight > 0 else -1)
-                is_capped = True
-                reason.append(f"Capped at {self.config.single_instrument_cap:.0%}")
-
-                # Emit single cap metric
-                metrics.single_cap_applied(
-                    symbol=signal.symbol,
-                    weight_before=abs(original_weight),
-                    cap=self.config.single_instrument_cap
-                )
-
-            # Apply gross exposure scaler
-            if gross_scaler < 1.0:
-                weight *= gross_scaler
-                is_capped = True
-                reason.append(f"Gross exposure scaled by {gross_scaler:.2f}")
+        # 3. Single instrument cap, then gross exposure scaler
+        weights = np.array(base, dtype=np.float64) * scale_factor
+        cap = self.config.single_instrument_cap
+        capped = np.abs(weights) > cap
+        for i in np.flatnonzero(capped):
+            metrics.single_cap_applied(
+                symbol=symbols[i],
+                weight_before=abs(float(weights[i])),
+                cap=cap
+            )
+        weights = np.where(capped, np.copysign(cap, weights), weights)
 
-            if drawdown_reason:
-                reason.append(drawdown_reason)
+        if gross_scaler < 1.0:
+            weights *= gross_scaler
 
-            targets.append(TargetExposure(
-                symbol=signal.symbol,
-                target_exposure=round(weight, 4),
-                is_capped=is_capped,
-                reason="; ".join(reason) if reason else None
-            ))
+        # Python round() so .5 ties match the per-target rounding
+        weights = np.array([round(w, 4) for w in weights.tolist()], dtype=np.float64)
+        return weights, capped, gross_scaler, drawdown_reason
 
-        # 4. Apply diversification controls
-        if instrument_metadata:
-            targets = self.diversification.apply_all(
-                targets=targets,
-                metadata=instrument_metadata,
-                returns=returns,
-                current_positions=current_positions
-            )
+    def _enhanced_weights(
+        self,
+        signals: List[Signal],
+        sentiment_data: Optional[Dict[str, float]] = None,
+        instrument_metrics: Optional[Dict[str, dict]] = None,
+        market_breadth: Optional[float] = None,
+        vix_level: Optional[float] = None
+    ) -> Dict[str, float]:
+        """Enhanced weight per symbol, empty when enhancement is disabled."""
+        if not self.config.enhancement_enabled:
+            return {}
 
-        return targets
+        enhancements = enhance_signals(
+            signals=signals,
+            enhancer=self.enhancer,
+            sentiment_data=sentiment_data,
+            metrics_data=instrument_metrics,
+            market_breadth=market_breadth,
+            vix_level=vix_level
+        )
+        return {
+            sym: result.enhanced_weight
+            for sym, result in enhancements.items()
+        }
@@ -44,7 +44,7 @@ class SignalStrategy:
     def __init__(self, config: SignalConfig):
         self.config = config
 
-    def _check_donchian_confirmation(self, prices: pd.DataFrame, direction: int) -> bool:
+    def _check_donchian_confirmation(self, closes: np.ndarray, direction: int) -> bool:
         """
         Check if price confirms trend via Donchian channel breakout.
 
@@ -53,22 +53,22 @@ class SignalStrategy:
         """
         period = self.config.donchian_period
 
-        if len(prices) < period + 1:
+        if len(closes) < period + 1:
             return True  # Not enough data, assume confirmed
 
-        current = prices['adj_close'].iloc[-1]
+        current = closes[-1]
 
         # Get the high/low of the lookback period (excluding current bar)
-        lookback = prices['adj_close'].iloc[-period-1:-1]
+        lookback = closes[-period-1:-1]
 
         if direction == 1:  # Long - price at or above N-day high
             channel_high = lookback.max()
-            return current >= channel_high
+            return bool(current >= channel_high)
         else:  # Short - price at or below N-day low
             channel_low = lookback.min()
-            return current <= channel_low
+            return bool(current <= channel_low)
 
-    def _check_ma_confirmation(self, prices: pd.DataFrame, direction: int) -> bool:
+    def _check_ma_confirmation(self, closes: np.ndarray, direction: int) -> bool:
         """
         Check if moving averages confirm trend direction.
 
@@ -78,21 +78,21 @@ class SignalStrategy:
         fast_period = self.config.ma_fast_period
         slow_period = self.config.ma_slow_period
 
-        if len(prices) < slow_period:
+        if len(closes) < slow_period:
             return True  # Not enough data, assume confirmed
 
-        fast_ma = prices['adj_close'].rolling(fast_period).mean().iloc[-1]
-        slow_ma = prices['adj_close'].rolling(slow_period).mean().iloc[-1]
+        fast_ma = closes[-fast_period:].mean()
+        slow_ma = closes[-slow_period:].mean()
 
         if pd.isna(fast_ma) or pd.isna(slow_ma):
             return True  # Not enough data for MAs
 
         if direction == 1:  # Long - fast above slow
-            return fast_ma > slow_ma
+            return bool(fast_ma > slow_ma)
         else:  # Short - fast below slow
-            return fast_ma < slow_ma
+            return bool(fast_ma < slow_ma)
 
-    def _is_trend_confirmed(self, prices: pd.DataFrame, direction: int, symbol: str) -> bool:
+    def _is_trend_confirmed(self, closes: np.ndarray, direction: int, symbol: str) -> bool:
         """
         Master confirmation check.
 
@@ -106,12 +106,12 @@ class SignalStrategy:
         confirmed = False
 
         if conf_type == "donchian":
-            confirmed = self._check_donchian_confirmation(prices, direction)
+            confirmed = self._check_donchian_confirmation(closes, direction)
         elif conf_type == "dual_ma":
-            confirmed = self._check_ma_confirmation(prices, direction)
+            confirmed = self._check_ma_confirmation(closes, direction)
         elif conf_type == "both":
-            donchian_ok = self._check_donchian_confirmation(prices, direction)
-            ma_ok = self._check_ma_confirmation(prices, direction)
+            donchian_ok = self._check_donchian_confirmation(closes, direction)
+            ma_ok = self._check_ma_confirmation(closes, direction)
             confirmed = donchian_ok and ma_ok
         else:
             confirmed = True  # Unknown type, default to confirmed
@@ -128,23 +128,48 @@ class SignalStrategy:
         """
         if len(prices) < self.config.lookback_days + 1:
             raise ValueError(f"Insufficient data for {symbol}: {len(prices)} rows")
-            
+
         # Ensure sorted by date
         prices = prices.sort_index()
-        
+
+        return self.compute_signal_from_closes(
+            symbol,
+            prices['adj_close'].to_numpy(dtype=np.float64),
+            prices.index[-1].date(),
+        )
+
+    def compute_signal_from_closes(
+        self,
+        symbol: str,
+        closes: np.ndarray,
+        as_of: date,
+        returns: Optional[np.ndarray] = None,
+    ) -> Signal:
+        """
+        Compute signal from a 1-D array of adjusted closes in date order.
+
+        Used directly by the backtest engine, which keeps prices as a
+        (dates x symbols) panel and passes column slices. ``returns`` may
+        carry precomputed daily simple returns aligned to ``closes[1:]``.
+        """
+        if len(closes) < self.config.lookback_days + 1:
+            raise ValueError(f"Insufficient data for {symbol}: {len(closes)} rows")
+
         # Calculate daily returns
-        returns = prices['adj_close'].pct_change().dropna()
-        
+        if returns is None:
+            returns = closes[1:] / closes[:-1] - 1
+            returns = returns[~np.isnan(returns)]
+
         # Calculate EWMA Volatility
-        vol = self._compute_ewma_volatility(returns.values, self.config.ewma_lambda)
+        vol = self._compute_ewma_volatility(returns, self.config.ewma_lambda)
         annualized_vol = vol * np.sqrt(252)
-        
+
         # Calculate Trend (Lookback Return)
         # Using simple return: (Price_t / Price_t-N) - 1
-        current_price = prices['adj_close'].iloc[-1]
-        lookback_price = prices['adj_close'].iloc[-(self.config.lookback_days + 1)]
-        lookback_return = (current_price / lookback_price) - 1
-        
+        current_price = closes[-1]
+        lookback_price = closes[-(self.config.lookback_days + 1)]
+        lookback_return = float(current_price / lookback_price) - 1
+
         # Direction: +1 long, -1 short, 0 flat (when return is exactly zero)
         if lookback_return > 0:
             direction = 1
@@ -155,7 +180,7 @@ class SignalStrategy:
 
         # Check trend confirmation (if enabled and we have a direction)
         confirmed = (
-            self._is_trend_confirmed(prices, direction, symbol)
+            self._is_trend_confirmed(closes, direction, symbol)
             if direction != 0
             else False
         )
@@ -191,7 +216,7 @@ class SignalStrategy:
 
         return Signal(
             symbol=symbol,
-            date=prices.index[-1].date(),
+            date=as_of,
             strategy_version=self.config.strategy_name,
             direction=final_direction,
             raw_weight=raw_weight,
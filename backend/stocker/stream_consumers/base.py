@@ -9,6 +9,7 @@ from urllib.parse import urlsplit, urlunsplit
 from redis.asyncio import Redis
 from stocker.core.config import settings
 from stocker.core.metrics import metrics
+from stocker.core.redis import get_async_redis_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +55,8 @@ class BaseStreamConsumer(ABC):
         logger.info("Using database %s", _redact_db_url(settings.DATABASE_URL))
         
         # Connect metrics emitter to Redis for cross-process visibility
-        metrics.set_redis(self.redis)
+        # (bytes-mode producer client; XADD replies are never decoded)
+        metrics.set_redis(await get_async_redis_bytes())
         
         # Create consumer group if not exists
         try:
@@ -180,5 +182,7 @@ class BaseStreamConsumer(ABC):
     async def stop(self) -> None:
         """Gracefully stop the consumer."""
         self._running = False
+        # Deliver queued metrics before the loop (and its flusher) goes away
+        await metrics.flush()
         if self.redis:
             await self.redis.close()
@@ -7,9 +7,8 @@ Generates exit signals when trailing stops, ATR exits, or persistence filters tr
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import date, timedelta
-from decimal import Decimal
 
 import pandas as pd
 from sqlalchemy.future import select
@@ -38,7 +37,7 @@ class ExitConsumer(BaseStreamConsumer):
     Workflow:
     1. Listen for market-bars batch_complete events
     2. Load active positions from PositionState
-    3. Fetch recent prices for each position
+    3. Fetch recent prices for all positions in one query
     4. Evaluate exit rules (trailing stop, ATR exit, persistence)
     5. If exit triggered, publish to targets stream with target_exposure=0
     6. Update PositionState with new peak/trough prices
@@ -108,13 +107,21 @@ class ExitConsumer(BaseStreamConsumer):
             result = await session.execute(stmt)
             signals = {s.symbol: s for s in result.scalars().all()}
 
+            prices_by_symbol = await self._fetch_recent_prices(
+                session, symbols, target_date
+            )
+
             exit_count = 0
             update_count = 0
 
             for position in positions:
                 try:
                     exited, updated = await self._evaluate_position(
-                        session, position, signals.get(position.symbol), target_date
+                        session,
+                        position,
+                        signals.get(position.symbol),
+                        prices_by_symbol.get(position.symbol),
+                        target_date,
                     )
                     if exited:
                         exit_count += 1
@@ -141,38 +148,46 @@ class ExitConsumer(BaseStreamConsumer):
                 },
             )
 
+    async def _fetch_recent_prices(
+        self, session, symbols: List[str], target_date: date
+    ) -> Dict[str, pd.DataFrame]:
+        """Last 30 days of high/low/adj_close per symbol, indexed by date."""
+        lookback_start = target_date - timedelta(days=30)
+        stmt = select(
+            DailyBar.symbol, DailyBar.date, DailyBar.high, DailyBar.low, DailyBar.adj_close
+        ).where(
+            DailyBar.symbol.in_(symbols),
+            DailyBar.date >= lookback_start,
+            DailyBar.date <= target_date,
+        ).order_by(DailyBar.symbol, DailyBar.date)
+        result = await session.execute(stmt)
+        df = pd.DataFrame(
+            result.all(), columns=["symbol", "date", "high", "low", "adj_close"]
+        )
+        if df.empty:
+            return {}
+
+        # Missing (zero) high/low fall back to the close
+        df["high"] = df["high"].where(df["high"] > 0, df["adj_close"])
+        df["low"] = df["low"].where(df["low"] > 0, df["adj_close"])
+        return {
+            symbol: group.drop(columns="symbol").set_index("date")
+            for symbol, group in df.groupby("symbol", sort=False)
+        }
+
     async def _evaluate_position(
         self,
         session,
         position: PositionState,
         signal: Optional[SignalModel],
+        prices: Optional[pd.DataFrame],
         target_date: date,
     ) -> tuple[bool, bool]:
         """Evaluate exit rules for a single position."""
-        lookback_start = target_date - timedelta(days=30)
-        stmt = select(DailyBar).where(
-            DailyBar.symbol == position.symbol,
-            DailyBar.date >= lookback_start,
-            DailyBar.date <= target_date,
-        ).order_by(DailyBar.date)
-        result = await session.execute(stmt)
-        bars = result.scalars().all()
-
-        if len(bars) < 5:
+        if prices is None or len(prices) < 5:
             logger.warning(f"Insufficient data for {position.symbol}")
             return False, False
 
-        prices = pd.DataFrame([
-            {
-                "date": b.date,
-                "high": float(b.high) if b.high else float(b.adj_close),
-                "low": float(b.low) if b.low else float(b.adj_close),
-                "adj_close": float(b.adj_close),
-            }
-            for b in bars
-        ])
-        prices.set_index("date", inplace=True)
-
         new_direction = (
             int(signal.direction) if signal else int(position.direction)
         )
@@ -184,12 +199,8 @@ class ExitConsumer(BaseStreamConsumer):
             entry_price=(
                 float(position.entry_price) if position.entry_price else None
             ),
-            peak_price=(
-                float(position.peak_price) if position.peak_price else None
-            ),
-            trough_price=(
-                float(position.trough_price) if position.trough_price else None
-            ),
+            peak_price=position.peak_price or None,
+            trough_price=position.trough_price or None,
             pending_direction=(
                 int(position.pending_direction)
                 if position.pending_direction is not None
@@ -197,9 +208,7 @@ class ExitConsumer(BaseStreamConsumer):
             ),
             signal_flip_date=position.signal_flip_date,
             consecutive_flip_days=position.consecutive_flip_days or 0,
-            entry_atr=(
-                float(position.entry_atr) if position.entry_atr else None
-            ),
+            entry_atr=position.entry_atr or None,
         )
 
         should_exit, final_direction, reason = self.exit_engine.evaluate(
@@ -244,22 +253,12 @@ class ExitConsumer(BaseStreamConsumer):
         """Update PositionState in database."""
         changed = False
 
-        if updated.peak_price != (
-            float(position.peak_price) if position.peak_price else None
-        ):
-            position.peak_price = (
-                Decimal(str(updated.peak_price)) if updated.peak_price else None
-            )
+        if updated.peak_price != (position.peak_price or None):
+            position.peak_price = updated.peak_price or None
             changed = True
 
-        if updated.trough_price != (
-            float(position.trough_price) if position.trough_price else None
-        ):
-            position.trough_price = (
-                Decimal(str(updated.trough_price))
-                if updated.trough_price
-                else None
-            )
+        if updated.trough_price != (position.trough_price or None):
+            position.trough_price = updated.trough_price or None
             changed = True
 
         if new_signal_direction != int(position.direction):
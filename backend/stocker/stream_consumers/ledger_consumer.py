@@ -170,7 +170,7 @@ class LedgerConsumer(BaseStreamConsumer):
         perf.exit_date = exit_date
         perf.exit_price = Decimal(str(exit_price))
         perf.holding_days = holding_days
-        perf.realized_return = Decimal(str(realized_return))
+        perf.realized_return = realized_return
         perf.is_winner = realized_return > 0
         perf.exit_reason = exit_reason
 
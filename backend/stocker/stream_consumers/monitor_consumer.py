@@ -18,10 +18,12 @@ from typing import Dict, Any, Optional
 from datetime import date, datetime
 from decimal import Decimal
 
+import orjson
+
 from stocker.stream_consumers.base import BaseStreamConsumer
 from stocker.core.config import settings
 from stocker.core.database import AsyncSessionLocal
-from stocker.core.redis import StreamNames, get_async_redis
+from stocker.core.redis import StreamNames, UI_UPDATES_CHANNEL, get_async_redis
 from stocker.models.order import Order
 from stocker.models.portfolio_state import PortfolioState
 from sqlalchemy import select, update
@@ -243,7 +245,7 @@ class MonitorConsumer(BaseStreamConsumer):
         if not self.redis:
             return
 
-        await self.redis.publish("ui-updates", json.dumps({
+        await self.redis.publish(UI_UPDATES_CHANNEL, orjson.dumps({
             "type": "portfolio_update",
             "payload": {
                 "portfolio_id": portfolio_id,
@@ -256,7 +258,7 @@ class MonitorConsumer(BaseStreamConsumer):
                 "triggered_at": self._kill_switch_triggered_at,
                 "timestamp": datetime.utcnow().isoformat()
             }
-        }))
+        }).decode())
 
     async def _refresh_kill_switch_state(self, portfolio_id: str) -> None:
         """Sync kill switch state from Redis so manual changes reflect in UI."""
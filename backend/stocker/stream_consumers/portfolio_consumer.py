@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from typing import Dict, Any, List, Optional
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, timedelta
 
 import pandas as pd
 from sqlalchemy import func
@@ -83,7 +83,7 @@ class PortfolioConsumer(BaseStreamConsumer):
         seen_symbols = set()
         for row in result.scalars().all():
             if row.symbol not in seen_symbols:
-                sentiment_data[row.symbol] = float(row.sentiment_score)
+                sentiment_data[row.symbol] = row.sentiment_score
                 seen_symbols.add(row.symbol)
         
         if sentiment_data:
@@ -434,8 +434,6 @@ class PortfolioConsumer(BaseStreamConsumer):
         # 5. Save Targets to DB (only if changed)
         changed_targets = []
         async with AsyncSessionLocal() as session:
-            from sqlalchemy.dialects.postgresql import insert
-
             existing_targets: Dict[str, TargetModel] = {}
             if targets:
                 symbols = [t.symbol for t in targets]
@@ -453,25 +451,25 @@ class PortfolioConsumer(BaseStreamConsumer):
                 if existing and targets_match(existing, t):
                     continue
                 changed_targets.append(t)
-                stmt = insert(TargetModel).values({
-                    "portfolio_id": "main", # Single portfolio for now
-                    "date": effective_date,
-                    "symbol": t.symbol,
-                    "target_exposure": t.target_exposure,
-                    "scaling_factor": 1.0, # TODO: Track this in optimizer output
-                    "is_capped": t.is_capped,
-                    "reason": t.reason
-                })
-                stmt = stmt.on_conflict_do_update(
-                    constraint="uq_target_exposures_port_sym_date",
-                    set_={
-                        "target_exposure": stmt.excluded.target_exposure,
-                        "is_capped": stmt.excluded.is_capped,
-                        "reason": stmt.excluded.reason,
-                        "updated_at": datetime.now(timezone.utc).replace(tzinfo=None)
+
+            # One upsert for all changed targets
+            await TargetModel.bulk_insert(
+                session,
+                (
+                    {
+                        "portfolio_id": "main", # Single portfolio for now
+                        "date": effective_date,
+                        "symbol": t.symbol,
+                        "target_exposure": t.target_exposure,
+                        "scaling_factor": 1.0, # TODO: Track this in optimizer output
+                        "is_capped": t.is_capped,
+                        "reason": t.reason
                     }
-                )
-                await session.execute(stmt)
+                    for t in changed_targets
+                ),
+                constraint="uq_target_exposures_port_sym_date",
+                update_columns=("target_exposure", "is_capped", "reason"),
+            )
             if changed_targets:
                 await session.commit()
             else:
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from typing import Dict, Any
-from datetime import date, datetime, timezone
+from datetime import date
 import pandas as pd
 from sqlalchemy.future import select
 
@@ -169,30 +169,20 @@ class SignalConsumer(BaseStreamConsumer):
 
         # 3. Store in DB
         async with AsyncSessionLocal() as session:
-            # Idempotency: Try insert, ignore if exists? 
-            # Or Upsert. Let's Upsert.
-            from sqlalchemy.dialects.postgresql import insert
-            
-            stmt = insert(SignalModel).values({
-                "strategy_version": signal.strategy_version,
-                "symbol": signal.symbol,
-                "date": signal.date,
-                "lookback_return": signal.metrics["lookback_return"],
-                "ewma_vol": signal.metrics["ewma_vol"],
-                "direction": signal.direction,
-                "target_weight": signal.raw_weight
-            })
-            stmt = stmt.on_conflict_do_update(
+            await SignalModel.bulk_insert(
+                session,
+                [{
+                    "strategy_version": signal.strategy_version,
+                    "symbol": signal.symbol,
+                    "date": signal.date,
+                    "lookback_return": signal.metrics["lookback_return"],
+                    "ewma_vol": signal.metrics["ewma_vol"],
+                    "direction": signal.direction,
+                    "target_weight": signal.raw_weight
+                }],
                 constraint="uq_signals_strat_sym_date",
-                set_={
-                    "lookback_return": stmt.excluded.lookback_return,
-                    "ewma_vol": stmt.excluded.ewma_vol,
-                    "direction": stmt.excluded.direction,
-                    "target_weight": stmt.excluded.target_weight,
-                    "updated_at": datetime.now(timezone.utc).replace(tzinfo=None)
-                }
+                update_columns=("lookback_return", "ewma_vol", "direction", "target_weight"),
             )
-            await session.execute(stmt)
             await session.commit()
             logger.debug(f"Stored signal for {symbol} in database")
 
@@ -3,3 +3,4 @@ from stocker.tasks import market_data  # noqa: F401
 from stocker.tasks import market_sentiment  # noqa: F401
 from stocker.tasks import corporate_actions  # noqa: F401
 from stocker.tasks import portfolio  # noqa: F401
+from stocker.tasks import partitions  # noqa: F401
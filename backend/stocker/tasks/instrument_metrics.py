@@ -3,8 +3,12 @@ import asyncio
 import logging
 
 from stocker.core.config import settings
+from stocker.core.redis import get_redis
 from stocker.scheduler.celery_app import app
-from stocker.services.instrument_metrics_service import InstrumentMetricsService
+from stocker.services.instrument_metrics_service import (
+    METRICS_STATUS_CACHE_PREFIX,
+    InstrumentMetricsService,
+)
 from stocker.services.universe_service import UniverseService
 
 logger = logging.getLogger(__name__)
@@ -21,6 +25,7 @@ def ingest_instrument_metrics() -> dict[str, object]:
             processed,
             symbol_count,
         )
+        _invalidate_metrics_status_cache()
     else:
         logger.warning("No instrument metrics ingested")
 
@@ -41,3 +46,14 @@ async def _ingest_instrument_metrics_async() -> tuple[int, int, date]:
     processed = await service.fetch_and_store_metrics(universe, as_of_date=as_of_date)
 
     return processed, len(universe), as_of_date
+
+
+def _invalidate_metrics_status_cache() -> None:
+    """Drop cached metrics status entries so the API picks up the new as-of dates."""
+    try:
+        r = get_redis()
+        keys = list(r.scan_iter(match=f"{METRICS_STATUS_CACHE_PREFIX}*"))
+        if keys:
+            r.delete(*keys)
+    except Exception as exc:
+        logger.warning("Failed to invalidate metrics status cache: %s", exc)
@@ -0,0 +1,79 @@
+"""
+Price table partition maintenance.
+
+prices_daily is RANGE-partitioned by year and prices_intraday by month.
+Runs nightly and pre-creates the current and next partition of each table,
+so recent bars never land in the DEFAULT partition.
+"""
+import asyncio
+import logging
+from datetime import date
+
+from sqlalchemy import text
+
+from stocker.core.database import AsyncSessionLocal
+from stocker.scheduler.celery_app import app
+
+logger = logging.getLogger(__name__)
+
+
+def _next_month(day: date) -> date:
+    """First day of the month after day."""
+    if day.month == 12:
+        return date(day.year + 1, 1, 1)
+    return date(day.year, day.month + 1, 1)
+
+
+def price_partition_ddl(today: date) -> list[tuple[str, str]]:
+    """(partition name, CREATE statement) for the current and next period of each price table."""
+    statements = []
+
+    for year in (today.year, today.year + 1):
+        name = f"prices_daily_{year}"
+        statements.append((
+            name,
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF prices_daily "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')",
+        ))
+
+    start = today.replace(day=1)
+    for _ in range(2):
+        end = _next_month(start)
+        name = f"prices_intraday_{start:%Y_%m}"
+        # Bounds pinned to UTC so they do not depend on the session TimeZone
+        statements.append((
+            name,
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF prices_intraday "
+            f"FOR VALUES FROM ('{start} 00:00:00+00') TO ('{end} 00:00:00+00')",
+        ))
+        start = end
+
+    return statements
+
+
+async def _ensure_price_partitions_async(today: date) -> dict:
+    """Create any missing price partitions, one transaction each."""
+    created = []
+    failed = []
+
+    for name, ddl in price_partition_ddl(today):
+        async with AsyncSessionLocal() as session:
+            try:
+                await session.execute(text(ddl))
+                await session.commit()
+                created.append(name)
+            except Exception as e:
+                # e.g. the DEFAULT partition already holds rows for this range
+                await session.rollback()
+                logger.warning(f"Could not create partition {name}: {e}")
+                failed.append(name)
+
+    return {"status": "ok", "ensured": created, "failed": failed}
+
+
+@app.task(name="stocker.tasks.partitions.ensure_price_partitions")
+def ensure_price_partitions() -> dict:
+    """Pre-create upcoming yearly (daily bars) and monthly (intraday bars) partitions."""
+    result = asyncio.run(_ensure_price_partitions_async(date.today()))
+    logger.info(f"Price partition maintenance complete: {result}")
+    return result
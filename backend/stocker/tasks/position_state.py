@@ -1,9 +1,8 @@
 import asyncio
 import logging
-from datetime import date, datetime
+from datetime import date
 
 from sqlalchemy.future import select
-from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from stocker.scheduler.celery_app import app
 from stocker.core.database import AsyncSessionLocal
@@ -12,6 +11,19 @@ from stocker.models.position_state import PositionState
 
 logger = logging.getLogger(__name__)
 
+# Everything but the conflict key is reset from the holding
+SYNC_UPDATE_COLUMNS = (
+    "direction",
+    "entry_date",
+    "entry_price",
+    "peak_price",
+    "trough_price",
+    "entry_atr",
+    "pending_direction",
+    "signal_flip_date",
+    "consecutive_flip_days",
+)
+
 
 async def _sync_position_states_async(portfolio_id: str) -> dict:
     async with AsyncSessionLocal() as session:
@@ -50,21 +62,18 @@ async def _sync_position_states_async(portfolio_id: str) -> dict:
             position.signal_flip_date = None
             position.consecutive_flip_days = 0
 
-        synced = 0
+        rows = []
         for holding in holdings_by_symbol.values():
             qty = float(holding.qty)
             if qty == 0:
                 continue
 
-            direction = 1 if qty > 0 else -1
-            entry_date = holding.date or date.today()
             entry_price = float(holding.cost_basis)
-
-            stmt = pg_insert(PositionState).values({
+            rows.append({
                 "portfolio_id": portfolio_id,
                 "symbol": holding.symbol,
-                "direction": direction,
-                "entry_date": entry_date,
+                "direction": 1 if qty > 0 else -1,
+                "entry_date": holding.date or date.today(),
                 "entry_price": entry_price,
                 "peak_price": entry_price,
                 "trough_price": entry_price,
@@ -72,25 +81,15 @@ async def _sync_position_states_async(portfolio_id: str) -> dict:
                 "pending_direction": None,
                 "signal_flip_date": None,
                 "consecutive_flip_days": 0,
-                "updated_at": datetime.utcnow(),
             })
-            stmt = stmt.on_conflict_do_update(
-                constraint="uq_position_states_port_sym",
-                set_={
-                    "direction": stmt.excluded.direction,
-                    "entry_date": stmt.excluded.entry_date,
-                    "entry_price": stmt.excluded.entry_price,
-                    "peak_price": stmt.excluded.peak_price,
-                    "trough_price": stmt.excluded.trough_price,
-                    "entry_atr": stmt.excluded.entry_atr,
-                    "pending_direction": None,
-                    "signal_flip_date": None,
-                    "consecutive_flip_days": 0,
-                    "updated_at": stmt.excluded.updated_at,
-                },
-            )
-            await session.execute(stmt)
-            synced += 1
+
+        # One upsert for every active symbol
+        synced = await PositionState.bulk_insert(
+            session,
+            rows,
+            constraint="uq_position_states_port_sym",
+            update_columns=SYNC_UPDATE_COLUMNS,
+        )
 
         await session.commit()
 
@@ -0,0 +1,62 @@
+import pytest
+
+from stocker.services.config_service import (
+    TRADING_PARAMS,
+    TRADING_PARAMS_BY_KEY,
+    ConfigService,
+    ParamMeta,
+)
+
+
+@pytest.fixture
+def service() -> ConfigService:
+    return ConfigService()
+
+
+def test_params_by_key_covers_trading_params():
+    assert TRADING_PARAMS_BY_KEY.keys() == TRADING_PARAMS.keys()
+    meta = TRADING_PARAMS_BY_KEY["CONFIRMATION_TYPE"]
+    assert meta.options == ("donchian", "dual_ma", "both")
+    assert TRADING_PARAMS_BY_KEY["LOOKBACK_DAYS"].options is None
+
+
+@pytest.mark.parametrize(
+    ("param", "value"),
+    [
+        (ParamMeta("N", "int", "test", "", min=1, max=10), "1"),
+        (ParamMeta("N", "int", "test", "", min=1, max=10), "10"),
+        (ParamMeta("X", "float", "test", "", min=0.0, max=1.0), "0.5"),
+        (ParamMeta("B", "bool", "test", ""), "Yes"),
+        (ParamMeta("S", "str", "test", "", options=("a", "b")), "b"),
+        (ParamMeta("S", "str", "test", ""), "anything"),
+    ],
+)
+def test_valid_values(service, param, value):
+    service._validate_value(value, param)
+
+
+@pytest.mark.parametrize(
+    ("param", "value", "message"),
+    [
+        (ParamMeta("N", "int", "test", "", min=1, max=10), "0", "N must be >= 1"),
+        (ParamMeta("N", "int", "test", "", min=1, max=10), "11", "N must be <= 10"),
+        (ParamMeta("N", "int", "test", ""), "1.5", "invalid literal"),
+        (ParamMeta("X", "float", "test", "", min=0.0, max=1.0), "1.5", "X must be <= 1.0"),
+        (ParamMeta("X", "float", "test", ""), "abc", "could not convert"),
+        (ParamMeta("B", "bool", "test", ""), "maybe", "B must be a boolean value"),
+        (
+            ParamMeta("S", "str", "test", "", options=("a", "b")),
+            "c",
+            r"S must be one of: \['a', 'b'\]",
+        ),
+    ],
+)
+def test_invalid_values(service, param, value, message):
+    with pytest.raises(ValueError, match=message):
+        service._validate_value(value, param)
+
+
+def test_seeded_params_validate(service):
+    service._validate_value("both", TRADING_PARAMS_BY_KEY["CONFIRMATION_TYPE"])
+    with pytest.raises(ValueError, match="CONFIRMATION_TYPE must be one of"):
+        service._validate_value("breakout", TRADING_PARAMS_BY_KEY["CONFIRMATION_TYPE"])
@@ -0,0 +1,130 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stocker.services.corporate_actions import yfinance_provider
+from stocker.services.corporate_actions.yfinance_provider import (
+    YFinanceCorporateActionsProvider,
+)
+
+START, END = date(2024, 3, 4), date(2024, 3, 8)
+# One bar before the window, as yfinance can return around the requested range
+INDEX = pd.DatetimeIndex(pd.bdate_range("2024-03-01", "2024-03-08"), name="Date")
+
+
+def _frame(dividends=None, splits=None, failed: bool = False) -> pd.DataFrame:
+    n = len(INDEX)
+    if failed:
+        # How yf.download leaves a ticker whose request errored
+        return pd.DataFrame(
+            np.nan, index=INDEX, columns=["Close", "Dividends", "Stock Splits"]
+        )
+    return pd.DataFrame(
+        {
+            "Close": np.linspace(100, 101, n),
+            "Dividends": dividends if dividends is not None else np.zeros(n),
+            "Stock Splits": splits if splits is not None else np.zeros(n),
+        },
+        index=INDEX,
+    )
+
+
+def _multi(frames: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """group_by="ticker" layout: (ticker, field) column MultiIndex."""
+    return pd.concat(frames, axis=1)
+
+
+def _actions(records):
+    return sorted((r["symbol"], r["date"], r["action_type"], r["value"]) for r in records)
+
+
+@pytest.fixture
+def download(monkeypatch):
+    """Replace yf.download with responses keyed on the requested tickers."""
+    calls: list[list[str]] = []
+    responses: list = []
+
+    def fake_download(tickers, **kwargs):
+        calls.append(list(tickers))
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response(list(tickers)) if callable(response) else response
+
+    monkeypatch.setattr(yfinance_provider.yf, "download", fake_download)
+    return calls, responses
+
+
+def _provider(max_retries: int = 3) -> YFinanceCorporateActionsProvider:
+    return YFinanceCorporateActionsProvider(max_retries=max_retries, backoff_sec=0)
+
+
+@pytest.mark.parametrize("multi_level", [True, False])
+def test_single_ticker_frame(download, multi_level):
+    calls, responses = download
+    frame = _frame(
+        dividends=[0.5, 0, 0.25, 0, 0, 0],
+        splits=[0, 0, 0, 2.0, 0, 0],
+    )
+    responses.append(_multi({"AAA": frame}) if multi_level else frame)
+
+    records = _provider().fetch_corporate_actions(["AAA"], START, END)
+
+    # 2024-03-01 dividend is outside the window; zero values are not actions
+    assert _actions(records) == [
+        ("AAA", date(2024, 3, 5), "DIVIDEND", 0.25),
+        ("AAA", date(2024, 3, 6), "SPLIT", 2.0),
+    ]
+    assert calls == [["AAA"]]
+    assert all(r["source"] == "yfinance" and r["source_hash"] for r in records)
+
+
+def test_multi_ticker_frame(download):
+    calls, responses = download
+    responses.append(_multi({
+        "AAA": _frame(dividends=[0, 0, 0, 0, 0.3, 0]),
+        "BBB": _frame(),
+        "CCC": _frame(splits=[0, 0, 0, 0, 0, 4.0]),
+    }))
+
+    records = _provider().fetch_corporate_actions(["AAA", "BBB", "CCC"], START, END)
+
+    assert _actions(records) == [
+        ("AAA", date(2024, 3, 7), "DIVIDEND", 0.3),
+        ("CCC", date(2024, 3, 8), "SPLIT", 4.0),
+    ]
+    assert calls == [["AAA", "BBB", "CCC"]]
+
+
+def test_failed_tickers_are_retried_alone(download):
+    calls, responses = download
+    responses.append(_multi({
+        "AAA": _frame(dividends=[0, 0.1, 0, 0, 0, 0]),
+        "BBB": _frame(failed=True),
+    }))
+    responses.append(_multi({"BBB": _frame(dividends=[0, 0, 0.2, 0, 0, 0])}))
+
+    records = _provider().fetch_corporate_actions(["AAA", "BBB"], START, END)
+
+    assert _actions(records) == [
+        ("AAA", date(2024, 3, 4), "DIVIDEND", 0.1),
+        ("BBB", date(2024, 3, 5), "DIVIDEND", 0.2),
+    ]
+    assert calls == [["AAA", "BBB"], ["BBB"]]
+
+
+def test_tickers_still_failing_are_logged(download, caplog):
+    calls, responses = download
+    responses.append(RuntimeError("rate limited"))
+    responses.extend(
+        lambda tickers: _multi({t: _frame(failed=t == "BBB") for t in tickers})
+        for _ in range(2)
+    )
+
+    records = _provider(max_retries=3).fetch_corporate_actions(["AAA", "BBB"], START, END)
+
+    assert records == []
+    assert calls == [["AAA", "BBB"], ["AAA", "BBB"], ["BBB"]]
+    assert "no data for 1 symbols after 3 attempts: BBB" in caplog.text
@@ -0,0 +1,86 @@
+import time
+
+import pytest
+
+from stocker.core.metrics import MetricEvent, MetricsEmitter
+
+HOUR_NS = 3600 * 1_000_000_000
+
+
+def _event(age_hours: float, category: str, event_type: str, value: float = 1.0) -> MetricEvent:
+    return MetricEvent(
+        time.time_ns() - int(age_hours * HOUR_NS), category, event_type, "AAA", "main", value
+    )
+
+
+def _expected_summary(events: list[MetricEvent], hours: int) -> dict:
+    """Brute-force recount of the events inside the window."""
+    cutoff_ns = time.time_ns() - hours * HOUR_NS
+    recent = [e for e in events if e.timestamp_ns >= cutoff_ns]
+    by_event: dict[str, int] = {}
+    for e in recent:
+        key = f"{e.category}/{e.event_type}"
+        by_event[key] = by_event.get(key, 0) + 1
+    checks = [e for e in recent if e.event_type == "confirmation_check"]
+    return {
+        "total_events": len(recent),
+        "by_event": by_event,
+        "confirmation_rate": (
+            sum(e.value == 1.0 for e in checks) / len(checks) if checks else None
+        ),
+    }
+
+
+def _assert_summary(emitter: MetricsEmitter, events: list[MetricEvent], hours: int) -> None:
+    summary = emitter.get_summary(hours=hours)
+    expected = _expected_summary(events, hours)
+    assert summary["total_events"] == expected["total_events"]
+    assert summary["by_event"] == expected["by_event"]
+    assert summary["confirmation_rate"] == expected["confirmation_rate"]
+
+
+def test_running_counters_track_emits():
+    emitter = MetricsEmitter(buffer_size=100)
+    emitter.signal_confirmation("AAA", True, "donchian", 1)
+    emitter.signal_confirmation("BBB", False, "donchian", -1)
+    emitter.signal_confirmation("CCC", True, "dual_ma", 1)
+    emitter.order_created("AAA", "buy", 10, 1000.0)
+
+    summary = emitter.get_summary(hours=24)
+    assert summary["total_events"] == 4
+    assert summary["by_category"] == {"signal": 3, "order": 1}
+    assert summary["by_event"]["signal/confirmation_check"] == 3
+    assert summary["orders_created"] == 1
+    assert summary["confirmation_rate"] == pytest.approx(2 / 3)
+
+
+def test_eviction_keeps_counters_in_step():
+    emitter = MetricsEmitter(buffer_size=5)
+    events = [
+        _event(0, "signal", "confirmation_check", value=float(i % 2))
+        for i in range(4)
+    ] + [_event(0, "exit", "trailing_stop_triggered") for _ in range(4)]
+    for event in events:
+        emitter._append(event)
+
+    # Only the newest buffer_size events remain counted
+    _assert_summary(emitter, events[-5:], hours=24)
+    assert emitter.get_summary(hours=24)["by_category"] == {"signal": 1, "exit": 4}
+
+    assert emitter.clear_buffer() == 5
+    assert emitter.get_summary(hours=24)["total_events"] == 0
+    assert emitter.get_summary(hours=24)["by_category"] == {}
+
+
+@pytest.mark.parametrize("hours", [1, 6, 24, 72])
+def test_summary_window_bisects_buffer(hours):
+    emitter = MetricsEmitter(buffer_size=1000)
+    events = []
+    # Oldest first, as emit appends them
+    for age in (48, 30, 25, 20, 12, 5, 2, 0.5, 0):
+        events.append(_event(age, "signal", "confirmation_check", value=float(age < 10)))
+        events.append(_event(age, "order", "created"))
+    for event in events:
+        emitter._append(event)
+
+    _assert_summary(emitter, events, hours)
@@ -0,0 +1,66 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from stocker.strategy.portfolio_optimizer import PortfolioOptimizer, RiskConfig
+from stocker.strategy.signal_strategy import Signal
+
+
+def _signals(rng: np.random.Generator, symbols: list[str]) -> list[Signal]:
+    signals = []
+    for symbol in symbols:
+        direction = int(rng.choice([-1, 0, 1]))
+        signals.append(Signal(
+            symbol=symbol,
+            date=date(2024, 6, 3),
+            metrics={
+                "lookback_return": float(rng.normal(0, 0.1)),
+                "ewma_vol": float(rng.uniform(0.05, 0.6)),
+            },
+            raw_weight=direction * float(rng.uniform(0.0, 1.2)),
+            direction=direction,
+            strategy_version="test",
+        ))
+    return signals
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("drawdown", [0.0, 0.15])
+@pytest.mark.parametrize("enhancement_enabled", [False, True])
+def test_target_vector_matches_compute_targets(seed, drawdown, enhancement_enabled):
+    rng = np.random.default_rng(seed)
+    universe = [f"S{i:02d}" for i in range(12)]
+    # Leave some universe symbols without a signal
+    signals = _signals(rng, list(rng.permutation(universe)[:9]))
+    optimizer = PortfolioOptimizer(RiskConfig(enhancement_enabled=enhancement_enabled))
+    symbol_to_col = {symbol: col for col, symbol in enumerate(universe)}
+
+    vector = optimizer.compute_target_vector(signals, symbol_to_col, current_drawdown=drawdown)
+
+    expected = np.zeros(len(universe))
+    for target in optimizer.compute_targets(signals, current_drawdown=drawdown):
+        expected[symbol_to_col[target.symbol]] = target.target_exposure
+    np.testing.assert_allclose(vector, expected, rtol=0, atol=1e-12)
+
+
+def test_target_vector_applies_caps():
+    rng = np.random.default_rng(0)
+    signals = _signals(rng, ["A", "B", "C", "D"])
+    for signal in signals:
+        signal.raw_weight = 1.0
+        signal.direction = 1
+    config = RiskConfig(single_instrument_cap=0.35, gross_exposure_cap=1.0)
+    optimizer = PortfolioOptimizer(config)
+
+    vector = optimizer.compute_target_vector(signals, {"A": 0, "B": 1, "C": 2, "D": 3})
+
+    # Gross scaler comes from the uncapped gross (4.0), then applies to capped weights
+    np.testing.assert_allclose(vector, np.full(4, round(0.35 * 1.0 / 4.0, 4)))
+
+
+def test_target_vector_without_signals():
+    optimizer = PortfolioOptimizer(RiskConfig())
+    np.testing.assert_array_equal(
+        optimizer.compute_target_vector([], {"A": 0, "B": 1}), np.zeros(2)
+    )
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from stocker.strategy.signal_strategy import SignalConfig, SignalStrategy
+
+
+def _prices(seed: int, n: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.cumprod(1 + rng.normal(0.0003, 0.012, n))
+    index = pd.bdate_range("2023-01-02", periods=n)
+    # Shuffled rows: compute_signal sorts by date itself
+    return pd.DataFrame({"adj_close": closes}, index=index).sample(frac=1, random_state=seed)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("confirmation_type", [None, "donchian", "dual_ma", "both"])
+def test_closes_path_matches_dataframe_path(seed, confirmation_type):
+    config = SignalConfig(
+        confirmation_enabled=confirmation_type is not None,
+        confirmation_type=confirmation_type or "donchian",
+    )
+    strategy = SignalStrategy(config)
+    prices = _prices(seed)
+    ordered = prices.sort_index()
+    closes = ordered["adj_close"].to_numpy()
+    as_of = ordered.index[-1].date()
+
+    expected = strategy.compute_signal("AAA", prices)
+    from_closes = strategy.compute_signal_from_closes("AAA", closes, as_of)
+    with_returns = strategy.compute_signal_from_closes(
+        "AAA", closes, as_of, returns=closes[1:] / closes[:-1] - 1
+    )
+
+    assert from_closes == expected
+    assert with_returns == expected
+
+
+def test_insufficient_history_raises():
+    strategy = SignalStrategy(SignalConfig(lookback_days=126))
+    prices = _prices(0, n=126)
+
+    with pytest.raises(ValueError, match="Insufficient data"):
+        strategy.compute_signal("AAA", prices)
+    with pytest.raises(ValueError, match="Insufficient data"):
+        strategy.compute_signal_from_closes(
+            "AAA", prices["adj_close"].to_numpy(), prices.index[-1].date()
+        )
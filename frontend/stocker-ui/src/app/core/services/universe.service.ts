@@ -1,6 +1,6 @@
 import { Injectable } from '@angular/core';
 import { HttpClient } from '@angular/common/http';
-import { Observable } from 'rxjs';
+import { EMPTY, Observable, expand, reduce } from 'rxjs';
 
 export interface Universe {
   id: number;
@@ -12,6 +12,7 @@ export interface Universe {
 
 export interface UniverseDetail extends Universe {
   members: string[];
+  member_total: number;
 }
 
 export interface StrategyUniverse {
@@ -38,8 +39,21 @@ export class UniverseService {
     return this.http.get<Universe[]>(`${this.baseUrl}?include_deleted=${includeDeleted}`);
   }
 
-  get(universeId: number): Observable<UniverseDetail> {
-    return this.http.get<UniverseDetail>(`${this.baseUrl}/${universeId}`);
+  get(universeId: number, limit = 500, offset = 0): Observable<UniverseDetail> {
+    return this.http.get<UniverseDetail>(`${this.baseUrl}/${universeId}?limit=${limit}&offset=${offset}`);
+  }
+
+  /** Detail with every member, requested page by page until member_total is reached. */
+  getWithAllMembers(universeId: number, pageSize = 5000): Observable<UniverseDetail> {
+    return this.get(universeId, pageSize, 0).pipe(
+      expand((page, index) => {
+        const fetched = (index + 1) * pageSize;
+        return page.members.length === pageSize && fetched < page.member_total
+          ? this.get(universeId, pageSize, fetched)
+          : EMPTY;
+      }),
+      reduce((detail, page) => ({ ...detail, members: detail.members.concat(page.members) })),
+    );
   }
 
   create(payload: { name: string; description?: string; is_global?: boolean }): Observable<Universe> {
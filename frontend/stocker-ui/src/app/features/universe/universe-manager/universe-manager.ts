@@ -56,6 +56,7 @@ export class UniverseManager implements OnInit {
   strategyId = 'main_strategy';
 
   members: string[] = [];
+  memberTotal = 0;
   filteredMembers: string[] = [];
   selectedMembers = new Set<string>();
   memberFilter = '';
@@ -118,13 +119,15 @@ export class UniverseManager implements OnInit {
     this.instrumentNames = {};
     this.metrics = {};
     this.members = [];
+    this.memberTotal = 0;
     this.filteredMembers = [];
     this.selectedMembers.clear();
     this.memberFilter = '';
 
-    this.universeService.get(this.selectedUniverseId).subscribe({
+    this.universeService.getWithAllMembers(this.selectedUniverseId).subscribe({
       next: (detail: UniverseDetail) => {
         this.members = detail.members || [];
+        this.memberTotal = detail.member_total ?? this.members.length;
         this.filteredMembers = [...this.members];
         this.loading = false;
         this.loadMetrics();
@@ -262,6 +265,7 @@ export class UniverseManager implements OnInit {
     this.universeService.removeMember(this.selectedUniverseId, symbol).subscribe({
       next: () => {
         this.members = this.members.filter((s) => s !== symbol);
+        this.memberTotal = Math.max(0, this.memberTotal - 1);
         this.onFilterChange();
         this.selectedMembers.delete(symbol);
         this.cdr.detectChanges();